@@ -1,6 +1,55 @@
 """Entry point for the application."""
 
-from .tray_app import main
+import argparse
+import sys
+from pathlib import Path
+
+
+def main(argv=None) -> int:
+    """
+    Start the tray app, or hand the command to the instance already running.
+
+    The single-instance check runs before the GUI modules are imported, so
+    a second launch exits within milliseconds. Subcommands (parse, add,
+    import, bench) run in cli without starting or contacting the GUI.
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    from .cli import COMMANDS
+    if argv and argv[0] in COMMANDS:
+        from .cli import run
+        return run(argv)
+
+    parser = argparse.ArgumentParser(prog='calendar-to-google',
+                                     description="System tray app to add clipboard text to Google Calendar",
+                                     epilog=f"subcommands: {', '.join(COMMANDS)} (see <command> --help)")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--add-clipboard', action='store_true',
+                       help="open the add dialog for the current clipboard")
+    group.add_argument('--import', dest='import_path', type=Path, metavar='FILE',
+                       help="import the events in a text or .ics file")
+    args = parser.parse_args(argv)
+
+    if args.add_clipboard:
+        command = {'command': 'add_clipboard'}
+    elif args.import_path:
+        command = {'command': 'import', 'path': str(args.import_path.resolve())}
+    else:
+        command = {'command': 'show'}
+
+    from .single_instance import InstanceLock, send_command
+    lock = InstanceLock()
+    if not lock.acquire():
+        reply = send_command(command)
+        if reply is None:
+            print("Calendar to Google is already running but did not respond.")
+            return 1
+        print("Calendar to Google is already running; command sent.")
+        return 0
+
+    from .tray_app import main as run_tray
+    run_tray(instance=lock, command=command if command['command'] != 'show' else None)
+    return 0
+
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
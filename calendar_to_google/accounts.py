@@ -0,0 +1,93 @@
+"""Pool of per-account Calendar clients with idle eviction."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from .config import DEFAULT_ACCOUNT, list_accounts
+from .date_parser import ParsedEvent
+from .google_calendar import GoogleCalendarClient
+from .metrics import metrics
+
+# Release an account's service after this many idle seconds
+IDLE_TIMEOUT = 10 * 60
+# Accounts inserting at the same time
+MAX_CONCURRENT_ACCOUNTS = 4
+
+
+class AccountPool:
+    """
+    One GoogleCalendarClient per named account, created on first use.
+
+    A client's service (discovery document, credentials, HTTP connection)
+    is built lazily and released again once the account has been idle for
+    `idle_timeout`, so unused accounts cost only a small client object.
+    Work for different accounts runs concurrently on a shared executor;
+    each client serializes its own calls.
+    """
+
+    def __init__(self, idle_timeout: float = IDLE_TIMEOUT, max_workers: int = MAX_CONCURRENT_ACCOUNTS):
+        """
+        Initialize pool.
+
+        Args:
+            idle_timeout: Seconds of inactivity before an account's service is released
+            max_workers: Accounts that can insert concurrently
+        """
+        self.idle_timeout = idle_timeout
+        self._clients: dict[str, GoogleCalendarClient] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="account")
+
+    @staticmethod
+    def accounts() -> list[str]:
+        """Names of all configured account profiles."""
+        return list_accounts()
+
+    def get(self, account: str = DEFAULT_ACCOUNT) -> GoogleCalendarClient:
+        """Return the client for `account`, creating it if needed."""
+        self.evict_idle()
+        with self._lock:
+            client = self._clients.get(account)
+            if client is None:
+                client = self._clients[account] = GoogleCalendarClient(account)
+            return client
+
+    def evict_idle(self) -> int:
+        """Release services of accounts idle longer than idle_timeout; returns how many."""
+        now = time.monotonic()
+        with self._lock:
+            idle = [c for c in self._clients.values()
+                    if c.loaded and now - c.last_used > self.idle_timeout]
+        for client in idle:
+            client.release()
+            metrics.incr('accounts.evicted')
+        return len(idle)
+
+    def add_events(self, groups: dict[tuple[str, str], list[ParsedEvent]]) -> int:
+        """
+        Insert events grouped by (account, calendar ID), accounts in parallel.
+
+        Returns:
+            Number of events added
+        """
+        futures = [
+            self._executor.submit(self.get(account).add_events, events, calendar_id)
+            for (account, calendar_id), events in groups.items()
+        ]
+        return sum(1 for future in futures for url in future.result() if url)
+
+    def shutdown(self):
+        """Release every client and stop the executor."""
+        self._executor.shutdown(wait=False)
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.release()
+
+    def loaded(self) -> list[str]:
+        """Accounts whose service is currently built (for status display)."""
+        with self._lock:
+            return [name for name, client in self._clients.items() if client.loaded]
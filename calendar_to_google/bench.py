@@ -0,0 +1,649 @@
+"""Built-in benchmarks (run with: python -m calendar_to_google.bench [name ...])."""
+
+import argparse
+import threading
+import time
+from datetime import datetime
+from typing import Callable
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def bench_event_bus(events: int = 20000, producers: int = 4, rate: float = 10000.0) -> dict:
+    """
+    Fire synthetic clipboard events from several threads through EventBus.
+
+    Producers together post `rate` events per second (0 = one burst).
+
+    A simulated UI thread drains the bus at the normal tick rate and owns
+    all mutable state; the result checks that no event was lost or run
+    twice and reports the post-to-run latency.
+    """
+    from .event_bus import EventBus
+
+    bus = EventBus()
+    state = {'handled': 0, 'ui_threads': set()}
+    latencies: list[float] = []
+    stop = threading.Event()
+
+    def handle(posted: float):
+        state['handled'] += 1
+        state['ui_threads'].add(threading.get_ident())
+        latencies.append(time.perf_counter() - posted)
+
+    def ui_loop():
+        while not stop.is_set() or state['handled'] < events:
+            bus.drain()
+            time.sleep(bus.tick_ms / 1000)
+
+    def producer(count: int):
+        interval = producers / rate if rate else 0.0
+        start = time.perf_counter()
+        for i in range(count):
+            if interval:
+                delay = start + i * interval - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            bus.post(handle, time.perf_counter())
+            bus.post_latest('icon', lambda: None)
+
+    ui = threading.Thread(target=ui_loop, name="ui")
+    ui.start()
+    started = time.perf_counter()
+    workers = [
+        threading.Thread(target=producer, args=(events // producers,))
+        for _ in range(producers)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    stop.set()
+    ui.join()
+    elapsed = time.perf_counter() - started
+    bus.shutdown()
+
+    return {
+        'events': events,
+        'handled': state['handled'],
+        'ui_threads': len(state['ui_threads']),
+        'seconds': round(elapsed, 3),
+        'latency_p50_ms': round(_percentile(latencies, 0.5) * 1000, 2),
+        'latency_p99_ms': round(_percentile(latencies, 0.99) * 1000, 2),
+        'latency_max_ms': round(max(latencies) * 1000, 2),
+    }
+
+
+# Mixed-locale sample texts shared by the parser benchmarks
+PARSER_CORPUS = [
+    '明日 14:00 会議',
+    '来週の金曜日 午後3時 打ち合わせ',
+    '2024年12月25日 クリスマスパーティー',
+    '12/25 忘年会の会場を予約する',
+    'next Friday 2:30pm lunch with the team',
+    'Dec 25 holiday party at the office',
+    '下周三 下午3点 开会',
+    '다음주 금요일 오후 3시 회의',
+    'Please review the attached document and send comments by end of week.',
+    '本件について、ご確認のほどよろしくお願いいたします。',
+]
+
+
+def _time_per_call(fn: Callable[[], object], repeat: int, rounds: int = 5) -> float:
+    """Return the mean seconds per call over `repeat` calls (best of `rounds`)."""
+    best = float('inf')
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        best = min(best, (time.perf_counter() - started) / repeat)
+    return best
+
+
+def bench_locales(repeat: int = 500) -> dict:
+    """
+    Scan cost as locales are added.
+
+    Each step adds one locale grammar; because all keywords and patterns are
+    merged into one compiled matcher per kind, the per-text scan cost should
+    stay roughly flat instead of growing with the number of locales.
+    """
+    from .date_parser import DateParser
+    from .locales import registered_locales
+
+    text = ' '.join(PARSER_CORPUS)
+    results = {}
+    names = registered_locales()
+    for count in range(1, len(names) + 1):
+        subset = names[:count]
+        parser = DateParser(locales=subset)
+        grammar = parser.grammar
+        scan = _time_per_call(lambda: (
+            grammar.find_keywords(text), grammar.find_dates(text, datetime.now()), grammar.find_times(text)
+        ), repeat)
+        parse = _time_per_call(lambda: [parser.parse(t) for t in PARSER_CORPUS], max(1, repeat // 10))
+        results['+'.join(subset)] = {
+            'keywords': len(grammar.keywords),
+            'scan_us': round(scan * 1e6, 1),
+            'parse_corpus_us': round(parse * 1e6, 1),
+        }
+    return results
+
+
+def _naive_keyword_scan(keywords: list[str], text: str) -> list[tuple[int, str]]:
+    """The old approach: one substring scan per keyword."""
+    hits = []
+    for keyword in keywords:
+        start = text.find(keyword)
+        while start >= 0:
+            hits.append((start, keyword))
+            start = text.find(keyword, start + 1)
+    return hits
+
+
+def bench_keywords(sizes: tuple[int, ...] = (1_000, 10_000, 100_000), repeat: int = 5) -> dict:
+    """
+    Keyword automaton vs. per-keyword substring scans on long texts.
+
+    The automaton is a single pass over the text whatever the number of
+    keywords; the naive scan costs one pass per keyword.
+    """
+    from .locales import compile_grammar
+
+    grammar = compile_grammar()
+    index = grammar.keyword_index
+    keywords = list(index.keywords)
+    base = ' '.join(PARSER_CORPUS)
+    results = {}
+    for size in sizes:
+        text = (base * (size // len(base) + 1))[:size]
+        automaton = _time_per_call(lambda: index.find(text), repeat)
+        naive = _time_per_call(lambda: _naive_keyword_scan(keywords, text), repeat)
+        results[f'{size}_chars'] = {
+            'hits': len(index.find(text)),
+            'automaton_ms': round(automaton * 1e3, 2),
+            'naive_ms': round(naive * 1e3, 2),
+        }
+    return results
+
+
+def _write_sample_file(size_mb: int) -> str:
+    """Write a temporary chat-log-like file (~10% dated lines) and return its path."""
+    import os
+    import tempfile
+
+    filler = 'Please review the attached document and send comments by end of week.'
+    block = '\n'.join([*PARSER_CORPUS[:8], *[filler] * 72]) + '\n'
+    fd, path = tempfile.mkstemp(suffix='.txt')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        encoded = len(block.encode('utf-8'))
+        for _ in range(size_mb * (1 << 20) // encoded + 1):
+            f.write(block)
+    return path
+
+
+def bench_streaming(size_mb: int = 64, chunk_size: int = 1 << 20) -> dict:
+    """
+    Throughput and Python heap use of the mmap line reader on a large file.
+
+    The file mixes dated lines with ~90% filler, like a chat log export.
+    Reported alongside a plain binary read of the same file as the
+    disk-speed reference.
+    """
+    import os
+    import tracemalloc
+    from .streaming import iter_lines, parse_file
+
+    path = _write_sample_file(size_mb)
+    try:
+        size = os.path.getsize(path)
+
+        started = time.perf_counter()
+        with open(path, 'rb') as f:
+            while f.read(chunk_size):
+                pass
+        read_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        lines = sum(1 for _ in iter_lines(path, chunk_size=chunk_size))
+        lines_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        events = sum(1 for _ in parse_file(path, chunk_size=chunk_size))
+        parse_s = time.perf_counter() - started
+
+        tracemalloc.start()
+        for _ in iter_lines(path, chunk_size=chunk_size):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        os.remove(path)
+
+    mb = size / (1 << 20)
+    return {
+        'file_mb': round(mb, 1),
+        'lines': lines,
+        'events': events,
+        'read_mb_s': round(mb / read_s, 1),
+        'iter_lines_mb_s': round(mb / lines_s, 1),
+        'parse_file_mb_s': round(mb / parse_s, 1),
+        'iter_lines_peak_heap_mb': round(peak / (1 << 20), 2),
+    }
+
+
+def bench_parallel_import(size_mb: int = 16, workers: tuple[int, ...] = (1, 2, 4, 8)) -> dict:
+    """
+    Scaling of the process-pool parser over 1, 2, 4 and 8 workers.
+
+    Pool start-up (including the per-worker grammar compile) is part of the
+    measured time; every run must yield the same events in the same order.
+    """
+    import os
+    from .bulk_import import parse_file_parallel
+
+    path = _write_sample_file(size_mb)
+    results: dict = {'cpus': os.cpu_count()}
+    try:
+        mb = os.path.getsize(path) / (1 << 20)
+        baseline = None
+        reference = None
+        for count in workers:
+            started = time.perf_counter()
+            events = [(e.start_date, e.title) for e in parse_file_parallel(path, workers=count)]
+            elapsed = time.perf_counter() - started
+            reference = reference or events
+            baseline = baseline or elapsed
+            results[f'{count}_workers'] = {
+                'seconds': round(elapsed, 2),
+                'mb_s': round(mb / elapsed, 1),
+                'speedup': round(baseline / elapsed, 2),
+                'same_output': events == reference,
+            }
+    finally:
+        os.remove(path)
+    return results
+
+
+def bench_ics(events: int = 100_000) -> dict:
+    """
+    Stream `events` VEVENTs through the ICS writer and reader.
+
+    Both sides are generators, so the peak Python heap while reading
+    should not depend on the number of events.
+    """
+    import os
+    import tempfile
+    import tracemalloc
+    from datetime import timedelta
+    from .date_parser import ParsedEvent
+    from .ics import read_ics, write_ics
+
+    def generate():
+        start = datetime(2025, 1, 1, 9, 0)
+        for i in range(events):
+            yield ParsedEvent(title=f'予定 {i}', start_date=start + timedelta(hours=i),
+                              all_day=i % 5 == 0, description='Imported from bench')
+
+    fd, path = tempfile.mkstemp(suffix='.ics')
+    os.close(fd)
+    try:
+        started = time.perf_counter()
+        written = write_ics(generate(), path)
+        write_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        read = sum(1 for _ in read_ics(path))
+        read_s = time.perf_counter() - started
+
+        tracemalloc.start()
+        for _ in read_ics(path):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        size = os.path.getsize(path)
+    finally:
+        os.remove(path)
+
+    return {
+        'events': written,
+        'read_back': read,
+        'file_mb': round(size / (1 << 20), 1),
+        'write_events_s': round(written / write_s),
+        'read_events_s': round(read / read_s),
+        'read_peak_heap_kb': round(peak / 1024),
+    }
+
+
+# Texts that reach the last-resort fallback, with the date a person would read
+# (None = no date), relative to FALLBACK_NOW
+FALLBACK_NOW = datetime(2026, 10, 19)
+FALLBACK_CORPUS = [
+    ('Release v2.3 is out', None),
+    ('Call me at 090-1234-5678', None),
+    ('Server 192.168.0.1 is down', None),
+    ('Pi is 3.14', None),
+    ('Order #12345 shipped', None),
+    ('Room 404', None),
+    ('Total: 1,234 yen', None),
+    ('Chapter 3 section 12', None),
+    ('Version 10.15.7', None),
+    ('Launch in Q3', None),
+    ('Price $20.25', None),
+    ('Up 12% from last quarter', None),
+    ('ISBN 978-4-06-521234-5', None),
+    ('Meeting on 2024.12.25', datetime(2024, 12, 25)),
+    ('Deadline 25.12.2024', datetime(2024, 12, 25)),
+    ('Build 20241225 ready', datetime(2024, 12, 25)),
+    ('Party on the 25th', datetime(2026, 10, 25)),
+    ('See you on the 2nd', datetime(2026, 11, 2)),
+    ('Conference in March 2027', datetime(2027, 3, 1)),
+    ('The 3rd of April', datetime(2027, 4, 3)),
+    ('April the 3rd', datetime(2027, 4, 3)),
+]
+
+
+def bench_fallback(repeat: int = 200) -> dict:
+    """
+    Last-resort date guessing: in-house tokenizer vs. dateutil fuzzy parse.
+
+    Reports per-call latency (uncached and cached for the tokenizer) and,
+    on FALLBACK_CORPUS, how many dates each gets right, how many dates it
+    invents from non-dates (false positives) and how many it misses.
+    """
+    from dateutil import parser as dateutil_parser
+    from .fallback import FallbackDateTokenizer
+    from .locales import compile_grammar
+
+    tokenizer = FallbackDateTokenizer(compile_grammar())
+    texts = [text for text, _ in FALLBACK_CORPUS]
+
+    def dateutil_guess(text):
+        try:
+            return dateutil_parser.parse(text, fuzzy=True, default=FALLBACK_NOW)
+        except Exception:
+            return None
+
+    def tokenizer_guess(text):
+        guess = tokenizer.find(text, FALLBACK_NOW)
+        return guess[0] if guess else None
+
+    def score(guess_fn) -> dict:
+        result = {'correct': 0, 'false_positives': 0, 'wrong': 0, 'missed': 0}
+        for text, expected in FALLBACK_CORPUS:
+            guess = guess_fn(text)
+            guess = guess.replace(hour=0, minute=0, second=0, microsecond=0) if guess else None
+            if guess == expected:
+                result['correct'] += 1
+            elif expected is None:
+                result['false_positives'] += 1
+            elif guess is None:
+                result['missed'] += 1
+            else:
+                result['wrong'] += 1
+        return result
+
+    uncached = _time_per_call(lambda: [tokenizer._scan_uncached(t) for t in texts], repeat)
+    cached = _time_per_call(lambda: [tokenizer.find(t, FALLBACK_NOW) for t in texts], repeat)
+    dateutil_time = _time_per_call(lambda: [dateutil_guess(t) for t in texts], max(1, repeat // 10))
+    return {
+        'texts': len(texts),
+        'tokenizer_us': round(uncached / len(texts) * 1e6, 1),
+        'tokenizer_cached_us': round(cached / len(texts) * 1e6, 1),
+        'dateutil_us': round(dateutil_time / len(texts) * 1e6, 1),
+        'tokenizer_accuracy': score(tokenizer_guess),
+        'dateutil_accuracy': score(dateutil_guess),
+    }
+
+
+def bench_clipboard_formats(events: int = 20, repeat: int = 50) -> dict:
+    """
+    A copied calendar invite: structured text/calendar parse vs. the plain-text path.
+
+    Counts how many events each path recovers with the exact title and
+    start time, and the time per payload.
+    """
+    import io
+    from datetime import timedelta
+    from .clipboard_formats import parse_structured
+    from .date_parser import DateParser, ParsedEvent
+    from .ics import write_ics
+
+    start = datetime(2026, 11, 2, 9, 30)
+    originals = [ParsedEvent(title=f'Design review {i}', start_date=start + timedelta(days=i, minutes=15 * i),
+                             all_day=False) for i in range(events)]
+    out = io.StringIO()
+    write_ics(originals, out)
+    payload = out.getvalue()
+    # 平文として貼られたときの見え方（メールクライアントの表示に近いもの）
+    plain = '\n'.join(f"{e.title}\n{e.start_date.strftime('%A, %B %d, %Y %I:%M %p')}" for e in originals)
+
+    parser = DateParser()
+    expected = {(e.title, e.start_date) for e in originals}
+
+    def exact(found: list) -> int:
+        return sum(1 for e in found if (e.title, e.start_date) in expected)
+
+    structured = _time_per_call(lambda: parse_structured('text/calendar', payload, parser), repeat)
+    flattened = _time_per_call(lambda: parser.parse_all(plain), repeat)
+    return {
+        'events': events,
+        'structured_us': round(structured * 1e6, 1),
+        'structured_exact': exact(parse_structured('text/calendar', payload, parser)),
+        'plain_text_us': round(flattened * 1e6, 1),
+        'plain_text_exact': exact(parser.parse_all(plain)),
+    }
+
+
+# Clipboard texts that are not events but match a date rule
+NOISE_CORPUS = [
+    'Updated to v1.2/3 last night',
+    'Final score 3-1',
+    'Add 3/4 cup of sugar',
+    '50% off, 1/2 price sale',
+    'Page 12/40',
+    'Build 2-3 failed',
+]
+
+
+def bench_confidence() -> dict:
+    """
+    Dialogs that would open for PARSER_CORPUS (events) vs. NOISE_CORPUS.
+
+    The first-match count is what the parser did before confidence scoring:
+    any rule match opened the dialog.
+    """
+    from .date_parser import DateParser, min_confidence
+
+    parser = DateParser()
+    threshold = min_confidence()
+    results = {'threshold': threshold}
+    for name, corpus in (('events', PARSER_CORPUS), ('noise', NOISE_CORPUS)):
+        parsed = [parser.parse(text) for text in corpus]
+        results[name] = {
+            'texts': len(corpus),
+            'first_match': sum(1 for e in parsed if e),
+            'dialogs': sum(1 for e in parsed if e and e.confidence >= threshold),
+        }
+    return results
+
+
+def bench_insert(events: int = 200, latency: float = 0.02) -> dict:
+    """
+    Insert events through GoogleCalendarClient against the local fake API.
+
+    Each HTTP request costs `latency` seconds, as a round trip to Google
+    would; one-by-one inserts pay it per event, batches per 50 events.
+    """
+    from datetime import timedelta
+    from .date_parser import ParsedEvent
+    from .fake_calendar import FakeCalendarServer
+    from .google_calendar import GoogleCalendarClient
+
+    start = datetime(2025, 1, 1, 9, 0)
+    batch = [ParsedEvent(title=f'予定 {i}', start_date=start + timedelta(hours=i), all_day=i % 5 == 0)
+             for i in range(events)]
+    results = {}
+    with FakeCalendarServer(latency=latency) as server:
+        client = GoogleCalendarClient(endpoint=server.url)
+        client.list_calendars()  # サービス構築を計測から外す
+
+        started = time.perf_counter()
+        single = sum(1 for event in batch if client.add_event(event))
+        single_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        batched = sum(1 for url in client.add_events(batch) if url)
+        batch_s = time.perf_counter() - started
+        results['requests'] = server.stats['requests']
+
+    results.update({
+        'single_events_s': round(single / single_s, 1),
+        'batch_events_s': round(batched / batch_s, 1),
+        'speedup': round(single_s / batch_s, 1),
+        'inserted': f'{single}+{batched}/{2 * events}',
+    })
+    return results
+
+
+def _legacy_event_body(event) -> dict:
+    """Per-event request body from before EventBodyBuilder (baseline, with the exclusive all-day end)."""
+    from datetime import timedelta
+    if event.all_day:
+        body = {
+            'summary': event.title,
+            'start': {'date': event.start_date.strftime('%Y-%m-%d'), 'timeZone': 'Asia/Tokyo'},
+            'end': {'date': ((event.end_date or event.start_date) + timedelta(days=1)).strftime('%Y-%m-%d'),
+                    'timeZone': 'Asia/Tokyo'},
+        }
+    else:
+        end_date = event.end_date or event.start_date + timedelta(hours=1)
+        body = {
+            'summary': event.title,
+            'start': {'dateTime': event.start_date.isoformat(), 'timeZone': 'Asia/Tokyo'},
+            'end': {'dateTime': end_date.isoformat(), 'timeZone': 'Asia/Tokyo'},
+        }
+    if event.description:
+        body['description'] = event.description
+    if event.recurrence:
+        body['recurrence'] = [event.recurrence]
+    return body
+
+
+def bench_event_body(events: int = 100_000) -> dict:
+    """Build `events` insert bodies with EventBodyBuilder and with the old per-event code."""
+    from datetime import timedelta
+    from .date_parser import ParsedEvent
+    from .event_body import EventBodyBuilder
+
+    start = datetime(2025, 1, 1, 9, 0)
+    sample = [
+        ParsedEvent(title=f'予定 {i}', start_date=start + timedelta(hours=i // 3),
+                    end_date=start + timedelta(hours=i // 3, minutes=30) if i % 4 == 1 else None,
+                    all_day=i % 3 == 0, description='Imported from bench' if i % 2 else '',
+                    recurrence='RRULE:FREQ=WEEKLY' if i % 50 == 0 else None)
+        for i in range(events)
+    ]
+
+    started = time.perf_counter()
+    legacy = [_legacy_event_body(event) for event in sample]
+    legacy_s = time.perf_counter() - started
+
+    builder = EventBodyBuilder()
+    started = time.perf_counter()
+    built = list(builder.build_many(sample))
+    builder_s = time.perf_counter() - started
+
+    return {
+        'events': events,
+        'legacy_us': round(legacy_s / events * 1e6, 2),
+        'builder_us': round(builder_s / events * 1e6, 2),
+        'speedup': round(legacy_s / builder_s, 2),
+        'same_output': built == legacy,
+    }
+
+
+def bench_rules(repeat: int = 20, top: int = 5) -> dict:
+    """
+    Per-rule cost over PARSER_CORPUS, NOISE_CORPUS and FALLBACK_CORPUS via explain mode.
+
+    Also compares parse() with explain() on the same texts, to show what
+    tracing costs when it is switched on.
+    """
+    from .date_parser import DateParser
+    from .explain import RuleProfile
+
+    parser = DateParser()
+    texts = [*PARSER_CORPUS, *NOISE_CORPUS, *(text for text, _ in FALLBACK_CORPUS)]
+    profile = RuleProfile()
+    for text in texts:
+        parser.explain(text)  # 規則ごとの正規表現のコンパイルを済ませる
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            parser.parse(text)
+    parse_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            profile.add(parser.explain(text))
+    explain_s = time.perf_counter() - started
+
+    total = sum(entry['seconds'] for entry in profile.rules.values()) or 1.0
+    return {
+        'texts': len(texts),
+        'parse_us': round(parse_s / (repeat * len(texts)) * 1e6, 1),
+        'explain_us': round(explain_s / (repeat * len(texts)) * 1e6, 1),
+        'top_rules': {name: f"{entry['seconds'] / total:.0%} ({entry['matches'] // repeat} matches)"
+                      for name, entry in profile.top(top)},
+    }
+
+
+BENCHMARKS: dict[str, Callable[[], dict]] = {
+    'event_bus': bench_event_bus,
+    'locales': bench_locales,
+    'keywords': bench_keywords,
+    'streaming': bench_streaming,
+    'parallel_import': bench_parallel_import,
+    'ics': bench_ics,
+    'fallback': bench_fallback,
+    'confidence': bench_confidence,
+    'clipboard_formats': bench_clipboard_formats,
+    'insert': bench_insert,
+    'event_body': bench_event_body,
+    'rules': bench_rules,
+}
+
+
+def run(names: list[str]) -> dict[str, dict]:
+    """Run the named benchmarks (all if empty) and return their results."""
+    results = {}
+    for name in names or BENCHMARKS:
+        results[name] = BENCHMARKS[name]()
+    return results
+
+
+def main(argv=None):
+    """Run benchmarks and print results."""
+    arg_parser = argparse.ArgumentParser(description="Run built-in benchmarks")
+    arg_parser.add_argument('names', nargs='*', help=f"benchmarks to run (default: all): {', '.join(BENCHMARKS)}")
+    args = arg_parser.parse_args(argv)
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        arg_parser.error(f"unknown benchmark: {', '.join(unknown)}")
+
+    for name, result in run(args.names).items():
+        print(f"[{name}]")
+        for key, value in result.items():
+            print(f"  {key}: {value}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+"""Bulk import of large event files: parallel parsing, duplicate check and batched inserts."""
+
+import mmap
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from .date_parser import DateParser, ParsedEvent, min_confidence
+from .metrics import metrics
+
+# Bytes per shard; large enough that pickling results is cheap relative to parsing
+SHARD_SIZE = 4 << 20
+# Events handed to the Calendar client per add_events() call (split into API batches there)
+INSERT_CHUNK = 500
+
+# Per-worker parser, created once by _init_worker
+_worker_parser: Optional[DateParser] = None
+
+
+def shard_ranges(path: Union[str, Path], shard_size: int = SHARD_SIZE) -> list[tuple[int, int]]:
+    """
+    Split a file into (start, end) byte ranges that end right after a newline.
+
+    Shards therefore hold whole lines, and with an ASCII-compatible encoding
+    (UTF-8, Shift_JIS, ...) never split a character.
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+
+    ranges = []
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        start = 0
+        while start < size:
+            end = mapped.find(b'\n', min(start + shard_size, size) - 1)
+            end = size if end < 0 else end + 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def event_key(event: ParsedEvent) -> tuple:
+    """Identity of an event for duplicate checks (title, start, all-day, recurrence)."""
+    return (event.title.strip(), event.start_date.isoformat(), event.all_day, event.recurrence or '')
+
+
+def drop_duplicates(events: Iterable[ParsedEvent], seen: Optional[set] = None) -> Iterator[ParsedEvent]:
+    """
+    Skip events whose event_key() was already seen.
+
+    Only the keys are kept, so memory grows with distinct events, not
+    with their text. Pass `seen` to share it across several inputs.
+    """
+    seen = set() if seen is None else seen
+    for event in events:
+        key = event_key(event)
+        if key in seen:
+            continue
+        seen.add(key)
+        yield event
+
+
+def drop_low_confidence(events: Iterable[ParsedEvent], threshold: Optional[float] = None) -> Iterator[ParsedEvent]:
+    """Skip events scored below `threshold` (default: min_confidence()), as the tray app does."""
+    threshold = min_confidence() if threshold is None else threshold
+    for event in events:
+        if event.confidence < threshold:
+            metrics.incr('parse.low_confidence')
+            continue
+        yield event
+
+
+def _init_worker(locales: Optional[tuple[str, ...]]):
+    """Process pool initializer: compile the grammar once per worker."""
+    global _worker_parser
+    _worker_parser = DateParser(locales=locales)
+
+
+def _parse_shard(path: str, start: int, end: int, encoding: str) -> list[ParsedEvent]:
+    """Parse the lines in one byte range (runs in a worker process)."""
+    parser = _worker_parser or DateParser()
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        text = mapped[start:end].decode(encoding, errors='replace')
+    return list(parser.parse_lines(parser.grammar.candidate_lines(text)))
+
+
+def parse_file_parallel(path: Union[str, Path], workers: Optional[int] = None,
+                        locales: Optional[Iterable[str]] = None, encoding: str = 'utf-8',
+                        shard_size: int = SHARD_SIZE,
+                        executor: Optional[Executor] = None) -> Iterator[ParsedEvent]:
+    """
+    Parse a large file on several processes, yielding events in file order.
+
+    At most two shards per worker are in flight, so memory stays bounded
+    and results are merged in input order as they complete.
+
+    Args:
+        path: File to import
+        workers: Worker processes (default: CPU count); 1 parses in-process
+        locales: Locale grammars to use (default: all registered)
+        encoding: ASCII-compatible text encoding
+        shard_size: Approximate bytes per shard
+        executor: Existing executor to reuse (workers/locales are then ignored)
+
+    Yields:
+        ParsedEvents in file order
+    """
+    path = str(path)
+    locales = tuple(locales) if locales is not None else None
+    ranges = shard_ranges(path, shard_size)
+    workers = workers or os.cpu_count() or 1
+
+    if executor is None and workers == 1:
+        _init_worker(locales)
+        for start, end in ranges:
+            yield from _parse_shard(path, start, end, encoding)
+        return
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(locales,))
+    try:
+        pending = deque()
+        shards = iter(ranges)
+        for start, end in shards:
+            pending.append(executor.submit(_parse_shard, path, start, end, encoding))
+            if len(pending) >= workers * 2:
+                break
+        while pending:
+            # 先頭のシャードから順に結果を返す（入力順を保つ）
+            events = pending.popleft().result()
+            next_range = next(shards, None)
+            if next_range is not None:
+                pending.append(executor.submit(_parse_shard, path, *next_range, encoding))
+            yield from events
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def import_file(path: Union[str, Path], client, calendar_id: str = 'primary',
+                workers: Optional[int] = None, locales: Optional[Iterable[str]] = None,
+                encoding: str = 'utf-8', threshold: Optional[float] = None) -> tuple[int, int]:
+    """
+    Parse a file and insert its events with batched API calls.
+
+    .ics files are streamed through the iCalendar reader; anything else is
+    parsed as text in parallel. Events below `threshold` (default:
+    min_confidence()) and duplicates are dropped, and the rest
+    are handed to `client.add_events` (a GoogleCalendarClient) in chunks as
+    soon as they are merged, so inserting overlaps with parsing.
+
+    Returns:
+        (events parsed, events inserted)
+    """
+    parsed = inserted = 0
+    chunk: list[ParsedEvent] = []
+
+    def flush():
+        nonlocal inserted
+        with metrics.timer('import.insert'):
+            inserted += sum(1 for url in client.add_events(chunk, calendar_id) if url)
+        chunk.clear()
+
+    if Path(path).suffix.lower() == '.ics':
+        from .ics import read_ics
+        events = read_ics(path)
+    else:
+        events = parse_file_parallel(path, workers, locales, encoding)
+
+    with metrics.timer('import.total'):
+        for event in drop_duplicates(drop_low_confidence(events, threshold)):
+            parsed += 1
+            chunk.append(event)
+            if len(chunk) >= INSERT_CHUNK:
+                flush()
+        if chunk:
+            flush()
+
+    return parsed, inserted
@@ -0,0 +1,209 @@
+"""Command-line subcommands (parse, add, import, bench) that run without the GUI."""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Optional
+
+from .date_parser import DEFAULT_TOP_K, DateParser, ParsedEvent, min_confidence
+
+# Subcommands dispatched here by __main__ (anything else starts the tray app)
+COMMANDS = ('parse', 'add', 'import', 'bench')
+
+
+def event_to_dict(event: ParsedEvent) -> dict:
+    """JSON-serializable form of a ParsedEvent (dates as ISO 8601, all-day as YYYY-MM-DD)."""
+    def iso(value):
+        if value is None:
+            return None
+        return value.date().isoformat() if event.all_day else value.isoformat()
+
+    return {
+        'title': event.title,
+        'start': iso(event.start_date),
+        'end': iso(event.end_date),
+        'all_day': event.all_day,
+        'recurrence': event.recurrence,
+        'confidence': round(event.confidence, 3),
+        'description': event.description,
+    }
+
+
+def detect_events(parser: DateParser, text: str, threshold: float) -> list[ParsedEvent]:
+    """
+    Events in `text`, the same way the tray app reads a clipboard copy.
+
+    Multi-line text with dates on several lines gives one event per line;
+    otherwise the whole text is one event. Events below `threshold` are dropped.
+    """
+    if '\n' in text.strip():
+        events = [e for e in parser.parse_all(text) if e.confidence >= threshold]
+        if len(events) > 1:
+            return events
+    event = parser.parse(text)
+    return [event] if event and event.confidence >= threshold else []
+
+
+def _read_text(args) -> str:
+    """Text from the positional arguments, or stdin if none were given."""
+    if args.text:
+        return ' '.join(args.text)
+    return sys.stdin.read()
+
+
+def _dump(value):
+    json.dump(value, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write('\n')
+
+
+def _make_parser(args) -> DateParser:
+    return DateParser(locales=args.locale or None)
+
+
+def cmd_parse(args) -> int:
+    """Print the events found in the text as JSON."""
+    parser = _make_parser(args)
+    text = _read_text(args)
+    if args.explain:
+        trace = parser.explain(text)
+        _dump(trace.to_dict())
+        return 0 if trace.event else 1
+    if args.top_k:
+        events = [e for e in parser.parse_candidates(text, args.top_k) if e.confidence >= args.min_confidence]
+    else:
+        events = detect_events(parser, text, args.min_confidence)
+    _dump([event_to_dict(e) for e in events])
+    return 0 if events else 1
+
+
+def cmd_add(args) -> int:
+    """Parse the text and insert its events into Google Calendar."""
+    from .routing import CalendarListCache, Router
+
+    events = detect_events(_make_parser(args), _read_text(args), args.min_confidence)
+    if not events:
+        print("No date found.", file=sys.stderr)
+        return 1
+
+    pool = None
+    calendars = None
+    if not args.dry_run:
+        from .accounts import AccountPool
+        pool = AccountPool()
+        if args.calendar is None:
+            # ルールのカレンダー名をIDに変換するための一覧
+            calendars = CalendarListCache(pool.get())
+            calendars.refresh()
+    router = Router.from_file(calendars=calendars)
+
+    groups: dict[tuple[str, str], list[ParsedEvent]] = defaultdict(list)
+    for event in events:
+        account, calendar_id = router.route_event(event)
+        groups[(args.account or account, args.calendar or calendar_id)].append(event)
+
+    if args.dry_run:
+        _dump([dict(event_to_dict(event), account=account, calendar=calendar_id)
+               for (account, calendar_id), group in groups.items() for event in group])
+        return 0
+
+    try:
+        for account, _ in groups:
+            if not pool.get(account).is_configured():
+                print(f"Credentials not found for account '{account}'.", file=sys.stderr)
+                return 2
+        added = pool.add_events(groups)
+    finally:
+        pool.shutdown()
+    print(f"Added {added}/{len(events)} events.")
+    return 0 if added == len(events) else 1
+
+
+def cmd_import(args) -> int:
+    """Insert every event of a text or .ics file with batched requests."""
+    if not args.path.exists():
+        print(f"File not found: {args.path}", file=sys.stderr)
+        return 2
+
+    if args.dry_run:
+        from .bulk_import import drop_duplicates, drop_low_confidence, parse_file_parallel
+        if args.path.suffix.lower() == '.ics':
+            from .ics import read_ics
+            events = read_ics(args.path)
+        else:
+            events = parse_file_parallel(args.path, workers=args.workers, locales=args.locale or None)
+        events = list(drop_duplicates(drop_low_confidence(events, args.min_confidence)))
+        _dump([event_to_dict(e) for e in events])
+        return 0 if events else 1
+
+    from .bulk_import import import_file
+    from .config import DEFAULT_ACCOUNT
+    from .google_calendar import GoogleCalendarClient
+    client = GoogleCalendarClient(args.account or DEFAULT_ACCOUNT)
+    if not client.is_configured():
+        print(f"Credentials not found for account '{client.account}'.", file=sys.stderr)
+        return 2
+    parsed, inserted = import_file(args.path, client, args.calendar or 'primary',
+                                   workers=args.workers, locales=args.locale or None,
+                                   threshold=args.min_confidence)
+    print(f"Imported {inserted}/{parsed} events from {args.path}")
+    return 0 if inserted == parsed else 1
+
+
+def cmd_bench(args) -> int:
+    """Run the built-in benchmarks."""
+    from .bench import main as run_bench
+    run_bench(args.names)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Argument parser with one subparser per command."""
+    parser = argparse.ArgumentParser(prog='calendar-to-google',
+                                     description="Parse dates and add events to Google Calendar from the command line")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def text_command(name: str, help: str) -> argparse.ArgumentParser:
+        sub = commands.add_parser(name, help=help)
+        sub.add_argument('text', nargs='*', help="text to parse (default: read stdin)")
+        sub.add_argument('--locale', action='append', metavar='CODE',
+                         help="grammar locale to use (repeatable, default: all)")
+        sub.add_argument('--min-confidence', type=float, default=min_confidence(), metavar='X',
+                         help="drop detections below this confidence (default: %(default)s)")
+        return sub
+
+    sub = text_command('parse', "print the events found in text as JSON")
+    sub.add_argument('--top-k', type=int, nargs='?', const=DEFAULT_TOP_K, metavar='K',
+                     help=f"print up to K alternative readings instead (default K: {DEFAULT_TOP_K})")
+    sub.add_argument('--explain', action='store_true',
+                     help="print a trace of every rule tried, with timings and rejection reasons")
+    sub.set_defaults(func=cmd_parse)
+
+    sub = text_command('add', "parse text and insert its events")
+    sub.add_argument('--dry-run', action='store_true', help="print the events and target calendars only")
+    sub.add_argument('--calendar', metavar='ID', help="calendar ID (default: routing rules)")
+    sub.add_argument('--account', metavar='NAME', help="account profile (default: routing rules)")
+    sub.set_defaults(func=cmd_add)
+
+    sub = commands.add_parser('import', help="insert the events of a text or .ics file")
+    sub.add_argument('path', type=Path, metavar='FILE')
+    sub.add_argument('--dry-run', action='store_true', help="print the parsed events only")
+    sub.add_argument('--calendar', metavar='ID', help="calendar ID (default: primary)")
+    sub.add_argument('--account', metavar='NAME', help="account profile (default: default)")
+    sub.add_argument('--workers', type=int, metavar='N', help="parser processes for text files")
+    sub.add_argument('--locale', action='append', metavar='CODE', help="grammar locale to use (repeatable)")
+    sub.add_argument('--min-confidence', type=float, default=min_confidence(), metavar='X',
+                     help="drop detections below this confidence (default: %(default)s)")
+    sub.set_defaults(func=cmd_import)
+
+    sub = commands.add_parser('bench', help="run the built-in parser benchmarks")
+    sub.add_argument('names', nargs='*', help="benchmarks to run (default: all)")
+    sub.set_defaults(func=cmd_bench)
+    return parser
+
+
+def run(argv: Optional[list[str]] = None) -> int:
+    """Parse arguments and run a subcommand; returns the exit status."""
+    args = build_parser().parse_args(argv)
+    return args.func(args)
@@ -0,0 +1,304 @@
+"""Clipboard backends and structured (text/calendar, text/html) clipboard parsing."""
+
+import os
+import re
+import sys
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import Optional
+
+import pyperclip
+
+from .date_parser import DateParser, ParsedEvent
+from .source_app import ClipboardSource, change_count, probe_source, run_helper
+
+# Native clipboard target name (lower case) -> structured kind, most exact first
+STRUCTURED_TARGETS = {
+    'text/calendar': 'text/calendar',
+    'application/ics': 'text/calendar',
+    'com.apple.ical.ics': 'text/calendar',
+    'text/html': 'text/html',
+    'html format': 'text/html',
+    'public.html': 'text/html',
+    'apple html pasteboard type': 'text/html',
+}
+_KIND_ORDER = ('text/calendar', 'text/html')
+# Seconds allowed for a helper process to hand over one payload
+READ_TIMEOUT = 2.0
+
+_CF_HTML_RE = re.compile(rb'(StartHTML|EndHTML|StartFragment|EndFragment):(-?\d+)')
+
+
+def structured_target(targets: tuple[str, ...]) -> Optional[tuple[str, str]]:
+    """Return (native target, kind) of the best structured format on offer, or None."""
+    found: dict[str, str] = {}
+    for target in targets:
+        kind = STRUCTURED_TARGETS.get(target.lower())
+        if kind:
+            found.setdefault(kind, target)
+    for kind in _KIND_ORDER:
+        if kind in found:
+            return found[kind], kind
+    return None
+
+
+class ClipboardBackend:
+    """Where ClipboardMonitor gets clipboard state and content from."""
+
+    def change_count(self) -> Optional[int]:
+        """Change counter, or None if the platform has none."""
+        return None
+
+    def probe(self) -> ClipboardSource:
+        """Source app and available targets, without reading the content."""
+        return ClipboardSource()
+
+    def read_text(self) -> str:
+        """Plain-text content."""
+        raise NotImplementedError
+
+    def read(self, target: str) -> Optional[str]:
+        """Content of one target (as listed by probe()), or None if unavailable."""
+        return None
+
+
+class SystemClipboard(ClipboardBackend):
+    """The OS clipboard: pyperclip for text, native APIs/helpers for other targets."""
+
+    def change_count(self) -> Optional[int]:
+        return change_count()
+
+    def probe(self) -> ClipboardSource:
+        return probe_source()
+
+    def read_text(self) -> str:
+        return pyperclip.paste()
+
+    def read(self, target: str) -> Optional[str]:
+        try:
+            if sys.platform == 'win32':
+                return _read_windows(target)
+            if sys.platform == 'darwin':
+                from AppKit import NSPasteboard
+                value = NSPasteboard.generalPasteboard().stringForType_(target)
+                return str(value) if value is not None else None
+            if os.environ.get('WAYLAND_DISPLAY'):
+                return run_helper('wl-paste', '--no-newline', '-t', target, timeout=READ_TIMEOUT) or None
+            return run_helper('xclip', '-selection', 'clipboard', '-t', target, '-o', timeout=READ_TIMEOUT) or None
+        except Exception as e:
+            print(f"Clipboard read failed ({target}): {e}")
+            return None
+
+
+class FakeClipboard(ClipboardBackend):
+    """
+    In-memory clipboard for driving ClipboardMonitor without a display.
+
+    Every set() bumps the change counter, like the Windows/macOS clipboard.
+    """
+
+    def __init__(self, app: str = ""):
+        """
+        Initialize fake clipboard.
+
+        Args:
+            app: Source app name reported by probe()
+        """
+        self.app = app
+        self.payloads: dict[str, str] = {}
+        self.reads: list[str] = []  # targets read, in order (to check what was fetched)
+        self._count = 0
+
+    def set(self, text: str = "", html: Optional[str] = None, calendar: Optional[str] = None,
+            app: Optional[str] = None, **targets: str):
+        """Replace the content; extra targets are given as keyword arguments."""
+        self.payloads = {'text/plain': text}
+        if html is not None:
+            self.payloads['text/html'] = html
+        if calendar is not None:
+            self.payloads['text/calendar'] = calendar
+        self.payloads.update(targets)
+        if app is not None:
+            self.app = app
+        self._count += 1
+
+    def change_count(self) -> Optional[int]:
+        return self._count
+
+    def probe(self) -> ClipboardSource:
+        return ClipboardSource(self.app, targets=tuple(self.payloads))
+
+    def read_text(self) -> str:
+        self.reads.append('text/plain')
+        return self.payloads.get('text/plain', '')
+
+    def read(self, target: str) -> Optional[str]:
+        self.reads.append(target)
+        return self.payloads.get(target)
+
+
+def _read_windows(target: str) -> Optional[str]:
+    """Read one registered clipboard format (HTML Format, text/calendar) via the Win32 API."""
+    import ctypes
+
+    user32, kernel32 = ctypes.windll.user32, ctypes.windll.kernel32
+    user32.GetClipboardData.restype = ctypes.c_void_p
+    kernel32.GlobalLock.restype = ctypes.c_void_p
+    kernel32.GlobalLock.argtypes = [ctypes.c_void_p]
+    kernel32.GlobalUnlock.argtypes = [ctypes.c_void_p]
+    kernel32.GlobalSize.restype = ctypes.c_size_t
+    kernel32.GlobalSize.argtypes = [ctypes.c_void_p]
+
+    fmt = user32.RegisterClipboardFormatW(target)
+    if not user32.OpenClipboard(None):
+        return None
+    try:
+        handle = user32.GetClipboardData(fmt)
+        if not handle:
+            return None
+        pointer = kernel32.GlobalLock(handle)
+        try:
+            raw = ctypes.string_at(pointer, kernel32.GlobalSize(handle))
+        finally:
+            kernel32.GlobalUnlock(handle)
+    finally:
+        user32.CloseClipboard()
+
+    raw = raw.split(b'\0', 1)[0]
+    if target.lower() == 'html format':
+        raw = _cf_html_body(raw)
+    return raw.decode('utf-8', errors='replace')
+
+
+def _cf_html_body(raw: bytes) -> bytes:
+    """Cut the HTML out of a CF_HTML payload (byte offsets in its header)."""
+    offsets = {name.decode(): int(value) for name, value in _CF_HTML_RE.findall(raw[:512])}
+    start, end = offsets.get('StartHTML', -1), offsets.get('EndHTML', -1)
+    if start < 0 or end < 0:
+        start, end = offsets.get('StartFragment', 0), offsets.get('EndFragment', len(raw))
+    return raw[start:end]
+
+
+# --- structured parsing ---
+
+class _HtmlRows(HTMLParser):
+    """
+    Split HTML into rows of cell texts.
+
+    Table rows become rows of their cells; outside tables every block
+    element (p, div, li, br, headings) ends a row. <time datetime="...">
+    values are kept per row, since they give the date exactly.
+    """
+
+    _BLOCK_TAGS = frozenset({'p', 'div', 'li', 'br', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'table'})
+    _SKIP_TAGS = frozenset({'script', 'style', 'head', 'title'})
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows: list[tuple[list[str], list[tuple[str, str]]]] = []
+        self._cells: list[str] = []
+        self._times: list[tuple[str, str]] = []  # (datetime attribute, element text)
+        self._text: list[str] = []
+        self._time_attr: Optional[str] = None
+        self._time_text: list[str] = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIP_TAGS:
+            self._skip += 1
+        elif tag in ('td', 'th'):
+            self._end_cell()
+        elif tag == 'tr' or tag in self._BLOCK_TAGS:
+            self._end_row()
+        elif tag == 'time':
+            self._time_attr = dict(attrs).get('datetime')
+            self._time_text = []
+
+    def handle_endtag(self, tag):
+        if tag in self._SKIP_TAGS:
+            self._skip = max(self._skip - 1, 0)
+        elif tag in ('td', 'th'):
+            self._end_cell()
+        elif tag == 'tr' or tag in self._BLOCK_TAGS:
+            self._end_row()
+        elif tag == 'time' and self._time_attr:
+            self._times.append((self._time_attr, ''.join(self._time_text).strip()))
+            self._time_attr = None
+
+    def handle_data(self, data):
+        if self._skip:
+            return
+        self._text.append(data)
+        if self._time_attr:
+            self._time_text.append(data)
+
+    def close(self):
+        super().close()
+        self._end_row()
+
+    def _end_cell(self):
+        text = ' '.join(''.join(self._text).split())
+        if text:
+            self._cells.append(text)
+        self._text = []
+
+    def _end_row(self):
+        self._end_cell()
+        if self._cells:
+            self.rows.append((self._cells, self._times))
+        self._cells, self._times = [], []
+
+
+def _parse_time_attr(value: str) -> Optional[tuple[datetime, bool]]:
+    """Parse a <time datetime> value: (naive local datetime, all_day), or None."""
+    try:
+        if len(value) == 10:
+            return datetime.fromisoformat(value), True
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed, False
+
+
+def events_from_html(html: str, parser: DateParser) -> list[ParsedEvent]:
+    """
+    Events from an HTML clipboard payload (mail bodies, tables).
+
+    Rows with a <time datetime> element are exact; other rows go through
+    the line parser with their real cell/row boundaries instead of the
+    flattened plain text.
+    """
+    rows = _HtmlRows()
+    rows.feed(html)
+    rows.close()
+
+    events = []
+    for cells, times in rows.rows:
+        text = ' '.join(cells)
+        exact = _parse_time_attr(times[0][0]) if times else None
+        if exact is None:
+            events.extend(parser.parse_lines([text]))
+            continue
+        start, all_day = exact
+        title = text.replace(times[0][1], ' ') if times[0][1] else text
+        title = ' '.join(title.split())
+        events.append(ParsedEvent(
+            title=title or "新しい予定",
+            start_date=start,
+            all_day=all_day,
+            description=text,
+            source_text=text,
+        ))
+    return events
+
+
+def parse_structured(kind: str, payload: str, parser: DateParser) -> list[ParsedEvent]:
+    """Parse a text/calendar or text/html clipboard payload into events."""
+    if kind == 'text/calendar':
+        from .ics import iter_ics_events
+        return list(iter_ics_events(payload.splitlines()))
+    if kind == 'text/html':
+        return events_from_html(payload, parser)
+    return []
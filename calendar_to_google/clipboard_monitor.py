@@ -3,22 +3,36 @@
 import sys
 import threading
 import time
-import pyperclip
+
+from .clipboard_formats import SystemClipboard, structured_target
+from .metrics import metrics
 
 
 class ClipboardMonitor:
     """Monitor clipboard changes across platforms."""
 
-    def __init__(self, callback):
+    def __init__(self, callback, recorder=None, policy=None, structured_callback=None, backend=None):
         """
         Initialize clipboard monitor.
 
         Args:
-            callback: Function to call when clipboard changes (receives clipboard text)
+            callback: Function to call when clipboard changes
+                      (receives clipboard text and its ClipboardSource or None)
+            recorder: Optional ClipboardRecorder logging every change event
+            policy: Optional SourcePolicy; copies from denied apps are not read
+            structured_callback: Optional function receiving (kind, payload, source)
+                      when a text/calendar or text/html target is on offer; returns
+                      True if it found events (the plain text is then not delivered)
+            backend: ClipboardBackend to read from (default: the system clipboard)
         """
         self.callback = callback
+        self.recorder = recorder
+        self.policy = policy
+        self.structured_callback = structured_callback
+        self.backend = backend or SystemClipboard()
         self._running = False
         self._last_content = ""
+        self._last_change: int | None = None
         self._monitor_thread = None
         self._hotkey_available = False
 
@@ -28,8 +42,9 @@ class ClipboardMonitor:
             return
 
         self._running = True
+        self._last_change = self.backend.change_count()
         try:
-            self._last_content = pyperclip.paste()
+            self._last_content = self.backend.read_text()
         except Exception:
             self._last_content = ""
 
@@ -59,18 +74,85 @@ class ClipboardMonitor:
         """Poll clipboard for changes."""
         while self._running:
             try:
-                current_content = pyperclip.paste()
-                if current_content and current_content.strip():
-                    if current_content != self._last_content:
-                        self._last_content = current_content
-                        self.callback(current_content)
+                self._check_clipboard()
             except Exception:
                 pass
             time.sleep(0.5)  # Check every 500ms
 
+    def _check_clipboard(self):
+        """Read the clipboard if it changed and its source app is allowed."""
+        change = self.backend.change_count()
+        if change is not None:
+            # 変更番号がある環境（Windows/macOS）: 内容を読む前に送信元と形式を確認する
+            if change == self._last_change:
+                return
+            self._last_change = change
+            source = self._allowed_source()
+            if source is False or self._deliver_structured(source):
+                return
+            content = self._read()
+        else:
+            # 変更番号がない環境（X11/Wayland）: 変化したときだけ送信元と形式を調べる
+            content = self._read()
+            if content == self._last_content:
+                return
+            source = self._allowed_source()
+            if source is False or self._deliver_structured(source):
+                self._last_content = content
+                return
+        self._handle_content(content, source)
+
+    def _allowed_source(self):
+        """
+        Probe source app and targets once per change.
+
+        Returns the ClipboardSource (None if nothing needs it), or False if
+        the policy denies it.
+        """
+        if self.policy is None and self.structured_callback is None:
+            return None
+        source = self.backend.probe()
+        if self.policy is not None and not self.policy.allows(source):
+            metrics.incr('clipboard.ignored')
+            return False
+        return source
+
+    def _deliver_structured(self, source) -> bool:
+        """Hand a text/calendar or text/html payload to structured_callback; True if it used it."""
+        if self.structured_callback is None or source is None:
+            return False
+        found = structured_target(source.targets)
+        if found is None:
+            return False
+        target, kind = found
+        with metrics.timer('clipboard.read_structured'):
+            payload = self.backend.read(target)
+        if not payload or not self.structured_callback(kind, payload, source):
+            return False
+        metrics.incr('clipboard.structured')
+        return True
+
+    def _read(self) -> str:
+        with metrics.timer('clipboard.read'):
+            return self.backend.read_text()
+
+    def _handle_content(self, content: str, source=None):
+        """Deliver clipboard content to the callback if it changed."""
+        if not content or not content.strip():
+            return
+        if content == self._last_content:
+            return
+        self._last_content = content
+        metrics.incr('clipboard.changes')
+        if self.recorder:
+            self.recorder.record(content)
+        self.callback(content, source)
+
     def stop(self):
         """Stop monitoring."""
         self._running = False
+        if self.recorder:
+            self.recorder.close()
         if self._hotkey_available:
             try:
                 import keyboard
@@ -87,11 +169,7 @@ class ClipboardMonitor:
         def check_clipboard():
             time.sleep(0.1)
             try:
-                current_content = pyperclip.paste()
-                if current_content and current_content.strip():
-                    if current_content != self._last_content:
-                        self._last_content = current_content
-                        self.callback(current_content)
+                self._check_clipboard()
             except Exception as e:
                 print(f"Clipboard error: {e}")
 
@@ -100,6 +178,6 @@ class ClipboardMonitor:
     def get_current_clipboard(self):
         """Get current clipboard content."""
         try:
-            return pyperclip.paste()
+            return self.backend.read_text()
         except Exception:
             return ""
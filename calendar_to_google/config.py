@@ -0,0 +1,52 @@
+"""Shared configuration paths and config-file helpers."""
+
+import os
+import tempfile
+from pathlib import Path
+
+# Config directory
+CONFIG_DIR = Path.home() / '.calendar-to-google'
+CREDENTIALS_FILE = CONFIG_DIR / 'credentials.json'
+TOKEN_FILE = CONFIG_DIR / 'token.json'
+
+# Named account profiles live in ACCOUNTS_DIR/<name>/
+ACCOUNTS_DIR = CONFIG_DIR / 'accounts'
+DEFAULT_ACCOUNT = 'default'
+
+
+def account_paths(account: str = DEFAULT_ACCOUNT) -> tuple[Path, Path]:
+    """
+    Return (credentials file, token file) for an account profile.
+
+    The default account keeps the original top-level files. Other accounts
+    get their own token; they share the OAuth client credentials unless
+    their profile directory has its own credentials.json.
+    """
+    if account == DEFAULT_ACCOUNT:
+        return CREDENTIALS_FILE, TOKEN_FILE
+    profile = ACCOUNTS_DIR / account
+    credentials = profile / 'credentials.json'
+    return (credentials if credentials.exists() else CREDENTIALS_FILE), profile / 'token.json'
+
+
+def list_accounts() -> list[str]:
+    """Return the default account followed by every named profile."""
+    names = [DEFAULT_ACCOUNT]
+    if ACCOUNTS_DIR.is_dir():
+        names.extend(sorted(p.name for p in ACCOUNTS_DIR.iterdir() if p.is_dir() and p.name != DEFAULT_ACCOUNT))
+    return names
+
+
+def write_atomic(path: Path, data: str):
+    """Write text to path via a uniquely named temporary file and rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # 一時ファイル名は呼び出しごとに一意にし、同時に書き込んでも互いの途中のファイルを置き換えない
+    f = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=path.parent,
+                                    prefix=path.name + '.', suffix='.tmp', delete=False)
+    try:
+        with f:
+            f.write(data)
+        os.replace(f.name, path)
+    except BaseException:
+        os.unlink(f.name)
+        raise
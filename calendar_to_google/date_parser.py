@@ -1,10 +1,37 @@
 """Date and event parsing from text."""
 
+import os
 import re
+import time
 from datetime import datetime, timedelta
-from dateutil import parser as dateutil_parser
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional
+
+from .fallback import FallbackDateTokenizer
+from .locales import KeywordHit, compile_grammar, fold_text
+from .metrics import metrics
+from .recurrence import detect_recurrence, first_occurrence
+
+if TYPE_CHECKING:
+    from .explain import ParseTrace
+
+# Detections scored below this do not interrupt the user (see min_confidence())
+CONFIDENCE_ENV = 'CALENDAR_TO_GOOGLE_MIN_CONFIDENCE'
+DEFAULT_MIN_CONFIDENCE = 0.5
+DEFAULT_TOP_K = 3
+# Base scores of keyword and recurrence-anchor dates (date rules carry their own)
+KEYWORD_CONFIDENCE = {'relative': 0.95, 'weekday': 0.9}
+RECURRENCE_CONFIDENCE = 0.8
+# Context bonuses/penalties
+TIME_BONUS = 0.2
+WEEKDAY_BONUS = 0.3
+PROSE_BONUS = 0.2
+NUMBER_PENALTY = 0.3
+POSITION_PENALTY = 0.05
+# Max characters between a date and a time that still count as "nearby"
+TIME_WINDOW = 6
+# Max characters between a date and a weekday qualifier, e.g. 12/25(水)
+WEEKDAY_WINDOW = 3
 
 
 @dataclass
@@ -15,71 +42,87 @@ class ParsedEvent:
     end_date: Optional[datetime] = None
     all_day: bool = True
     description: str = ""
+    source_text: str = ""
+    recurrence: Optional[str] = None  # 'RRULE:...' line
+    confidence: float = 1.0  # 0-1, how sure the parser is that this is a date
+    source_app: Optional[str] = None  # app the text was copied from (ClipboardSource.name)
+
+
+@dataclass(frozen=True)
+class DateCandidate:
+    """A possible event date in text, scored by its rule and context."""
+    date: datetime
+    span: Optional[tuple[int, int]]  # None for a recurrence anchor
+    confidence: float
+    source: str  # 'relative', 'weekday', a DatePattern kind, 'recurrence' or 'fallback'
+    priority: int  # tie-break between equal confidences (lower wins)
+
+
+def min_confidence() -> float:
+    """Return the detection threshold set via CONFIDENCE_ENV (DEFAULT_MIN_CONFIDENCE if unset)."""
+    try:
+        return min(max(float(os.environ.get(CONFIDENCE_ENV, DEFAULT_MIN_CONFIDENCE)), 0.0), 1.0)
+    except ValueError:
+        return DEFAULT_MIN_CONFIDENCE
+
+
+_QUALIFIER_RE = re.compile(r'\s*[(（][^()（）]{1,4}[)）]')
+_DIGITS_RE = re.compile(r'\d+')
+
+
+def _gap(a: tuple[int, int], b: tuple[int, int]) -> int:
+    """Characters between two spans (0 if they touch or overlap)."""
+    return max(a[0] - b[1], b[0] - a[1], 0)
+
+
+def _in_prose(text: str, start: int, end: int, latin: bool = True) -> bool:
+    """
+    True if a match sits next to a word (締切12/25の..., 12/25 忘年会, Lunch 11/3).
+
+    A weekday qualifier after the match, as in 12/25(水) 忘年会, is skipped.
+    With latin=False only non-ASCII words count.
+    """
+    before = text[:start].rstrip()[-1:]
+    qualifier = _QUALIFIER_RE.match(text, end)
+    after = text[qualifier.end() if qualifier else end:].lstrip()[:1]
+    return any(ch.isalpha() and (latin or not ch.isascii()) for ch in (before, after))
+
+
+def _fraction_like(match: str) -> bool:
+    """True for single-digit pairs such as 3/4 or 2-3, which are more often fractions or scores."""
+    return all(len(number) == 1 for number in _DIGITS_RE.findall(match))
+
+
+def _embedded_in_number(text: str, start: int, end: int) -> bool:
+    """True if a match looks like part of a version, decimal or percentage (v1.2/3, 3/4%)."""
+    before = text[start - 1] if start > 0 else ''
+    after = text[end] if end < len(text) else ''
+    if before.isascii() and (before.isalnum() or before == '.'):
+        return True
+    if after == '%' or (after.isascii() and after.isalpha()):
+        return True
+    return after == '.' and text[end + 1:end + 2].isdigit()
 
 
 class DateParser:
     """Parse dates and events from text."""
 
-    # 日本語の日付パターン
-    JP_DATE_PATTERNS = [
-        # 2024年12月25日
-        r'(\d{4})年(\d{1,2})月(\d{1,2})日',
-        # 12月25日
-        r'(\d{1,2})月(\d{1,2})日',
-        # 2024/12/25 or 2024-12-25
-        r'(\d{4})[/\-](\d{1,2})[/\-](\d{1,2})',
-        # 12/25 or 12-25
-        r'(\d{1,2})[/\-](\d{1,2})',
-    ]
-
-    # English Month Names
-    EN_MONTHS = {
-        'jan': 1, 'january': 1,
-        'feb': 2, 'february': 2,
-        'mar': 3, 'march': 3,
-        'apr': 4, 'april': 4,
-        'may': 5,
-        'jun': 6, 'june': 6,
-        'jul': 7, 'july': 7,
-        'aug': 8, 'august': 8,
-        'sep': 9, 'sept': 9, 'september': 9,
-        'oct': 10, 'october': 10,
-        'nov': 11, 'november': 11,
-        'dec': 12, 'december': 12
-    }
-
-    # 時間パターン
-    TIME_PATTERNS = [
-        # 14:30 or 14時30分
-        r'(\d{1,2})[:\u6642](\d{2})(?:\u5206)?',
-        # 14時
-        r'(\d{1,2})\u6642(?!\d)',
-        # 2pm, 2:30pm
-        r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)',
-    ]
-
-    # 日本語の相対日付
-    JP_RELATIVE_DATES = {
-        '今日': 0,
-        '本日': 0,
-        '明日': 1,
-        '明後日': 2,
-        'あさって': 2,
-        '昨日': -1,
-        '一昨日': -2,
-        'おととい': -2,
-    }
-
-    # 曜日
-    JP_WEEKDAYS = {
-        '月曜': 0, '月曜日': 0,
-        '火曜': 1, '火曜日': 1,
-        '水曜': 2, '水曜日': 2,
-        '木曜': 3, '木曜日': 3,
-        '金曜': 4, '金曜日': 4,
-        '土曜': 5, '土曜日': 5,
-        '日曜': 6, '日曜日': 6,
-    }
+    _TITLE_SYMBOLS_RE = re.compile(r'[（）()\[\]【】\s]+')
+
+    def __init__(self, title_cache=None, locales: Optional[Iterable[str]] = None,
+                 clock: Callable[[], datetime] = datetime.now):
+        """
+        Initialize parser.
+
+        Args:
+            title_cache: Optional TitleTemplateCache with user-corrected titles
+            locales: Locale grammars to use (default: all registered)
+            clock: Returns the current time relative dates are resolved against
+        """
+        self.title_cache = title_cache
+        self.clock = clock
+        self.grammar = compile_grammar(locales)
+        self.fallback = FallbackDateTokenizer(self.grammar)
 
     def parse(self, text: str) -> Optional[ParsedEvent]:
         """
@@ -95,224 +138,423 @@ class DateParser:
         if not text:
             return None
 
-        # 日付を抽出
-        date_info = self._extract_date(text)
-        if not date_info:
-            return None
+        with metrics.timer('parse.total'):
+            return self._parse(text)
 
-        start_date, date_str = date_info
+    def parse_all(self, text: str) -> list[ParsedEvent]:
+        """
+        Parse each line of text as a separate event.
 
-        # 時間を抽出
-        time_info = self._extract_time(text)
-        all_day = True
-        if time_info:
-            start_hour, start_minute = time_info
-            start_date = start_date.replace(hour=start_hour, minute=start_minute)
-            all_day = False
-
-        # タイトルを抽出（日付部分を除いた残り）
-        title = self._extract_title(text, date_str)
-
-        return ParsedEvent(
-            title=title if title else "新しい予定",
-            start_date=start_date,
-            all_day=all_day,
-            description=text if title else "",
-        )
-
-    def _extract_date(self, text: str) -> Optional[tuple[datetime, str]]:
-        """Extract date from text."""
-        now = datetime.now()
-
-        # 相対日付をチェック
-        for jp_date, days_offset in self.JP_RELATIVE_DATES.items():
-            if jp_date in text:
-                date = now + timedelta(days=days_offset)
-                return date.replace(hour=0, minute=0, second=0, microsecond=0), jp_date
-
-        # 曜日をチェック
-        for weekday_name, weekday_num in self.JP_WEEKDAYS.items():
-            if weekday_name in text:
-                days_ahead = weekday_num - now.weekday()
-                if days_ahead <= 0:
-                    days_ahead += 7
-                date = now + timedelta(days=days_ahead)
-                return date.replace(hour=0, minute=0, second=0, microsecond=0), weekday_name
-
-        # --- English Date Patterns ---
-        
-        # Month DD, YYYY (e.g., December 25, 2024)
-        # Month DD (e.g., Dec 25)
-        month_names = '|'.join(self.EN_MONTHS.keys())
-        pattern = r'(?i)\b(' + month_names + r')\.?\s+(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(\d{4}))?'
-        match = re.search(pattern, text)
-        if match:
-            month_str = match.group(1).lower()
-            day = int(match.group(2))
-            year = int(match.group(3)) if match.group(3) else now.year
-            month = self.EN_MONTHS.get(month_str)
-            
-            if month:
-                try:
-                    date = datetime(year, month, day)
-                    if not match.group(3) and date < now:
-                         date = datetime(year + 1, month, day)
-                    return date, match.group(0)
-                except ValueError:
-                    pass
-
-        # DD Month YYYY (e.g., 25 December 2024)
-        # DD Month (e.g., 25 Dec)
-        pattern = r'(?i)\b(\d{1,2})(?:st|nd|rd|th)?\s+(' + month_names + r')\.?(?:,?\s+(\d{4}))?'
-        match = re.search(pattern, text)
-        if match:
-            day = int(match.group(1))
-            month_str = match.group(2).lower()
-            year = int(match.group(3)) if match.group(3) else now.year
-            month = self.EN_MONTHS.get(month_str)
-
-            if month:
-                try:
-                    date = datetime(year, month, day)
-                    if not match.group(3) and date < now:
-                         date = datetime(year + 1, month, day)
-                    return date, match.group(0)
-                except ValueError:
-                    pass
-
-        # --- Japanese / Numeric Patterns ---
-
-        # 2024年12月25日
-        match = re.search(r'(\d{4})年(\d{1,2})月(\d{1,2})日', text)
-        if match:
-            year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
-            try:
-                return datetime(year, month, day), match.group(0)
-            except ValueError:
-                pass
-
-        # 12月25日 (年は現在年を使用)
-        match = re.search(r'(\d{1,2})月(\d{1,2})日', text)
-        if match:
-            month, day = int(match.group(1)), int(match.group(2))
-            year = now.year
-            try:
-                date = datetime(year, month, day)
-                if date < now:
-                    date = datetime(year + 1, month, day)
-                return date, match.group(0)
-            except ValueError:
-                pass
-
-        # 2024/12/25 or 2024-12-25
-        match = re.search(r'(\d{4})[/\-](\d{1,2})[/\-](\d{1,2})', text)
-        if match:
-            year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
-            try:
-                return datetime(year, month, day), match.group(0)
-            except ValueError:
-                pass
-
-        # 12/25 or 12-25 (US style default: MM/DD)
-        # Also handles 25/12 (UK style if day > 12)
-        match = re.search(r'(\d{1,2})[/\-](\d{1,2})', text)
-        if match:
-            p1, p2 = int(match.group(1)), int(match.group(2))
-            year = now.year
-            
-            # Try MM/DD first (US style)
-            month, day = p1, p2
-            valid_us = False
-            try:
-                datetime(year, month, day)
-                valid_us = True
-            except ValueError:
-                pass
-                
-            # If US invalid (e.g. 25/12), try UK (DD/MM)
-            if not valid_us:
-                day, month = p1, p2
-                try:
-                    datetime(year, month, day)
-                except ValueError:
-                    # Both invalid
-                    return None
-            
-            # If both valid (e.g. 01/02), stick to US (MM/DD) as per plan
-            
-            try:
-                date = datetime(year, month, day)
-                if date < now:
-                    date = datetime(year + 1, month, day)
-                return date, match.group(0)
-            except ValueError:
-                pass
-
-        # dateutilでパース (Last resort)
-        try:
-            parsed = dateutil_parser.parse(text, fuzzy=True)
-            return parsed, ""
-        except Exception:
-            pass
+        Args:
+            text: Multi-line text (e.g. a pasted schedule)
 
-        return None
+        Returns:
+            ParsedEvents for every line containing a date, in order
+        """
+        return list(self.parse_lines(self.grammar.candidate_lines(text)))
 
-    def _extract_time(self, text: str) -> Optional[tuple[int, int]]:
-        """Extract time from text."""
-        # 14:30 or 14時30分
-        match = re.search(r'(\d{1,2})[:\u6642](\d{2})(?:\u5206)?', text)
-        if match:
-            hour, minute = int(match.group(1)), int(match.group(2))
-            if 0 <= hour < 24 and 0 <= minute < 60:
-                return hour, minute
-
-        # 14時
-        match = re.search(r'(\d{1,2})\u6642(?!\d)', text)
-        if match:
-            hour = int(match.group(1))
-            if 0 <= hour < 24:
-                return hour, 0
-
-        # 2pm, 2:30pm
-        match = re.search(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)', text, re.IGNORECASE)
-        if match:
-            hour = int(match.group(1))
-            minute = int(match.group(2)) if match.group(2) else 0
-            ampm = match.group(3).lower()
-            
-            if ampm == 'pm' and hour < 12:
-                hour += 12
-            elif ampm == 'am' and hour == 12:
-                hour = 0
-                
-            if 0 <= hour < 24 and 0 <= minute < 60:
-                return hour, minute
+    def parse_lines(self, lines: Iterable[str]) -> Iterator[ParsedEvent]:
+        """
+        Lazily parse each line as a separate event.
 
-        return None
+        Args:
+            lines: Any iterable of lines (e.g. CompiledGrammar.candidate_lines)
 
-    def _extract_title(self, text: str, date_str: str) -> str:
-        """Extract event title from text."""
-        title = text
+        Yields:
+            ParsedEvents for every line containing a date, in order
+        """
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            # 行単位では最後の手段（FallbackDateTokenizer による推測）を使わない（番号などを日付と誤認するため）
+            with metrics.timer('parse.total'):
+                event = self._parse(line, fuzzy=False)
+            if event:
+                yield event
+
+    def parse_candidates(self, text: str, top_k: int = DEFAULT_TOP_K) -> list[ParsedEvent]:
+        """
+        Parse text into its most likely readings.
+
+        Args:
+            text: Text containing date/event information
+            top_k: Maximum number of readings to return
+
+        Returns:
+            Up to top_k ParsedEvents (one per distinct date), most confident first
+        """
+        text = text.strip()
+        if not text:
+            return []
+
+        with metrics.timer('parse.total'):
+            return self._parse_ranked(text, True, top_k)
+
+    def explain(self, text: str, fuzzy: bool = True) -> 'ParseTrace':
+        """
+        Parse text and record every rule attempted (explain mode).
+
+        Each date and time rule is re-run and timed on its own, and every
+        match of the keyword, date, time, recurrence, fallback and title
+        steps is marked selected, candidate or rejected with the reason.
+        parse() and the other entry points are not instrumented, so this
+        costs nothing unless called.
+
+        Args:
+            text: Text to parse
+            fuzzy: Allow the fallback tokenizer, as parse() does (parse_lines does not)
+
+        Returns:
+            ParseTrace (see explain.py); its event is what parse() returns
+        """
+        from .explain import CANDIDATE, REJECTED, SELECTED, ParseTrace, RuleAttempt, RuleMatch
 
-        # 日付文字列を除去
-        if date_str:
-            title = title.replace(date_str, '')
+        text = text.strip()
+        started = time.perf_counter()
+        events = self._parse_ranked(text, fuzzy, 1) if text else []
+        trace = ParseTrace(text, events[0] if events else None, time.perf_counter() - started)
+        if not text:
+            return trace
+
+        clock = time.perf_counter
+        now = self.clock()
+        folded = fold_text(text)
+
+        def timed(stage: str, func, *args):
+            begin = clock()
+            result = func(*args)
+            trace.stages[stage] = trace.stages.get(stage, 0.0) + clock() - begin
+            return result
+
+        # 候補（DateCandidate）と照合するための (source, span) -> RuleMatch
+        readings: dict[tuple[str, Optional[tuple[int, int]]], RuleMatch] = {}
+
+        # キーワード（1つのオートマトンなので規則ごとの時間は分けられない）
+        hits = timed('keyword', self.grammar.find_keywords, text)
+        keywords = RuleAttempt('keyword', 'keywords', trace.stages['keyword'])
+        for hit in hits:
+            match = RuleMatch((hit.start, hit.end), text[hit.start:hit.end],
+                              self.grammar.resolve_keyword(hit, now).strftime('%Y-%m-%d'))
+            readings[(hit.kind, (hit.start, hit.end))] = match
+            keywords.matches.append(match)
+        trace.attempts.append(keywords)
+
+        def rule_attempts(stage: str, rules: list, merged: list, label) -> list:
+            """Time each rule alone; mark matches the merged scan did not keep as rejected."""
+            owners = {(id(rule), match.span()): label(rule) for rule, match, _ in merged}
+            attempts = []
+            for index, rule in enumerate(rules):
+                self.grammar.rule_regex(rule)  # コンパイルは計測に含めない
+                begin = clock()
+                found = self.grammar.scan_rule(rule, text, now, folded)
+                attempt = RuleAttempt(stage, f'{stage}.{rule.kind}.{index}', clock() - begin, rule.regex)
+                for match, value in found:
+                    span = match.span()
+                    if isinstance(value, datetime):
+                        value = value.strftime('%Y-%m-%d')
+                    elif value is not None:
+                        value = f'{value[0]:02d}:{value[1]:02d}'
+                    entry = RuleMatch(span, match.group(0), value)
+                    if value is None:
+                        entry.outcome, entry.reason = REJECTED, f"not a valid {stage}"
+                    elif (id(rule), span) not in owners:
+                        owner = next((name for (_, s), name in owners.items() if s[0] < span[1] and span[0] < s[1]),
+                                     "an earlier match")
+                        entry.outcome, entry.reason = REJECTED, f"overlaps {owner} in the merged scan"
+                    else:
+                        readings[(rule.kind, span)] = entry
+                    attempt.matches.append(entry)
+                attempts.append(attempt)
+            return attempts
+
+        date_index = {id(rule): i for i, rule in enumerate(self.grammar.date_rules)}
+        time_index = {id(rule): i for i, rule in enumerate(self.grammar.time_rules)}
+        dates = timed('date', self.grammar.find_dates, text, now)
+        trace.attempts.extend(rule_attempts('date', self.grammar.date_rules, dates,
+                                            lambda r: f'date.{r.kind}.{date_index[id(r)]}'))
+
+        times = timed('time', self.grammar.find_times, text)
+        time_attempts = rule_attempts('time', self.grammar.time_rules, times,
+                                      lambda r: f'time.{r.kind}.{time_index[id(r)]}')
+        trace.attempts.extend(time_attempts)
+        if times:
+            chosen, chosen_match, _ = min(times, key=lambda t: t[0].priority)
+            chosen_name = f'time.{chosen.kind}.{time_index[id(chosen)]}'
+            for rule, match, _ in times:
+                entry = readings[(rule.kind, match.span())]
+                if rule is chosen and match is chosen_match:
+                    entry.outcome = SELECTED
+                else:
+                    entry.outcome, entry.reason = REJECTED, f"{chosen_name} has priority"
+
+        recurrence = timed('recurrence', detect_recurrence, text)
+        repeat = RuleAttempt('recurrence', 'recurrence', trace.stages['recurrence'])
+        if recurrence:
+            index = text.find(recurrence.phrase)
+            repeat.matches.append(RuleMatch((index, index + len(recurrence.phrase)) if index >= 0 else None,
+                                            recurrence.phrase, recurrence.rrule, SELECTED))
+            for hit in hits:
+                readings[(hit.kind, (hit.start, hit.end))].value = \
+                    self._resolve_keyword(text, hit, now, recurrence).strftime('%Y-%m-%d')
+        trace.attempts.append(repeat)
+
+        if fuzzy:
+            # 先に単独で計測する（この後の採点ではキャッシュに当たる）
+            guess = timed('fallback', self.fallback.find, text, now)
+            fallback = RuleAttempt('fallback', 'fallback', trace.stages['fallback'])
+            if guess:
+                date, found = guess
+                entry = RuleMatch((found.start, found.end), text[found.start:found.end],
+                                  date.strftime('%Y-%m-%d'), REJECTED,
+                                  f"not needed: a rule scored {DEFAULT_MIN_CONFIDENCE} or more")
+                readings[('fallback', (found.start, found.end))] = entry
+                fallback.matches.append(entry)
+            trace.attempts.append(fallback)
+
+        scored = timed('rank', self._score_dates, text, hits, dates, times, recurrence, fuzzy)
+        ranked = self._best_per_date(scored)
+        for candidate in scored:
+            entry = readings.get((candidate.source, candidate.span))
+            if entry is None:
+                if candidate.source != 'recurrence':
+                    continue
+                # 日付のない繰り返し: 今日を起点にした読み
+                entry = RuleMatch(None, "", candidate.date.strftime('%Y-%m-%d'), reason="recurrence anchored to today")
+                repeat.matches.append(entry)
+            entry.confidence = candidate.confidence
+            if ranked and candidate is ranked[0]:
+                entry.outcome, entry.reason = SELECTED, ""
+                if candidate.confidence < min_confidence():
+                    entry.reason = f"below {CONFIDENCE_ENV} ({min_confidence()}): the tray app ignores it"
+            elif any(candidate is r for r in ranked):
+                entry.outcome, entry.reason = CANDIDATE, f"ranked below {ranked[0].source}"
+            else:
+                entry.outcome, entry.reason = REJECTED, "same date as a higher-scoring reading"
+        for hit in hits:
+            entry = readings[(hit.kind, (hit.start, hit.end))]
+            if entry.confidence is None:
+                entry.outcome, entry.reason = REJECTED, "weekday written next to a date"
+
+        if ranked:
+            best = ranked[0]
+            spans = self._title_spans(text, hits, times, recurrence)
+            title = timed('title', self._extract_title, text, spans + [best.span] if best.span else spans)
+            attempt = RuleAttempt('title', 'title', trace.stages['title'])
+            attempt.matches.append(RuleMatch(None, title, title or "新しい予定", SELECTED,
+                                             "" if title else "nothing left after removing dates and times"))
+            if self.title_cache:
+                cached = timed('title_cache', self.title_cache.lookup, text)
+                if cached:
+                    attempt.matches[0].outcome = REJECTED
+                    attempt.matches[0].reason = "replaced by a corrected title from the cache"
+                    trace.attempts.append(RuleAttempt('title', 'title_cache', trace.stages['title_cache'],
+                                                      matches=[RuleMatch(None, cached, cached, SELECTED)]))
+            trace.attempts.append(attempt)
+        return trace
+
+    def _parse(self, text: str, fuzzy: bool = True) -> Optional[ParsedEvent]:
+        """Run the date, time and title stages on stripped text."""
+        events = self._parse_ranked(text, fuzzy, 1)
+        return events[0] if events else None
+
+    def _parse_ranked(self, text: str, fuzzy: bool, top_k: int) -> list[ParsedEvent]:
+        """Build ParsedEvents for the top_k date candidates of stripped text."""
+        # キーワード（相対日付・曜日）は1回だけ検索し、日付抽出とタイトル抽出で共有する
+        with metrics.timer('parse.date'):
+            hits = self.grammar.find_keywords(text)
+            dates = self.grammar.find_dates(text, self.clock())
+
+        # 繰り返し（毎週月曜 / every Tuesday など）
+        with metrics.timer('parse.recurrence'):
+            recurrence = detect_recurrence(text)
 
-        # 時間を除去
-        title = re.sub(r'\d{1,2}[:\u6642]\d{2}(?:\u5206)?', '', title)
-        title = re.sub(r'\d{1,2}\u6642(?!\d)', '', title)
-        title = re.sub(r'\d{1,2}(?::\d{2})?\s*(?:am|pm)', '', title, flags=re.IGNORECASE)
+        # 時間を抽出
+        with metrics.timer('parse.time'):
+            times = self.grammar.find_times(text)
+            time_info = self._extract_time(times)
+
+        with metrics.timer('parse.date'):
+            candidates = self._rank_dates(text, hits, dates, times, recurrence, fuzzy)
+
+        if not candidates:
+            metrics.incr('parse.no_date')
+            return []
+
+        # タイトル（日付・時間・キーワード・繰り返し表現を除いた残り）の共通部分
+        with metrics.timer('parse.title'):
+            cached_title = self.title_cache.lookup(text) if self.title_cache else None
+            if cached_title:
+                metrics.incr('parse.title_cache_hits')
+            spans = self._title_spans(text, hits, times, recurrence)
+
+        events = []
+        for candidate in candidates[:top_k]:
+            start_date = candidate.date
+            if recurrence:
+                start_date = first_occurrence(start_date, recurrence.rrule)
+
+            all_day = True
+            if time_info:
+                start_hour, start_minute = time_info
+                start_date = start_date.replace(hour=start_hour, minute=start_minute)
+                all_day = False
+
+            title = cached_title
+            if not title:
+                with metrics.timer('parse.title'):
+                    title = self._extract_title(text, spans + [candidate.span] if candidate.span else spans)
+
+            events.append(ParsedEvent(
+                title=title if title else "新しい予定",
+                start_date=start_date,
+                all_day=all_day,
+                description=text if title else "",
+                source_text=text,
+                recurrence=recurrence.rrule if recurrence else None,
+                confidence=candidate.confidence,
+            ))
+
+        metrics.incr('parse.detected')
+        return events
+
+    def _rank_dates(self, text: str, hits: list[KeywordHit], dates: list, times: list,
+                    recurrence, fuzzy: bool = True) -> list[DateCandidate]:
+        """Score every date reading of text and sort them, best first (see _score_dates)."""
+        return self._best_per_date(self._score_dates(text, hits, dates, times, recurrence, fuzzy))
+
+    def _score_dates(self, text: str, hits: list[KeywordHit], dates: list, times: list,
+                     recurrence, fuzzy: bool = True) -> list[DateCandidate]:
+        """
+        Score every date reading of text.
 
-        # 相対日付を除去
-        for jp_date in self.JP_RELATIVE_DATES:
-            title = title.replace(jp_date, '')
+        All keyword and date-rule matches from the single scan are kept and
+        scored by their rule and context: a nearby time or a matching
+        weekday (12/25(水)) raises the score, a bare MM/DD embedded in a
+        version number or percentage lowers it (written next to a word
+        raises it, unless it reads like a fraction such as 3/4), and later
+        positions lose a little.
+
+        Returns:
+            DateCandidates in scan order (several may share a date)
+        """
+        now = self.clock()
+        length = max(len(text), 1)
+        time_spans = [match.span() for _, match, _ in times]
+        date_spans = [match.span() for _, match, _ in dates]
+
+        def near_time(span: tuple[int, int]) -> bool:
+            return any(_gap(span, t) <= TIME_WINDOW for t in time_spans)
+
+        def score(base: float, span: tuple[int, int]) -> float:
+            if near_time(span):
+                base += TIME_BONUS
+            base -= POSITION_PENALTY * span[0] / length
+            return round(min(max(base, 0.0), 1.0), 3)
+
+        candidates = []
+        weekday_hits = []
+        for hit in hits:
+            span = (hit.start, hit.end)
+            if hit.kind == 'weekday' and any(_gap(span, d) <= WEEKDAY_WINDOW for d in date_spans):
+                # 日付に添えた曜日（12/25(水)）は日付の補足として扱う
+                weekday_hits.append(hit)
+                continue
+            date = self._resolve_keyword(text, hit, now, recurrence)
+            priority = -2 if hit.kind == 'relative' else -1
+            candidates.append(DateCandidate(date, span, score(KEYWORD_CONFIDENCE[hit.kind], span),
+                                            hit.kind, priority))
+
+        for rule, match, date in dates:
+            span = match.span()
+            base = rule.confidence
+            if rule.kind == 'numeric_md':
+                if _embedded_in_number(text, *span):
+                    base -= NUMBER_PENALTY
+                elif _in_prose(text, *span, latin=not _fraction_like(match.group(0))):
+                    base += PROSE_BONUS
+            for hit in weekday_hits:
+                if _gap(span, (hit.start, hit.end)) <= WEEKDAY_WINDOW and hit.value[0] == date.weekday():
+                    base += WEEKDAY_BONUS
+                    break
+            candidates.append(DateCandidate(date, span, score(base, span), rule.kind, rule.priority))
+
+        # 日付のない繰り返し表現（毎週月曜 15時）は今日を起点にする
+        if recurrence and all(c.confidence < DEFAULT_MIN_CONFIDENCE for c in candidates):
+            anchored = recurrence.weekday is not None or recurrence.monthday is not None
+            if anchored or (time_spans and not recurrence.needs_date):
+                today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+                candidates.append(DateCandidate(today, None, RECURRENCE_CONFIDENCE, 'recurrence', 500))
+
+        # 最後の手段: 長さ制限・信頼度付きのトークナイザで推測（結果はキャッシュ）
+        if fuzzy and all(c.confidence < DEFAULT_MIN_CONFIDENCE for c in candidates):
+            with metrics.timer('parse.fallback'):
+                guess = self.fallback.find(text, now)
+            if guess:
+                date, match = guess
+                span = (match.start, match.end)
+                candidates.append(DateCandidate(date, span, score(match.confidence, span), 'fallback', 1000))
+
+        return candidates
+
+    def _resolve_keyword(self, text: str, hit: KeywordHit, now: datetime, recurrence) -> datetime:
+        """
+        Date of a keyword hit.
+
+        A bare weekday inside the recurrence phrase (毎週水曜, every Wednesday)
+        is the first occurrence of the series, so it may be today; elsewhere
+        a weekday means the next one (grammar.resolve_keyword).
+        """
+        if recurrence and hit.kind == 'weekday' and hit.value[1] is None:
+            index = text.find(recurrence.phrase)
+            if index >= 0 and index <= hit.start and hit.end <= index + len(recurrence.phrase):
+                today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+                return today + timedelta(days=(hit.value[0] - now.weekday()) % 7)
+        return self.grammar.resolve_keyword(hit, now)
+
+    @staticmethod
+    def _best_per_date(candidates: list[DateCandidate]) -> list[DateCandidate]:
+        """Keep the best candidate of each date, sorted by confidence, then rule priority."""
+        best: dict[datetime, DateCandidate] = {}
+        for candidate in candidates:
+            current = best.get(candidate.date)
+            if current is None or (-candidate.confidence, candidate.priority) < (-current.confidence, current.priority):
+                best[candidate.date] = candidate
+        return sorted(best.values(), key=lambda c: (-c.confidence, c.priority))
+
+    @staticmethod
+    def _extract_time(times: list) -> Optional[tuple[int, int]]:
+        """Pick the highest-priority time from find_times() results."""
+        if times:
+            rule, match, value = min(times, key=lambda t: t[0].priority)
+            return value
+        return None
 
-        # 曜日を除去
-        for weekday in self.JP_WEEKDAYS:
-            title = title.replace(weekday, '')
+    @staticmethod
+    def _title_spans(text: str, hits: list[KeywordHit], times: list, recurrence) -> list[tuple[int, int]]:
+        """Spans cut from every title: keywords, times and the recurrence phrase."""
+        spans = [(h.start, h.end) for h in hits]
+        spans.extend(match.span() for _, match, _ in times)
+        if recurrence:
+            index = text.find(recurrence.phrase)
+            if index >= 0:
+                spans.append((index, index + len(recurrence.phrase)))
+        return spans
+
+    def _extract_title(self, text: str, spans: list[tuple[int, int]]) -> str:
+        """Extract event title by cutting the given (start, end) spans out of text."""
+        # 日付・時間・相対日付・曜日の位置を除去（重なりはまとめる）
+        parts = []
+        pos = 0
+        for start, end in sorted(spans):
+            if start > pos:
+                parts.append(text[pos:start])
+            pos = max(pos, end)
+        parts.append(text[pos:])
+        title = ' '.join(parts)
 
         # 不要な記号を除去してトリム
-        title = re.sub(r'[（）()\[\]【】\s]+', ' ', title)
+        title = self._TITLE_SYMBOLS_RE.sub(' ', title)
         title = title.strip(' 　、。・')
 
         return title
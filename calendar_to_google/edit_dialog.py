@@ -1,10 +1,22 @@
 """Event edit dialog."""
 
+import time
 import customtkinter as ctk
 from datetime import datetime, timedelta
 from typing import Optional, Any
 from dataclasses import dataclass
 
+from .metrics import metrics
+from .recurrence import describe_rrule, preview_occurrences
+
+DIALOG_WIDTH = 500
+DIALOG_HEIGHT = 550
+
+# Time-to-interactive target for opening the dialog (seconds)
+DIALOG_OPEN_TARGET = 0.05
+
+_theme_applied = False
+
 
 @dataclass
 class EditedEvent:
@@ -15,58 +27,105 @@ class EditedEvent:
     all_day: bool
     description: str
     cancelled: bool = False
+    recurrence: Optional[str] = None
+
+
+def _apply_theme():
+    """Set the global customtkinter theme once per process."""
+    global _theme_applied
+    if not _theme_applied:
+        ctk.set_appearance_mode("System")
+        ctk.set_default_color_theme("blue")
+        _theme_applied = True
 
 
 class EventEditDialog:
-    """Dialog for editing event before adding to calendar."""
+    """
+    Dialog for editing event before adding to calendar.
+
+    The window and widgets are built once (see build()) and kept hidden
+    between uses; show() only re-populates the fields and maps the window.
+    """
 
-    def __init__(self, master: Any, title: str, start_date: datetime, all_day: bool, description: str = ""):
+    def __init__(self, master: Any):
         self.master = master
+        self.window = None
         self.result: Optional[EditedEvent] = None
-        self._title = title
-        self._start_date = start_date
-        self._all_day = all_day
-        self._description = description
-        
-        # Set theme (global setting, safe to call multiple times)
-        ctk.set_appearance_mode("System")
-        ctk.set_default_color_theme("blue")
+        self._recurrence: Optional[str] = None
+        _apply_theme()
+
+    def is_built(self) -> bool:
+        """Check whether the window exists and can be reused."""
+        try:
+            return self.window is not None and bool(self.window.winfo_exists())
+        except Exception:
+            return False
+
+    def build(self):
+        """Create the hidden window and all widgets (idempotent)."""
+        if self.is_built():
+            return
 
-    def show(self) -> Optional[EditedEvent]:
-        """Show the dialog and return edited event."""
         if self.master:
             self.window = ctk.CTkToplevel(self.master)
         else:
             # Fallback if no master provided (though should be avoided in new architecture)
             self.window = ctk.CTk()
-            
+        self.window.withdraw()
+
         self.window.title("Add to Google Calendar")
-        self.window.geometry("500x550")
         self.window.resizable(False, False)
 
         # Center window
-        self.window.update_idletasks()
-        x = (self.window.winfo_screenwidth() - 500) // 2
-        y = (self.window.winfo_screenheight() - 550) // 2
-        self.window.geometry(f"500x550+{x}+{y}")
+        x = (self.window.winfo_screenwidth() - DIALOG_WIDTH) // 2
+        y = (self.window.winfo_screenheight() - DIALOG_HEIGHT) // 2
+        self.window.geometry(f"{DIALOG_WIDTH}x{DIALOG_HEIGHT}+{x}+{y}")
+
+        self._done_var = ctk.BooleanVar(master=self.window, value=False)
+        self.window.protocol("WM_DELETE_WINDOW", self._cancel)
 
+        self._create_widgets()
+
+    def show(self, title: str, start_date: datetime, all_day: bool, description: str = "",
+             recurrence: Optional[str] = None) -> Optional[EditedEvent]:
+        """Populate the dialog, show it modally and return the edited event."""
+        opened = time.perf_counter()
+        self.build()
+        self._populate(title, start_date, all_day, description, recurrence)
+
+        self.result = None
+        self._done_var.set(False)
+
+        self.window.deiconify()
         # Keep on top and force focus
         self.window.attributes('-topmost', True)
         self.window.lift()
         self.window.focus_force()
-        
-        # Ensure it stays on top briefly then releases
-        self.window.after(100, lambda: self.window.attributes('-topmost', False))
-        self.window.after(100, lambda: self.window.attributes('-topmost', True))
+        self.title_entry.focus_set()
+        self.title_entry.select_range(0, "end")
+        self.window.update_idletasks()
 
-        self._create_widgets()
+        elapsed = time.perf_counter() - opened
+        metrics.observe('dialog.open', elapsed)
+        if elapsed > DIALOG_OPEN_TARGET:
+            metrics.incr('dialog.open_slow')
 
         # Make modal
         self.window.grab_set()
-        self.window.wait_window()
-        
+        self.window.wait_variable(self._done_var)
+
+        if self.is_built():
+            self.window.grab_release()
+            self.window.withdraw()
+
         return self.result
 
+    def destroy(self):
+        """Destroy the underlying window."""
+        if self.is_built():
+            self.window.destroy()
+        self.window = None
+
     def _create_widgets(self):
         """Create dialog widgets."""
         main_frame = ctk.CTkFrame(self.window, corner_radius=10)
@@ -74,24 +133,23 @@ class EventEditDialog:
 
         # Title
         ctk.CTkLabel(main_frame, text="Title", font=("Roboto", 14, "bold")).pack(anchor="w", padx=20, pady=(20, 5))
-        self.title_var = ctk.StringVar(value=self._title)
-        title_entry = ctk.CTkEntry(main_frame, textvariable=self.title_var, width=400, font=("Roboto", 12))
-        title_entry.pack(fill="x", padx=20, pady=(0, 10))
-        title_entry.focus_set()
-        
+        self.title_var = ctk.StringVar(master=self.window)
+        self.title_entry = ctk.CTkEntry(main_frame, textvariable=self.title_var, width=400, font=("Roboto", 12))
+        self.title_entry.pack(fill="x", padx=20, pady=(0, 10))
+
         # Date frame
         date_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
         date_frame.pack(fill="x", padx=20, pady=(0, 10))
 
         # Start date
         ctk.CTkLabel(date_frame, text="Date", font=("Roboto", 14, "bold")).pack(anchor="w", pady=(0, 5))
-        
+
         date_row = ctk.CTkFrame(date_frame, fg_color="transparent")
         date_row.pack(fill="x")
 
-        self.year_var = ctk.StringVar(value=str(self._start_date.year))
-        self.month_var = ctk.StringVar(value=str(self._start_date.month))
-        self.day_var = ctk.StringVar(value=str(self._start_date.day))
+        self.year_var = ctk.StringVar(master=self.window)
+        self.month_var = ctk.StringVar(master=self.window)
+        self.day_var = ctk.StringVar(master=self.window)
 
         ctk.CTkEntry(date_row, textvariable=self.year_var, width=60).pack(side="left")
         ctk.CTkLabel(date_row, text="/").pack(side="left", padx=5)
@@ -100,15 +158,14 @@ class EventEditDialog:
         ctk.CTkEntry(date_row, textvariable=self.day_var, width=40).pack(side="left")
 
         # All day checkbox
-        self.all_day_var = ctk.BooleanVar(value=self._all_day)
+        self.all_day_var = ctk.BooleanVar(master=self.window)
         ctk.CTkCheckBox(
             date_row, text="All day", variable=self.all_day_var,
-            command=self._toggle_time, font=("Roboto", 12)
+            command=self._layout_optional, font=("Roboto", 12)
         ).pack(side="left", padx=(30, 0))
 
-        # Time frame
+        # Time frame (packed only for timed events)
         self.time_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-        self.time_frame.pack(fill="x", padx=20, pady=(0, 10))
 
         ctk.CTkLabel(self.time_frame, text="Time", font=("Roboto", 14, "bold")).pack(anchor="w", pady=(0, 5))
 
@@ -116,8 +173,8 @@ class EventEditDialog:
         time_row.pack(fill="x")
 
         # Start time
-        self.start_hour_var = ctk.StringVar(value=str(self._start_date.hour).zfill(2))
-        self.start_min_var = ctk.StringVar(value=str(self._start_date.minute).zfill(2))
+        self.start_hour_var = ctk.StringVar(master=self.window)
+        self.start_min_var = ctk.StringVar(master=self.window)
 
         ctk.CTkLabel(time_row, text="Start:", font=("Roboto", 12)).pack(side="left")
         ctk.CTkEntry(time_row, textvariable=self.start_hour_var, width=40).pack(side="left", padx=(5, 0))
@@ -125,24 +182,25 @@ class EventEditDialog:
         ctk.CTkEntry(time_row, textvariable=self.start_min_var, width=40).pack(side="left")
 
         # End time (default 1 hour later)
-        end_time = self._start_date + timedelta(hours=1)
-        self.end_hour_var = ctk.StringVar(value=str(end_time.hour).zfill(2))
-        self.end_min_var = ctk.StringVar(value=str(end_time.minute).zfill(2))
+        self.end_hour_var = ctk.StringVar(master=self.window)
+        self.end_min_var = ctk.StringVar(master=self.window)
 
         ctk.CTkLabel(time_row, text="End:", font=("Roboto", 12)).pack(side="left", padx=(20, 0))
         ctk.CTkEntry(time_row, textvariable=self.end_hour_var, width=40).pack(side="left", padx=(5, 0))
         ctk.CTkLabel(time_row, text=":").pack(side="left", padx=2)
         ctk.CTkEntry(time_row, textvariable=self.end_min_var, width=40).pack(side="left")
 
-        # Toggle time visibility
-        self._toggle_time()
+        # Recurrence (packed only when a repeat phrase was detected)
+        self.repeat_var = ctk.BooleanVar(master=self.window)
+        self.repeat_check = ctk.CTkCheckBox(
+            main_frame, text="", variable=self.repeat_var, font=("Roboto", 12)
+        )
 
         # Description
-        ctk.CTkLabel(main_frame, text="Description", font=("Roboto", 14, "bold")).pack(anchor="w", padx=20, pady=(0, 5))
+        self.desc_label = ctk.CTkLabel(main_frame, text="Description", font=("Roboto", 14, "bold"))
+        self.desc_label.pack(anchor="w", padx=20, pady=(0, 5))
         self.desc_text = ctk.CTkTextbox(main_frame, height=100, font=("Roboto", 12))
         self.desc_text.pack(fill="both", expand=True, padx=20, pady=(0, 20))
-        if self._description:
-            self.desc_text.insert("1.0", self._description)
 
         # Buttons
         btn_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
@@ -152,7 +210,7 @@ class EventEditDialog:
             btn_frame, text="Add to Calendar", command=self._submit,
             width=150, height=40, font=("Roboto", 13, "bold")
         ).pack(side="right")
-        
+
         ctk.CTkButton(
             btn_frame, text="Cancel", command=self._cancel,
             width=100, height=40, fg_color="transparent", border_width=2,
@@ -163,25 +221,41 @@ class EventEditDialog:
         self.window.bind('<Return>', lambda e: self._submit())
         self.window.bind('<Escape>', lambda e: self._cancel())
 
-    def _toggle_time(self):
-        """Toggle time fields visibility."""
-        if self.all_day_var.get():
-            for child in self.time_frame.winfo_children():
-                child.pack_forget()
-        else:
-            ctk.CTkLabel(self.time_frame, text="Time", font=("Roboto", 14, "bold")).pack(anchor="w", pady=(0, 5))
-            time_row = ctk.CTkFrame(self.time_frame, fg_color="transparent")
-            time_row.pack(fill="x")
-            
-            ctk.CTkLabel(time_row, text="Start:", font=("Roboto", 12)).pack(side="left")
-            ctk.CTkEntry(time_row, textvariable=self.start_hour_var, width=40).pack(side="left", padx=(5, 0))
-            ctk.CTkLabel(time_row, text=":").pack(side="left", padx=2)
-            ctk.CTkEntry(time_row, textvariable=self.start_min_var, width=40).pack(side="left")
-            
-            ctk.CTkLabel(time_row, text="End:", font=("Roboto", 12)).pack(side="left", padx=(20, 0))
-            ctk.CTkEntry(time_row, textvariable=self.end_hour_var, width=40).pack(side="left", padx=(5, 0))
-            ctk.CTkLabel(time_row, text=":").pack(side="left", padx=2)
-            ctk.CTkEntry(time_row, textvariable=self.end_min_var, width=40).pack(side="left")
+    def _populate(self, title: str, start_date: datetime, all_day: bool, description: str,
+                  recurrence: Optional[str]):
+        """Fill the widgets with new values."""
+        self.title_var.set(title)
+        self.year_var.set(str(start_date.year))
+        self.month_var.set(str(start_date.month))
+        self.day_var.set(str(start_date.day))
+        self.all_day_var.set(all_day)
+
+        end_time = start_date + timedelta(hours=1)
+        self.start_hour_var.set(str(start_date.hour).zfill(2))
+        self.start_min_var.set(str(start_date.minute).zfill(2))
+        self.end_hour_var.set(str(end_time.hour).zfill(2))
+        self.end_min_var.set(str(end_time.minute).zfill(2))
+
+        self._recurrence = recurrence
+        self.repeat_var.set(bool(recurrence))
+        if recurrence:
+            upcoming = ", ".join(d.strftime('%m/%d') for d in preview_occurrences(start_date, recurrence))
+            self.repeat_check.configure(text=f"Repeat: {describe_rrule(recurrence)}  ({upcoming}, ...)")
+
+        self.desc_text.delete("1.0", "end")
+        if description:
+            self.desc_text.insert("1.0", description)
+
+        self._layout_optional()
+
+    def _layout_optional(self):
+        """Show or hide the time row and recurrence checkbox."""
+        self.time_frame.pack_forget()
+        self.repeat_check.pack_forget()
+        if not self.all_day_var.get():
+            self.time_frame.pack(fill="x", padx=20, pady=(0, 10), before=self.desc_label)
+        if self._recurrence:
+            self.repeat_check.pack(anchor="w", padx=20, pady=(0, 10), before=self.desc_label)
 
     def _submit(self):
         """Submit the form."""
@@ -211,12 +285,13 @@ class EventEditDialog:
                 end_date=end,
                 all_day=self.all_day_var.get(),
                 description=self.desc_text.get("1.0", "end-1c").strip(),
-                cancelled=False
+                cancelled=False,
+                recurrence=self._recurrence if self.repeat_var.get() else None
             )
         except ValueError:
             self.result = None
 
-        self.window.destroy()
+        self._done_var.set(True)
 
     def _cancel(self):
         """Cancel the dialog."""
@@ -224,11 +299,23 @@ class EventEditDialog:
             title="", start_date=datetime.now(), end_date=datetime.now(),
             all_day=True, description="", cancelled=True
         )
-        self.window.destroy()
-
-
-def show_edit_dialog(master: Any, title: str, start_date: datetime, all_day: bool, description: str = "") -> Optional[EditedEvent]:
-    """Show edit dialog and return result."""
-    dialog = EventEditDialog(master, title, start_date, all_day, description)
-    return dialog.show()
-
+        self._done_var.set(True)
+
+
+def show_edit_dialog(master: Any, title: str, start_date: datetime, all_day: bool, description: str = "",
+                     recurrence: Optional[str] = None,
+                     dialog: Optional[EventEditDialog] = None) -> Optional[EditedEvent]:
+    """
+    Show edit dialog and return result.
+
+    Pass a pre-built `dialog` to reuse its window; otherwise a temporary
+    dialog is created and destroyed.
+    """
+    if dialog is not None:
+        return dialog.show(title, start_date, all_day, description, recurrence)
+
+    dialog = EventEditDialog(master)
+    try:
+        return dialog.show(title, start_date, all_day, description, recurrence)
+    finally:
+        dialog.destroy()
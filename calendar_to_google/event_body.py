@@ -0,0 +1,78 @@
+"""events.insert request bodies for ParsedEvents, built in bulk with shared metadata."""
+
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, Optional
+
+from .date_parser import ParsedEvent
+
+TIMEZONE = 'Asia/Tokyo'
+# Length of a timed event without an end time
+DEFAULT_DURATION = timedelta(hours=1)
+ONE_DAY = timedelta(days=1)
+# Distinct all-day dates kept formatted (bulk imports repeat the same days)
+_DATE_CACHE_SIZE = 4096
+
+
+class EventBodyBuilder:
+    """
+    Turns ParsedEvents into Calendar API event resources.
+
+    The time zone and any extra fields shared by every event (colorId,
+    reminders, source...) are fixed once per builder. Formatted all-day
+    dates are memoized, and build_many() yields the bodies of a whole
+    sequence so they can be prepared before a batch is serialized.
+    Bodies are plain dicts and do not touch the network.
+    """
+
+    def __init__(self, timezone: str = TIMEZONE, defaults: Optional[dict] = None,
+                 default_duration: timedelta = DEFAULT_DURATION):
+        """
+        Initialize builder.
+
+        Args:
+            timezone: IANA time zone of the start/end values
+            defaults: Fields added to every body (copied; event fields win)
+            default_duration: End of a timed event that has none
+        """
+        self.timezone = timezone
+        self.defaults = dict(defaults or {})
+        self.default_duration = default_duration
+        self._dates: dict[datetime, str] = {}
+
+    def build(self, event: ParsedEvent) -> dict:
+        """Request body for one event."""
+        timezone = self.timezone
+        if event.all_day:
+            start = {'date': self._date(event.start_date), 'timeZone': timezone}
+            # ParsedEvent の終了日は当日を含むが、API の end.date は排他的（翌日）
+            end = {'date': self._date((event.end_date or event.start_date) + ONE_DAY), 'timeZone': timezone}
+        else:
+            end_date = event.end_date or event.start_date + self.default_duration
+            start = {'dateTime': event.start_date.isoformat(), 'timeZone': timezone}
+            end = {'dateTime': end_date.isoformat(), 'timeZone': timezone}
+
+        body = dict(self.defaults) if self.defaults else {}
+        body['summary'] = event.title
+        body['start'] = start
+        body['end'] = end
+        if event.description:
+            body['description'] = event.description
+        # 繰り返し予定は1回のinsertでシリーズ全体を登録
+        if event.recurrence:
+            body['recurrence'] = [event.recurrence]
+        return body
+
+    def build_many(self, events: Iterable[ParsedEvent]) -> Iterator[dict]:
+        """Request bodies for a sequence of events, in order."""
+        build = self.build
+        for event in events:
+            yield build(event)
+
+    def _date(self, value: datetime) -> str:
+        """YYYY-MM-DD of a datetime, memoized."""
+        text = self._dates.get(value)
+        if text is None:
+            if len(self._dates) >= _DATE_CACHE_SIZE:
+                self._dates.clear()
+            text = self._dates[value] = value.strftime('%Y-%m-%d')
+        return text
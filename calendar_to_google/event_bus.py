@@ -0,0 +1,123 @@
+"""Thread-safe bridge between worker threads and the Tk main loop."""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from .metrics import metrics
+
+# Drain interval (~60 frames per second)
+TICK_MS = 16
+# Upper bound on callbacks run per frame, so a flood never freezes the UI
+MAX_PER_TICK = 500
+IO_WORKERS = 2
+
+
+class EventBus:
+    """
+    Single event bus for the application.
+
+    Any thread may post() callables; they run on the Tk thread when the
+    queue is drained once per tick. post_latest() coalesces updates by key
+    so only the newest one runs per frame (e.g. tray icon colour). Callbacks
+    that wait in a nested Tk loop (modal dialogs) go through post_modal() so
+    the queue keeps draining while they are open. Blocking I/O goes to a
+    fixed worker pool via run_io().
+    """
+
+    def __init__(self, tick_ms: int = TICK_MS, max_per_tick: int = MAX_PER_TICK,
+                 io_workers: int = IO_WORKERS):
+        self.tick_ms = tick_ms
+        self.max_per_tick = max_per_tick
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._latest: dict[str, tuple[Callable, tuple]] = {}
+        self._latest_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="io")
+        self._root = None
+        self._closed = False
+        self._draining = False
+
+    def attach(self, root):
+        """Start draining the queue from the Tk loop of `root`."""
+        self._root = root
+        root.after(self.tick_ms, self._tick)
+
+    def post(self, fn: Callable, *args: Any):
+        """Schedule fn(*args) on the UI thread (callable from any thread)."""
+        if not self._closed:
+            self._queue.put((time.perf_counter(), fn, args))
+
+    def post_modal(self, fn: Callable, *args: Any):
+        """Schedule fn(*args) on the UI thread as its own Tk callback, outside the drain loop."""
+        self.post(self._call_later, fn, args)
+
+    def post_latest(self, key: str, fn: Callable, *args: Any):
+        """Schedule fn(*args) on the UI thread, replacing any pending call with the same key."""
+        if self._closed:
+            return
+        with self._latest_lock:
+            self._latest[key] = (fn, args)
+
+    def run_io(self, fn: Callable, *args: Any) -> Optional[Future]:
+        """Run blocking work on the I/O worker pool."""
+        if self._closed:
+            return None
+        return self._executor.submit(self._guard, fn, *args)
+
+    def drain(self) -> int:
+        """Run pending callbacks on the calling thread; returns how many ran."""
+        ran = 0
+        while ran < self.max_per_tick:
+            try:
+                posted, fn, args = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            metrics.observe('bus.latency', time.perf_counter() - posted)
+            self._guard(fn, *args)
+            ran += 1
+
+        with self._latest_lock:
+            latest, self._latest = self._latest, {}
+        for fn, args in latest.values():
+            self._guard(fn, *args)
+            ran += 1
+        return ran
+
+    def shutdown(self):
+        """Stop accepting work and release the worker pool."""
+        self._closed = True
+        self._executor.shutdown(wait=False)
+
+    def _tick(self):
+        """Re-arm the timer, then drain once."""
+        # 先に次のtickを予約する（コールバックがネストしたループに入ってもタイマーが止まらない）
+        if not self._closed and self._root is not None:
+            self._root.after(self.tick_ms, self._tick)
+        if self._draining:
+            # ネストしたループからの再入ではコールバックを割り込ませない
+            return
+        self._draining = True
+        try:
+            self.drain()
+        finally:
+            self._draining = False
+
+    def _call_later(self, fn: Callable, args: tuple):
+        """Hand fn(*args) to the Tk loop so it runs after the current drain returns."""
+        if self._root is None:
+            self._guard(fn, *args)
+        else:
+            self._root.after(0, self._guard, fn, *args)
+
+    @staticmethod
+    def _guard(fn: Callable, *args: Any):
+        """Run a callback, logging instead of propagating exceptions."""
+        try:
+            return fn(*args)
+        except Exception as e:
+            print(f"Error in {getattr(fn, '__name__', fn)}: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
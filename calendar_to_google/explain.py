@@ -0,0 +1,141 @@
+"""Structured traces of DateParser decisions and per-rule timings aggregated over a corpus."""
+
+import argparse
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+# outcome values of RuleMatch
+SELECTED = 'selected'      # became the event's date / time / title
+CANDIDATE = 'candidate'    # valid reading, ranked below the selected one
+REJECTED = 'rejected'      # dropped; see reason
+
+
+@dataclass
+class RuleMatch:
+    """One match of a rule and what the parser did with it."""
+    span: Optional[tuple[int, int]]
+    text: str
+    value: Optional[str] = None        # resolved date / time / title, as text
+    outcome: str = CANDIDATE
+    reason: str = ""
+    confidence: Optional[float] = None
+
+
+@dataclass
+class RuleAttempt:
+    """A rule tried on the text: its own scan time and every match."""
+    stage: str                          # keyword | date | time | recurrence | fallback | title
+    rule: str                           # e.g. 'date.md.1' (index into the compiled rule list)
+    seconds: float
+    pattern: str = ""
+    matches: list[RuleMatch] = field(default_factory=list)
+
+
+@dataclass
+class ParseTrace:
+    """
+    Everything DateParser.explain() saw while parsing one text.
+
+    `attempts` holds every rule with its isolated scan time (each date
+    and time rule is re-run on its own, so the merged regexes used for
+    parsing cannot attribute cost), `stages` the time of each step of the
+    explain run, and `seconds` the cost of the real parse of the text.
+    """
+    text: str
+    event: Optional[object]             # ParsedEvent, or None if no date was found
+    seconds: float
+    stages: dict[str, float] = field(default_factory=dict)
+    attempts: list[RuleAttempt] = field(default_factory=list)
+
+    def selected(self) -> list[tuple[RuleAttempt, RuleMatch]]:
+        """(attempt, match) pairs that made it into the event."""
+        return [(a, m) for a in self.attempts for m in a.matches if m.outcome == SELECTED]
+
+    def to_dict(self) -> dict:
+        """JSON-serializable form (the event as in cli.event_to_dict)."""
+        from .cli import event_to_dict
+        return {
+            'text': self.text,
+            'event': event_to_dict(self.event) if self.event else None,
+            'seconds': self.seconds,
+            'stages': self.stages,
+            'attempts': [asdict(a) for a in self.attempts],
+        }
+
+
+class RuleProfile:
+    """Per-rule time, match and selection counts summed over many traces."""
+
+    def __init__(self):
+        self.texts = 0
+        self.seconds = 0.0  # real parse time of all texts
+        self.rules: dict[str, dict] = {}
+
+    def add(self, trace: ParseTrace):
+        """Fold one trace into the totals."""
+        self.texts += 1
+        self.seconds += trace.seconds
+        for attempt in trace.attempts:
+            entry = self.rules.get(attempt.rule)
+            if entry is None:
+                entry = self.rules[attempt.rule] = {
+                    'stage': attempt.stage, 'pattern': attempt.pattern,
+                    'seconds': 0.0, 'matches': 0, 'selected': 0, 'rejected': 0,
+                }
+            entry['seconds'] += attempt.seconds
+            entry['matches'] += len(attempt.matches)
+            for match in attempt.matches:
+                if match.outcome == SELECTED:
+                    entry['selected'] += 1
+                elif match.outcome == REJECTED:
+                    entry['rejected'] += 1
+
+    def top(self, count: Optional[int] = None) -> list[tuple[str, dict]]:
+        """Rules by total time, most expensive first."""
+        ranked = sorted(self.rules.items(), key=lambda item: -item[1]['seconds'])
+        return ranked[:count] if count else ranked
+
+    def report(self, count: Optional[int] = None) -> str:
+        """Text table of top(count)."""
+        total = sum(entry['seconds'] for entry in self.rules.values()) or 1.0
+        lines = [f"{self.texts} texts, parse {self.seconds * 1000:.1f} ms total",
+                 f"{'rule':<22} {'total ms':>9} {'share':>6} {'us/text':>8} {'match':>6} {'sel':>5} {'rej':>5}"]
+        for name, entry in self.top(count):
+            lines.append(
+                f"{name:<22} {entry['seconds'] * 1000:>9.2f} {entry['seconds'] / total:>6.1%} "
+                f"{entry['seconds'] / max(self.texts, 1) * 1e6:>8.1f} {entry['matches']:>6} "
+                f"{entry['selected']:>5} {entry['rejected']:>5}")
+        return '\n'.join(lines)
+
+
+def profile_rules(parser, texts: Iterable[str]) -> RuleProfile:
+    """Explain every non-empty text with `parser` and aggregate the per-rule timings."""
+    profile = RuleProfile()
+    for text in texts:
+        if text.strip():
+            profile.add(parser.explain(text))
+    return profile
+
+
+def main(argv=None):
+    """Print per-rule timings over the lines of a file (or stdin)."""
+    from .date_parser import DateParser
+
+    arg_parser = argparse.ArgumentParser(description="Aggregate per-rule parser timings over a corpus")
+    arg_parser.add_argument('corpus', type=Path, nargs='?', help="text file, one text per line (default: stdin)")
+    arg_parser.add_argument('--top', type=int, default=20, help="rules to show")
+    arg_parser.add_argument('--locale', action='append', help="grammar locale to use (repeatable)")
+    args = arg_parser.parse_args(argv)
+
+    if args.corpus:
+        with open(args.corpus, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    else:
+        lines = sys.stdin.read().splitlines()
+    print(profile_rules(DateParser(locales=args.locale), lines).report(args.top))
+
+
+if __name__ == '__main__':
+    main()
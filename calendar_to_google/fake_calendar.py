@@ -0,0 +1,381 @@
+"""Local fake of the Calendar v3 API (events, batch, calendarList, freeBusy) for load and latency tests."""
+
+import argparse
+import email.parser
+import itertools
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterable, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+from zoneinfo import ZoneInfo
+
+PRIMARY_ID = 'fake@example.com'
+# events.list page size when maxResults is not given (same as the real API)
+DEFAULT_PAGE_SIZE = 250
+MAX_PAGE_SIZE = 2500
+
+_EVENTS_RE = re.compile(r'^/calendar/v3/calendars/([^/]+)/events$')
+_CALENDAR_LIST_RE = re.compile(r'^/calendar/v3/users/me/calendarList$')
+_FREEBUSY_RE = re.compile(r'^/calendar/v3/freeBusy$')
+_BATCH_RE = re.compile(r'^/batch(?:/calendar/v3)?$')
+
+_REASONS = {
+    400: ('global', 'badRequest', "Bad Request"),
+    404: ('global', 'notFound', "Not Found"),
+    410: ('global', 'fullSyncRequired', "Sync token is no longer valid"),
+    429: ('usageLimits', 'rateLimitExceeded', "Rate Limit Exceeded"),
+    503: ('global', 'backendError', "Backend Error"),
+}
+_STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 410: 'Gone',
+                429: 'Too Many Requests', 503: 'Service Unavailable'}
+
+
+def _error(code: int) -> tuple[int, dict]:
+    domain, reason, message = _REASONS[code]
+    return code, {'error': {'code': code, 'message': message,
+                            'errors': [{'domain': domain, 'reason': reason, 'message': message}]}}
+
+
+def _parse_time(value: dict) -> Optional[datetime]:
+    """Aware datetime of an event start/end ({'date'} or {'dateTime', 'timeZone'})."""
+    tz = timezone.utc
+    if value.get('timeZone'):
+        try:
+            tz = ZoneInfo(value['timeZone'])
+        except Exception:
+            pass
+    try:
+        if 'dateTime' in value:
+            parsed = datetime.fromisoformat(value['dateTime'].replace('Z', '+00:00'))
+        else:
+            parsed = datetime.fromisoformat(value['date'])
+    except (KeyError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=tz)
+
+
+def _parse_rfc3339(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class FakeCalendarServer:
+    """
+    In-memory Calendar v3 API on a local HTTP port.
+
+    Serves events.insert/list, calendarList.list, freebusy.query and the
+    multipart batch endpoint in the wire format googleapiclient speaks, so
+    GoogleCalendarClient(endpoint=server.url) runs its real code path
+    against it. Every HTTP request waits `latency` (+ up to `jitter`)
+    seconds; every API call, including each part of a batch, is first
+    checked against a token-bucket quota of `rate_limit` calls per second
+    (429 rateLimitExceeded when empty) and then fails with 503 at
+    `error_rate`. Counters are kept in `stats`.
+    """
+
+    def __init__(self, port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, rate_limit: Optional[float] = None,
+                 calendars: Iterable[str] = (), seed: Optional[int] = None):
+        """
+        Initialize server.
+
+        Args:
+            port: Port to listen on (0: any free port)
+            latency: Seconds added to every HTTP request
+            jitter: Extra random delay of up to this many seconds
+            error_rate: Fraction of API calls answered with 503
+            rate_limit: API calls per second before 429 (None: unlimited)
+            calendars: Names of secondary calendars besides the primary one
+            seed: Random seed for reproducible latency and errors
+        """
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.stats: Counter = Counter()
+        self.calendars = [{'id': PRIMARY_ID, 'summary': PRIMARY_ID, 'primary': True,
+                           'accessRole': 'owner', 'timeZone': 'Asia/Tokyo'}]
+        for i, name in enumerate(calendars):
+            self.calendars.append({'id': f'c{i}@group.calendar.example', 'summary': name,
+                                   'accessRole': 'owner', 'timeZone': 'Asia/Tokyo'})
+        self.events: dict[str, list[dict]] = {c['id']: [] for c in self.calendars}
+        self._random = random.Random(seed)
+        self._sequence = itertools.count(1)
+        self._lock = threading.Lock()
+        self._tokens = rate_limit or 0.0
+        self._refilled = time.monotonic()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """API root to pass as GoogleCalendarClient's endpoint."""
+        return f'http://127.0.0.1:{self.port}/'
+
+    def start(self) -> str:
+        """Serve on a daemon thread; returns the API root URL."""
+        server = self
+
+        class Handler(_Handler):
+            fake = server
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', self.port), Handler)
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-calendar", daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        """Stop serving and close the port."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> 'FakeCalendarServer':
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _count(self, name: str):
+        with self._lock:
+            self.stats[name] += 1
+
+    # --- API ---
+
+    def handle(self, method: str, path: str, query: dict, body: Optional[dict]) -> tuple[int, dict]:
+        """Answer one API call (also used for each part of a batch)."""
+        self._count('calls')
+        fault = self._fault()
+        if fault:
+            return _error(fault)
+
+        match = _EVENTS_RE.match(path)
+        if match:
+            calendar_id = self._calendar_id(unquote(match.group(1)))
+            if calendar_id is None:
+                return _error(404)
+            if method == 'POST':
+                return self._insert(calendar_id, body)
+            return self._list(calendar_id, query)
+        if _CALENDAR_LIST_RE.match(path) and method == 'GET':
+            self._count('calendar_list')
+            return 200, {'kind': 'calendar#calendarList', 'items': list(self.calendars)}
+        if _FREEBUSY_RE.match(path) and method == 'POST':
+            return self._freebusy(body or {})
+        return _error(404)
+
+    def _fault(self) -> Optional[int]:
+        """Status code of an injected failure for this call, or None."""
+        with self._lock:
+            if self.rate_limit:
+                now = time.monotonic()
+                self._tokens = min(self.rate_limit, self._tokens + (now - self._refilled) * self.rate_limit)
+                self._refilled = now
+                if self._tokens < 1:
+                    self.stats['throttled'] += 1
+                    return 429
+                self._tokens -= 1
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.stats['errors'] += 1
+                return 503
+        return None
+
+    def _calendar_id(self, calendar_id: str) -> Optional[str]:
+        if calendar_id == 'primary':
+            return PRIMARY_ID
+        return calendar_id if calendar_id in self.events else None
+
+    def _insert(self, calendar_id: str, body: Optional[dict]) -> tuple[int, dict]:
+        if not body or 'start' not in body or 'end' not in body:
+            return _error(400)
+        event_id = uuid.uuid4().hex
+        now = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        event = dict(body, kind='calendar#event', id=event_id, status='confirmed',
+                     htmlLink=f'{self.url}event?eid={event_id}', created=now, updated=now)
+        with self._lock:
+            event['_sequence'] = next(self._sequence)
+            self.events[calendar_id].append(event)
+        self._count('inserted')
+        return 200, {k: v for k, v in event.items() if not k.startswith('_')}
+
+    def _list(self, calendar_id: str, query: dict) -> tuple[int, dict]:
+        """events.list with timeMin/timeMax, maxResults/pageToken and syncToken."""
+        self._count('listed')
+        first = lambda name: query.get(name, [None])[0]
+        page_size = min(int(first('maxResults') or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE)
+        offset = int(first('pageToken') or 0)
+        with self._lock:
+            events = list(self.events[calendar_id])
+            sequence = events[-1]['_sequence'] if events else 0
+
+        sync_token = first('syncToken')
+        if sync_token:
+            if not sync_token.isdigit():
+                return _error(410)
+            events = [e for e in events if e['_sequence'] > int(sync_token)]
+        else:
+            time_min, time_max = _parse_rfc3339(first('timeMin')), _parse_rfc3339(first('timeMax'))
+            if time_min or time_max:
+                events = [e for e in events if self._overlaps(e, time_min, time_max)]
+
+        page = events[offset:offset + page_size]
+        result = {'kind': 'calendar#events', 'items': [{k: v for k, v in e.items() if not k.startswith('_')}
+                                                       for e in page]}
+        if offset + page_size < len(events):
+            result['nextPageToken'] = str(offset + page_size)
+        else:
+            result['nextSyncToken'] = str(sequence)
+        return 200, result
+
+    @staticmethod
+    def _overlaps(event: dict, time_min: Optional[datetime], time_max: Optional[datetime]) -> bool:
+        start, end = _parse_time(event['start']), _parse_time(event['end'])
+        if start is None or end is None:
+            return False
+        if 'date' in event['end'] and end <= start:
+            end = start + timedelta(days=1)
+        return (time_max is None or start < time_max) and (time_min is None or end > time_min)
+
+    def _freebusy(self, body: dict) -> tuple[int, dict]:
+        """Busy periods of the requested calendars between timeMin and timeMax."""
+        self._count('freebusy')
+        try:
+            time_min, time_max = _parse_rfc3339(body['timeMin']), _parse_rfc3339(body['timeMax'])
+        except (KeyError, ValueError):
+            return _error(400)
+        calendars = {}
+        for item in body.get('items', []):
+            calendar_id = self._calendar_id(item.get('id', ''))
+            if calendar_id is None:
+                calendars[item.get('id', '')] = {'errors': [{'domain': 'global', 'reason': 'notFound'}]}
+                continue
+            with self._lock:
+                events = list(self.events[calendar_id])
+            busy = []
+            for event in events:
+                if event.get('transparency') == 'transparent' or not self._overlaps(event, time_min, time_max):
+                    continue
+                start, end = _parse_time(event['start']), _parse_time(event['end'])
+                if end <= start:
+                    end = start + timedelta(days=1)
+                busy.append({'start': max(start, time_min).astimezone(timezone.utc).isoformat(),
+                             'end': min(end, time_max).astimezone(timezone.utc).isoformat()})
+            calendars[item.get('id', '')] = {'busy': sorted(busy, key=lambda b: b['start'])}
+        return 200, {'kind': 'calendar#freeBusy', 'timeMin': body['timeMin'],
+                     'timeMax': body['timeMax'], 'calendars': calendars}
+
+    def handle_batch(self, content_type: str, payload: bytes) -> tuple[str, bytes]:
+        """Answer a multipart/mixed batch; returns (content type, body)."""
+        self._count('batches')
+        message = email.parser.BytesParser().parsebytes(
+            b'Content-Type: ' + content_type.encode('latin-1') + b'\r\n\r\n' + payload)
+        boundary = f'batch_{uuid.uuid4().hex}'
+        parts = []
+        for part in message.get_payload() if message.is_multipart() else []:
+            request_line, _, rest = part.get_payload().partition('\n')
+            method, target, _ = (request_line.strip().split(' ', 2) + ['', ''])[:3]
+            inner = email.parser.Parser().parsestr(rest)
+            text = inner.get_payload()
+            url = urlsplit(target)
+            try:
+                body = json.loads(text) if text and text.strip() else None
+                status, result = self.handle(method, url.path, parse_qs(url.query), body)
+            except ValueError:
+                status, result = _error(400)
+            content_id = part.get('Content-ID', '')
+            data = json.dumps(result, ensure_ascii=False)
+            parts.append(
+                f'--{boundary}\r\nContent-Type: application/http\r\n'
+                f'Content-ID: <response-{content_id.strip("<>")}>\r\n\r\n'
+                f'HTTP/1.1 {status} {_STATUS_TEXT[status]}\r\n'
+                f'Content-Type: application/json; charset=UTF-8\r\n\r\n{data}\r\n')
+        body = ''.join(parts) + f'--{boundary}--\r\n'
+        return f'multipart/mixed; boundary={boundary}', body.encode('utf-8')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """HTTP front end of FakeCalendarServer (the `fake` attribute is set per server)."""
+
+    fake: FakeCalendarServer
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def _dispatch(self, method: str):
+        fake = self.fake
+        fake._count('requests')
+        delay = fake.latency + (fake._random.uniform(0, fake.jitter) if fake.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+
+        length = int(self.headers.get('Content-Length') or 0)
+        payload = self.rfile.read(length) if length else b''
+        url = urlsplit(self.path)
+        if method == 'POST' and _BATCH_RE.match(url.path):
+            content_type, body = fake.handle_batch(self.headers.get('Content-Type', ''), payload)
+            self._reply(200, content_type, body)
+            return
+        try:
+            request_body = json.loads(payload) if payload else None
+            status, result = fake.handle(method, url.path, parse_qs(url.query), request_body)
+        except ValueError:
+            status, result = _error(400)
+        self._reply(status, 'application/json; charset=UTF-8',
+                    json.dumps(result, ensure_ascii=False).encode('utf-8'))
+
+    def _reply(self, status: int, content_type: str, body: bytes):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main(argv=None):
+    """Run the fake server in the foreground."""
+    arg_parser = argparse.ArgumentParser(description="Serve a fake Google Calendar API for load tests")
+    arg_parser.add_argument('--port', type=int, default=8080)
+    arg_parser.add_argument('--latency', type=float, default=0.0, help="seconds added to every request")
+    arg_parser.add_argument('--jitter', type=float, default=0.0, help="extra random delay (seconds)")
+    arg_parser.add_argument('--error-rate', type=float, default=0.0, help="fraction of calls answered 503")
+    arg_parser.add_argument('--rate-limit', type=float, help="calls per second before 429")
+    arg_parser.add_argument('--calendar', action='append', default=[], help="secondary calendar name (repeatable)")
+    arg_parser.add_argument('--seed', type=int)
+    args = arg_parser.parse_args(argv)
+
+    server = FakeCalendarServer(args.port, args.latency, args.jitter, args.error_rate,
+                                args.rate_limit, args.calendar, args.seed)
+    print(f"Fake Calendar API on {server.start()} (set CALENDAR_TO_GOOGLE_API_ENDPOINT to use it)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(dict(server.stats))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+"""Bounded last-resort date tokenizer used when no grammar rule matches."""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+from .locales import CompiledGrammar
+
+# Only the head of long text is scanned; dates past this are not guessed at
+MAX_FALLBACK_CHARS = 512
+FALLBACK_CACHE_SIZE = 1024
+# Guesses below this confidence are discarded
+MIN_CONFIDENCE = 0.5
+
+# Numbers (with . / - separators kept together), words, ordinals
+_TOKEN_RE = re.compile(r'\d+(?:[./\-]\d+)*(?:st|nd|rd|th)?|[a-z]+', re.IGNORECASE)
+_SEPARATOR_RE = re.compile(r'[./\-]')
+_ORDINAL_RE = re.compile(r'(\d{1,2})(?:st|nd|rd|th)$', re.IGNORECASE)
+# Words allowed between a day and a month ("3rd of April", "April the 3rd")
+_FILLER_WORDS = frozenset({'of', 'the', 'on'})
+
+
+@dataclass(frozen=True)
+class FallbackMatch:
+    """A guessed date: missing year/month are filled in relative to today."""
+    year: Optional[int]
+    month: Optional[int]
+    day: int
+    confidence: float
+    start: int
+    end: int
+
+
+class FallbackDateTokenizer:
+    """
+    Replacement for dateutil's fuzzy parse as the last resort.
+
+    One precompiled token regex splits at most MAX_FALLBACK_CHARS of text;
+    tokens are matched against a small table (month names from the
+    grammar, ordinals, dotted/compact numeric dates). Shapes that look like
+    versions, IP addresses, decimals or phone numbers are rejected instead
+    of being read as dates, and every guess carries a confidence. Scan
+    results do not depend on today's date and are cached per text.
+    """
+
+    def __init__(self, grammar: CompiledGrammar, cache_size: int = FALLBACK_CACHE_SIZE):
+        """
+        Initialize tokenizer.
+
+        Args:
+            grammar: Compiled grammar providing month names
+            cache_size: Number of scanned texts kept in the LRU cache
+        """
+        self.months = grammar.months
+        self._scan = lru_cache(maxsize=cache_size)(self._scan_uncached)
+
+    def find(self, text: str, now: datetime) -> Optional[tuple[datetime, FallbackMatch]]:
+        """Return (date, match) for the most confident guess, or None."""
+        match = self._scan(text[:MAX_FALLBACK_CHARS])
+        if match is None:
+            return None
+        date = self._resolve(match, now)
+        return (date, match) if date else None
+
+    def cache_info(self):
+        """LRU statistics of the scan cache."""
+        return self._scan.cache_info()
+
+    @staticmethod
+    def _resolve(match: FallbackMatch, now: datetime) -> Optional[datetime]:
+        """Fill in a missing year/month with the next occurrence from today."""
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        try:
+            if match.year is not None:
+                return datetime(match.year, match.month or 1, match.day)
+            if match.month is not None:
+                date = datetime(now.year, match.month, match.day)
+                return date if date >= today else datetime(now.year + 1, match.month, match.day)
+            # 日だけ（"the 25th"）: 今月、過ぎていれば来月
+            if match.day >= now.day:
+                return datetime(now.year, now.month, match.day)
+            year, month = (now.year + 1, 1) if now.month == 12 else (now.year, now.month + 1)
+            return datetime(year, month, match.day)
+        except ValueError:
+            return None
+
+    def _scan_uncached(self, text: str) -> Optional[FallbackMatch]:
+        tokens = list(_TOKEN_RE.finditer(text))
+        best: Optional[FallbackMatch] = None
+        for i, token in enumerate(tokens):
+            candidate = self._match_token(text, tokens, i)
+            if candidate and (best is None or candidate.confidence > best.confidence):
+                best = candidate
+        if best is None or best.confidence < MIN_CONFIDENCE:
+            return None
+        return best
+
+    def _month_near(self, tokens: list, i: int, step: int) -> Optional[tuple[int, re.Match]]:
+        """Find a month name next to tokens[i], skipping 'of'/'the'/'on'."""
+        j = i + step
+        while 0 <= j < len(tokens) and tokens[j].group(0).lower() in _FILLER_WORDS:
+            j += step
+        if 0 <= j < len(tokens):
+            month = self.months.get(tokens[j].group(0).lower())
+            if month:
+                return month, tokens[j]
+        return None
+
+    def _match_token(self, text: str, tokens: list, i: int) -> Optional[FallbackMatch]:
+        token = tokens[i]
+        value = token.group(0)
+        start, end = token.span()
+
+        if not value[0].isdigit():
+            # "March 2027" (month + year)
+            month = self.months.get(value.lower())
+            if month and i + 1 < len(tokens):
+                year = tokens[i + 1].group(0)
+                if len(year) == 4 and year.isdigit() and 1900 < int(year) < 2100:
+                    return FallbackMatch(int(year), month, 1, 0.6, start, tokens[i + 1].end())
+            return None
+
+        # "v2.3", "A123", "x86" のように英字に続く数字は日付ではない
+        if start > 0 and (text[start - 1].isalpha() or text[start - 1] in '#$¥€£+'):
+            return None
+        if end < len(text) and (text[end].isalpha() or text[end] in '%'):
+            return None
+
+        ordinal = _ORDINAL_RE.match(value)
+        if ordinal:
+            day = int(ordinal.group(1))
+            if not 1 <= day <= 31:
+                return None
+            near = self._month_near(tokens, i, -1) or self._month_near(tokens, i, 1)
+            if near:
+                month, month_token = near
+                return FallbackMatch(None, month, day, 0.8, min(start, month_token.start()),
+                                     max(end, month_token.end()))
+            return FallbackMatch(None, None, day, 0.5, start, end)
+
+        parts = _SEPARATOR_RE.split(value)
+        separators = set(_SEPARATOR_RE.findall(value))
+        if len(parts) == 3 and len(separators) == 1:
+            a, b, c = parts
+            if len(a) == 4:
+                year, month, day = int(a), int(b), int(c)
+            elif len(c) == 4 and len(a) <= 2 and len(b) <= 2:
+                # 12/25/2024（月/日/年）, 25.12.2024（日.月.年）
+                year, (month, day) = int(c), ((int(a), int(b)) if separators == {'/'} else (int(b), int(a)))
+            else:
+                return None
+            if 1900 < year < 2100 and 1 <= month <= 12 and 1 <= day <= 31:
+                return FallbackMatch(year, month, day, 0.8, start, end)
+            return None
+
+        if len(parts) == 1 and len(value) == 8:
+            # 20241225
+            year, month, day = int(value[:4]), int(value[4:6]), int(value[6:])
+            if 1900 < year < 2100 and 1 <= month <= 12 and 1 <= day <= 31:
+                return FallbackMatch(year, month, day, 0.6, start, end)
+
+        # 小数・バージョン・IPアドレス・電話番号などは推測しない
+        return None
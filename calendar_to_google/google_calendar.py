@@ -3,9 +3,9 @@
 import os
 import json
 import shutil
-import tkinter as tk
-from tkinter import filedialog, messagebox
-import customtkinter as ctk
+import threading
+import time
+from functools import wraps
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -13,59 +13,142 @@ from typing import Optional
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build, build_from_document
 from googleapiclient.errors import HttpError
 
+from .config import CONFIG_DIR, CREDENTIALS_FILE, DEFAULT_ACCOUNT, account_paths
 from .date_parser import ParsedEvent
+from .event_body import EventBodyBuilder
+from .metrics import metrics
 
 # Google Calendar API scope
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
-# Config directory
-CONFIG_DIR = Path.home() / '.calendar-to-google'
-CREDENTIALS_FILE = CONFIG_DIR / 'credentials.json'
-TOKEN_FILE = CONFIG_DIR / 'token.json'
+# Maximum requests per batch call (Calendar API limit is 50)
+BATCH_SIZE = 50
+
+# API root to use instead of Google's (e.g. the fake server: http://127.0.0.1:8080/)
+ENDPOINT_ENV = 'CALENDAR_TO_GOOGLE_API_ENDPOINT'
+# Socket timeout of requests to a custom endpoint (seconds)
+ENDPOINT_TIMEOUT = 30
+
+# Calendar v3 discovery document shared by every client (see discovery_document)
+_discovery_doc: Optional[str] = None
+
+
+def discovery_document() -> Optional[str]:
+    """Return the Calendar v3 discovery document (first use: the copy bundled with the client library)."""
+    global _discovery_doc
+    if _discovery_doc is None:
+        from googleapiclient import discovery_cache
+        _discovery_doc = discovery_cache.get_static_doc('calendar', 'v3')
+    return _discovery_doc
+
+
+def api_endpoint() -> Optional[str]:
+    """Return the API root set in CALENDAR_TO_GOOGLE_API_ENDPOINT, or None for Google."""
+    return os.environ.get(ENDPOINT_ENV) or None
+
+
+def discovery_snapshot() -> Optional[dict]:
+    """Return the discovery document tagged with the client library version, for the warm-state snapshot."""
+    from googleapiclient.version import __version__ as client_version
+    document = discovery_document()
+    return {'client_version': client_version, 'document': document} if document else None
+
+
+def restore_discovery(snapshot: Optional[dict]) -> bool:
+    """Use a saved discovery document if it was saved by the same client library version."""
+    global _discovery_doc
+    from googleapiclient.version import __version__ as client_version
+    if not snapshot or snapshot.get('client_version') != client_version or not snapshot.get('document'):
+        return False
+    _discovery_doc = snapshot['document']
+    return True
+
+
+def _serialized(method):
+    """Run a client method under the client's lock (the HTTP object is not thread-safe)."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            self.last_used = time.monotonic()
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class GoogleCalendarClient:
-    """Google Calendar API client."""
+    """
+    Google Calendar API client for one account.
 
-    def __init__(self):
-        """Initialize the client."""
+    Each account has its own token file and lazily built service (with its
+    own HTTP connection); calls on one client are serialized, calls on
+    different clients can run concurrently.
+    """
+
+    def __init__(self, account: str = DEFAULT_ACCOUNT, endpoint: Optional[str] = None):
+        """
+        Initialize the client.
+
+        Args:
+            account: Account profile name (see config.account_paths)
+            endpoint: API root to talk to instead of Google, without OAuth
+                (default: CALENDAR_TO_GOOGLE_API_ENDPOINT, e.g. fake_calendar)
+        """
+        self.account = account
+        self.endpoint = endpoint or api_endpoint()
+        self.body_builder = EventBodyBuilder()
+        self.credentials_file, self.token_file = account_paths(account)
+        self.last_used = time.monotonic()
+        self._lock = threading.RLock()
         self._service = None
         self._creds = None
 
     def is_configured(self) -> bool:
         """Check if credentials are configured."""
-        exists = CREDENTIALS_FILE.exists()
-        print(f"[Debug] Credentials path: {CREDENTIALS_FILE}")
-        print(f"[Debug] Credentials exists: {exists}")
-        return exists
+        if self.endpoint:
+            return True
+        return self.credentials_file.exists()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the service is currently built."""
+        return self._service is not None
+
+    def release(self):
+        """Drop the service and credentials to free memory (rebuilt lazily on next use)."""
+        with self._lock:
+            self._service = None
+            self._creds = None
 
     def is_authenticated(self) -> bool:
         """Check if user is authenticated."""
         if not self.is_configured():
             return False
 
-        if TOKEN_FILE.exists():
+        if self.token_file.exists():
             try:
-                creds = Credentials.from_authorized_user_file(str(TOKEN_FILE), SCOPES)
+                creds = Credentials.from_authorized_user_file(str(self.token_file), SCOPES)
                 return creds.valid or creds.refresh_token
             except Exception:
                 return False
         return False
 
+    @_serialized
     def authenticate(self) -> bool:
         """Authenticate with Google Calendar API."""
+        if self.endpoint:
+            # 独自エンドポイント（フェイクサーバー）は認証なし
+            return True
         if not self.is_configured():
             return False
 
         creds = None
 
         # Load existing token
-        if TOKEN_FILE.exists():
+        if self.token_file.exists():
             try:
-                creds = Credentials.from_authorized_user_file(str(TOKEN_FILE), SCOPES)
+                creds = Credentials.from_authorized_user_file(str(self.token_file), SCOPES)
             except Exception:
                 pass
 
@@ -73,15 +156,17 @@ class GoogleCalendarClient:
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
                 try:
-                    creds.refresh(Request())
+                    with metrics.timer('auth.refresh'):
+                        creds.refresh(Request())
                 except Exception:
+                    metrics.incr('auth.refresh_errors')
                     creds = None
 
             if not creds:
                 try:
-                    print(f"[Debug] Starting OAuth flow with: {CREDENTIALS_FILE}")
+                    print(f"[Debug] Starting OAuth flow with: {self.credentials_file}")
                     flow = InstalledAppFlow.from_client_secrets_file(
-                        str(CREDENTIALS_FILE), SCOPES
+                        str(self.credentials_file), SCOPES
                     )
                     print("[Debug] Opening browser for authentication...")
                     creds = flow.run_local_server(port=0)
@@ -93,8 +178,8 @@ class GoogleCalendarClient:
                     return False
 
             # Save credentials
-            TOKEN_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(TOKEN_FILE, 'w') as f:
+            self.token_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.token_file, 'w') as f:
                 f.write(creds.to_json())
 
         self._creds = creds
@@ -103,12 +188,33 @@ class GoogleCalendarClient:
     def _get_service(self):
         """Get or create Calendar service."""
         if self._service is None:
+            if self.endpoint:
+                with metrics.timer('api.build_service'):
+                    self._service = self._endpoint_service()
+                return self._service
             if not self._creds:
                 if not self.authenticate():
                     raise RuntimeError("Not authenticated")
-            self._service = build('calendar', 'v3', credentials=self._creds)
+            with metrics.timer('api.build_service'):
+                document = discovery_document()
+                if document:
+                    self._service = build_from_document(document, credentials=self._creds)
+                else:
+                    self._service = build('calendar', 'v3', credentials=self._creds)
         return self._service
 
+    def _endpoint_service(self):
+        """Build the service against self.endpoint (discovery document with its rootUrl replaced)."""
+        import httplib2
+        document = discovery_document()
+        if not document:
+            raise RuntimeError("Calendar discovery document is not available")
+        service = json.loads(document)
+        # バッチのURLも rootUrl から作られるので servicePath ではなく rootUrl を差し替える
+        service['rootUrl'] = self.endpoint.rstrip('/') + '/'
+        return build_from_document(service, http=httplib2.Http(timeout=ENDPOINT_TIMEOUT))
+
+    @_serialized
     def add_event(self, event: ParsedEvent, calendar_id: str = 'primary') -> Optional[str]:
         """
         Add event to Google Calendar.
@@ -123,59 +229,75 @@ class GoogleCalendarClient:
         try:
             service = self._get_service()
 
-            if event.all_day:
-                event_body = {
-                    'summary': event.title,
-                    'start': {
-                        'date': event.start_date.strftime('%Y-%m-%d'),
-                        'timeZone': 'Asia/Tokyo',
-                    },
-                    'end': {
-                        'date': (event.end_date or event.start_date).strftime('%Y-%m-%d'),
-                        'timeZone': 'Asia/Tokyo',
-                    },
-                }
-            else:
-                # 時間指定イベント（デフォルト1時間）
-                end_date = event.end_date
-                if not end_date:
-                    from datetime import timedelta
-                    end_date = event.start_date + timedelta(hours=1)
-
-                event_body = {
-                    'summary': event.title,
-                    'start': {
-                        'dateTime': event.start_date.isoformat(),
-                        'timeZone': 'Asia/Tokyo',
-                    },
-                    'end': {
-                        'dateTime': end_date.isoformat(),
-                        'timeZone': 'Asia/Tokyo',
-                    },
-                }
-
-            if event.description:
-                event_body['description'] = event.description
-
-            result = service.events().insert(
-                calendarId=calendar_id,
-                body=event_body
-            ).execute()
+            event_body = self.body_builder.build(event)
+
+            with metrics.timer('api.insert'):
+                result = service.events().insert(
+                    calendarId=calendar_id,
+                    body=event_body
+                ).execute()
+            metrics.incr('api.inserted')
 
             return result.get('htmlLink')
 
         except HttpError as e:
+            metrics.incr('api.errors')
             print(f"Google Calendar API error: {e}")
             return None
         except Exception as e:
             print(f"Error adding event: {e}")
             return None
 
+    @_serialized
+    def add_events(self, events: list[ParsedEvent], calendar_id: str = 'primary') -> list[Optional[str]]:
+        """
+        Add many events using batched insert requests.
+
+        Args:
+            events: ParsedEvents to add
+            calendar_id: Calendar ID (default: primary)
+
+        Returns:
+            Event URL (or None on failure) for each event, in input order
+        """
+        results: list[Optional[str]] = [None] * len(events)
+
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                metrics.incr('api.errors')
+                print(f"Google Calendar API error: {exception}")
+                return
+            results[int(request_id)] = response.get('htmlLink')
+            metrics.incr('api.inserted')
+
+        # 本文はまとめて先に作る（バッチ組み立て中は直列化だけ）
+        bodies = list(self.body_builder.build_many(events))
+        try:
+            service = self._get_service()
+            for offset in range(0, len(events), BATCH_SIZE):
+                batch = service.new_batch_http_request(callback=on_response)
+                for index in range(offset, min(offset + BATCH_SIZE, len(events))):
+                    batch.add(
+                        service.events().insert(
+                            calendarId=calendar_id,
+                            body=bodies[index]
+                        ),
+                        request_id=str(index)
+                    )
+                with metrics.timer('api.batch_insert'):
+                    batch.execute()
+        except Exception as e:
+            print(f"Error adding events: {e}")
+
+        return results
+
+    @_serialized
     def list_calendars(self) -> list:
         """List available calendars."""
         try:
             service = self._get_service()
-            result = service.calendarList().list().execute()
+            with metrics.timer('api.calendar_list'):
+                result = service.calendarList().list().execute()
             return result.get('items', [])
         except Exception as e:
             print(f"Error listing calendars: {e}")
@@ -211,6 +333,10 @@ def select_credentials_file() -> bool:
     Returns:
         True if credentials were successfully registered, False otherwise
     """
+    # GUI はここでだけ使う（CLI から tkinter を読み込まないため）
+    import customtkinter as ctk
+    from tkinter import filedialog, messagebox
+
     # Create a hidden root window
     root = ctk.CTk()
     root.withdraw()
@@ -291,6 +417,9 @@ def prompt_credentials_setup() -> bool:
     Returns:
         True if user chose to select a file and succeeded, False otherwise
     """
+    import customtkinter as ctk
+    from tkinter import messagebox
+
     root = ctk.CTk()
     root.withdraw()
     root.attributes('-topmost', True)
@@ -0,0 +1,380 @@
+"""Streaming iCalendar (.ics) export and import."""
+
+import hashlib
+import io
+import re
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, TextIO, Union
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from .bulk_import import event_key
+from .date_parser import ParsedEvent
+
+# Timezone that naive ParsedEvent datetimes are in (same as the API client)
+TIMEZONE = 'Asia/Tokyo'
+PRODID = '-//calendar-to-google//EN'
+# RFC 5545: content lines are folded at 75 octets
+MAX_LINE_OCTETS = 75
+
+# NAME, ';PARAM=value...' (values may be quoted), value
+_PROPERTY_RE = re.compile(r'([^;:]+)((?:;[^;:=]+=(?:"[^"]*"|[^;:"]*)(?:,(?:"[^"]*"|[^;:",]*))*)*):(.*)', re.S)
+_PARAM_RE = re.compile(r';([^;:=]+)=((?:"[^"]*"|[^;:"]*)(?:,(?:"[^"]*"|[^;:",]*))*)')
+
+# Windows time zone names (Outlook / Exchange TZID) -> IANA
+WINDOWS_ZONES = {
+    'UTC': 'UTC',
+    'Tokyo Standard Time': 'Asia/Tokyo',
+    'Korea Standard Time': 'Asia/Seoul',
+    'China Standard Time': 'Asia/Shanghai',
+    'Taipei Standard Time': 'Asia/Taipei',
+    'Singapore Standard Time': 'Asia/Singapore',
+    'SE Asia Standard Time': 'Asia/Bangkok',
+    'India Standard Time': 'Asia/Kolkata',
+    'Arabian Standard Time': 'Asia/Dubai',
+    'AUS Eastern Standard Time': 'Australia/Sydney',
+    'New Zealand Standard Time': 'Pacific/Auckland',
+    'GMT Standard Time': 'Europe/London',
+    'W. Europe Standard Time': 'Europe/Berlin',
+    'Romance Standard Time': 'Europe/Paris',
+    'Central Europe Standard Time': 'Europe/Budapest',
+    'Central European Standard Time': 'Europe/Warsaw',
+    'Russian Standard Time': 'Europe/Moscow',
+    'Eastern Standard Time': 'America/New_York',
+    'Central Standard Time': 'America/Chicago',
+    'Mountain Standard Time': 'America/Denver',
+    'Pacific Standard Time': 'America/Los_Angeles',
+    'Alaskan Standard Time': 'America/Anchorage',
+    'Hawaiian Standard Time': 'Pacific/Honolulu',
+    'Atlantic Standard Time': 'America/Halifax',
+    'E. South America Standard Time': 'America/Sao_Paulo',
+}
+
+
+@lru_cache(maxsize=64)
+def _zone(name: str) -> Optional[tzinfo]:
+    """IANA zone by name; dateutil's bundled database covers Windows without tzdata."""
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        from dateutil.tz import gettz
+        return gettz(name)
+
+
+@lru_cache(maxsize=64)
+def _fixed_offset(tz: str) -> Optional[timedelta]:
+    """UTC offset of `tz` if it has no daylight saving time (None otherwise)."""
+    zone = _zone(tz)
+    year = datetime.now().year
+    offsets = {datetime(y, m, 1, tzinfo=zone).utcoffset() for y in (year, year + 1) for m in (1, 4, 7, 10)}
+    return offsets.pop() if len(offsets) == 1 else None
+
+
+# --- writer ---
+
+def _escape(value: str) -> str:
+    return (value.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+
+def _fold(line: str) -> str:
+    """Fold a content line at 75 octets without splitting a UTF-8 character."""
+    if len(line.encode('utf-8')) <= MAX_LINE_OCTETS:
+        return line + '\r\n'
+    parts = []
+    current = ''
+    size = 0
+    limit = MAX_LINE_OCTETS
+    for ch in line:
+        octets = len(ch.encode('utf-8'))
+        if size + octets > limit:
+            parts.append(current)
+            # 継続行は先頭の空白1文字分だけ短くなる
+            current, size, limit = '', 0, MAX_LINE_OCTETS - 1
+        current += ch
+        size += octets
+    parts.append(current)
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def _format_offset(offset: timedelta) -> str:
+    minutes = int(offset.total_seconds()) // 60
+    sign = '-' if minutes < 0 else '+'
+    return f"{sign}{abs(minutes) // 60:02d}{abs(minutes) % 60:02d}"
+
+
+def vtimezone_lines(tz: str = TIMEZONE) -> list[str]:
+    """
+    VTIMEZONE component for `tz` if it has a fixed offset (e.g. Asia/Tokyo).
+
+    Zones with daylight saving time get no VTIMEZONE; their times are
+    written in UTC instead (see _format_datetime).
+    """
+    offset = _fixed_offset(tz)
+    if offset is None:
+        return []
+    utc_offset = _format_offset(offset)
+    lines = ['BEGIN:VTIMEZONE', f'TZID:{tz}', f'X-LIC-LOCATION:{tz}', 'BEGIN:STANDARD',
+             'DTSTART:19700101T000000', f'TZOFFSETFROM:{utc_offset}', f'TZOFFSETTO:{utc_offset}',
+             f'TZNAME:{datetime(1970, 1, 1, tzinfo=_zone(tz)).tzname()}', 'END:STANDARD', 'END:VTIMEZONE']
+    return [_fold(line) for line in lines]
+
+
+def _format_datetime(name: str, value: datetime, tz: str) -> str:
+    if value.tzinfo is None:
+        if _fixed_offset(tz) is not None:
+            # write_ics が VTIMEZONE を出力するので TZID 付きの現地時刻で書く
+            return f"{name};TZID={tz}:{value.strftime('%Y%m%dT%H%M%S')}"
+        value = value.replace(tzinfo=_zone(tz))
+    return f"{name}:{value.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}"
+
+
+def iter_vevent_lines(event: ParsedEvent, tz: str = TIMEZONE, stamp: Optional[str] = None) -> Iterator[str]:
+    """Yield the (folded) content lines of one VEVENT."""
+    stamp = stamp or datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    # 同じ予定は同じ UID になる（再エクスポートしても重複しない）
+    uid = hashlib.blake2b(repr(event_key(event)).encode('utf-8'), digest_size=16).hexdigest()
+    lines = ['BEGIN:VEVENT', f'UID:{uid}@calendar-to-google', f'DTSTAMP:{stamp}',
+             f'SUMMARY:{_escape(event.title)}']
+    if event.all_day:
+        # 終日予定の DTEND は排他的（翌日）
+        end = (event.end_date or event.start_date) + timedelta(days=1)
+        lines.append(f"DTSTART;VALUE=DATE:{event.start_date.strftime('%Y%m%d')}")
+        lines.append(f"DTEND;VALUE=DATE:{end.strftime('%Y%m%d')}")
+    else:
+        end = event.end_date or event.start_date + timedelta(hours=1)
+        lines.append(_format_datetime('DTSTART', event.start_date, tz))
+        lines.append(_format_datetime('DTEND', end, tz))
+    if event.recurrence:
+        lines.append(event.recurrence)
+    if event.description:
+        lines.append(f'DESCRIPTION:{_escape(event.description)}')
+    lines.append('END:VEVENT')
+    for line in lines:
+        yield _fold(line)
+
+
+def write_ics(events: Iterable[ParsedEvent], out: Union[str, Path, TextIO], tz: str = TIMEZONE) -> int:
+    """
+    Write events to an .ics file as they are produced.
+
+    Events are consumed one at a time, so any generator (e.g. a streaming
+    import) can be exported in constant memory. Timed events without a
+    tzinfo are written with TZID=`tz` and a matching VTIMEZONE when `tz`
+    has a fixed offset, and in UTC otherwise.
+
+    Args:
+        events: ParsedEvents to write
+        out: Output path or text file object
+        tz: Timezone of naive datetimes
+
+    Returns:
+        Number of VEVENTs written
+    """
+    if not hasattr(out, 'write'):
+        with open(out, 'w', encoding='utf-8', newline='') as f:
+            return write_ics(events, f, tz)
+
+    stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    out.write(_fold('BEGIN:VCALENDAR') + _fold('VERSION:2.0') + _fold(f'PRODID:{PRODID}'))
+    out.writelines(vtimezone_lines(tz))
+    count = 0
+    for event in events:
+        out.writelines(iter_vevent_lines(event, tz, stamp))
+        count += 1
+    out.write(_fold('END:VCALENDAR'))
+    return count
+
+
+# --- reader ---
+
+def _unescape(value: str) -> str:
+    if '\\' not in value:
+        return value
+    out = []
+    chars = iter(value)
+    for ch in chars:
+        if ch == '\\':
+            nxt = next(chars, '')
+            out.append('\n' if nxt in ('n', 'N') else nxt)
+        else:
+            out.append(ch)
+    return ''.join(out)
+
+
+def _unfold(lines: Iterable[str]) -> Iterator[str]:
+    """Join RFC 5545 continuation lines (starting with a space or tab)."""
+    current: Optional[str] = None
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if line[:1] in (' ', '\t') and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def _split_property(line: str) -> tuple[str, dict[str, str], str]:
+    """Split 'NAME;PARAM=V:value' into (NAME, params, value); quoted params may contain ':' or ';'."""
+    match = _PROPERTY_RE.match(line)
+    if match is None:
+        return line.upper(), {}, ''
+    name, params, value = match.groups()
+    if not params:
+        return name.upper(), {}, value
+    return name.upper(), {k.upper(): v.strip('"') for k, v in _PARAM_RE.findall(params)}, value
+
+
+def _parse_stamp(value: str) -> datetime:
+    """Parse YYYYMMDD or YYYYMMDDTHHMMSS (strptime is several times slower)."""
+    year, month, day = int(value[0:4]), int(value[4:6]), int(value[6:8])
+    if len(value) < 15 or value[8] != 'T':
+        return datetime(year, month, day)
+    return datetime(year, month, day, int(value[9:11]), int(value[11:13]), int(value[13:15]))
+
+
+class _TimeZones:
+    """
+    Resolves the TZIDs of one calendar.
+
+    A TZID is tried as an IANA name, then through the file's own VTIMEZONE
+    (Outlook writes e.g. "Tokyo Standard Time" with its rules), then
+    through WINDOWS_ZONES. Unknown TZIDs resolve to None and their times
+    are read as local (floating) times.
+    """
+
+    def __init__(self):
+        self.definitions: dict[str, str] = {}  # TZID -> VTIMEZONE text
+        self._resolved: dict[str, Optional[tzinfo]] = {}
+
+    def add(self, lines: list[str]):
+        """Register an unfolded VTIMEZONE component (BEGIN..END lines)."""
+        tzid = location = None
+        for line in lines:
+            name, _, value = _split_property(line)
+            if name == 'TZID' and tzid is None:
+                tzid = value.strip('"')
+            elif name == 'X-LIC-LOCATION':
+                location = value
+        if tzid:
+            self.definitions[tzid] = '\r\n'.join(lines) + '\r\n'
+            if location and _zone(location):
+                self._resolved[tzid] = _zone(location)
+
+    def get(self, tzid: str) -> Optional[tzinfo]:
+        if tzid not in self._resolved:
+            self._resolved[tzid] = self._resolve(tzid)
+        return self._resolved[tzid]
+
+    def _resolve(self, tzid: str) -> Optional[tzinfo]:
+        try:
+            return ZoneInfo(tzid)
+        except (ZoneInfoNotFoundError, ValueError):
+            pass
+        if tzid in self.definitions:
+            from dateutil.tz import tzical
+            try:
+                return tzical(io.StringIO(self.definitions[tzid])).get(tzid)
+            except ValueError as e:
+                print(f"[ICS] Invalid VTIMEZONE {tzid!r}: {e}")
+        if tzid in WINDOWS_ZONES:
+            return _zone(WINDOWS_ZONES[tzid])
+        print(f"[ICS] Unknown TZID {tzid!r}: reading its times as local time")
+        return None
+
+
+def _parse_datetime(params: dict[str, str], value: str, tz: str,
+                    zones: Optional[_TimeZones] = None) -> tuple[datetime, bool]:
+    """Return (naive datetime in `tz`, all_day) for a DTSTART/DTEND value."""
+    if params.get('VALUE', '').upper() == 'DATE' or len(value) == 8:
+        return _parse_stamp(value[:8]), True
+
+    parsed = _parse_stamp(value)
+    if value.endswith('Z'):
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    elif 'TZID' in params:
+        zone = (zones or _TimeZones()).get(params['TZID'])
+        if zone is None:
+            return parsed, False
+        parsed = parsed.replace(tzinfo=zone)
+    else:
+        # フローティング時刻はそのまま扱う
+        return parsed, False
+    return parsed.astimezone(_zone(tz)).replace(tzinfo=None), False
+
+
+def _build_event(props: dict[str, tuple[dict, str]], tz: str,
+                 zones: Optional[_TimeZones] = None) -> Optional[ParsedEvent]:
+    if 'DTSTART' not in props:
+        return None
+    start, all_day = _parse_datetime(*props['DTSTART'], tz, zones)
+    end = None
+    if 'DTEND' in props:
+        end, _ = _parse_datetime(*props['DTEND'], tz, zones)
+        if all_day:
+            # 排他的な DTEND を ParsedEvent の終了日（当日を含む）に戻す
+            end = end - timedelta(days=1)
+            end = end if end > start else None
+    summary = _unescape(props['SUMMARY'][1]) if 'SUMMARY' in props else ''
+    return ParsedEvent(
+        title=summary or "新しい予定",
+        start_date=start,
+        end_date=end,
+        all_day=all_day,
+        description=_unescape(props['DESCRIPTION'][1]) if 'DESCRIPTION' in props else '',
+        source_text=summary,
+        recurrence=f"RRULE:{props['RRULE'][1]}" if 'RRULE' in props else None,
+    )
+
+
+def iter_ics_events(lines: Iterable[str], tz: str = TIMEZONE) -> Iterator[ParsedEvent]:
+    """
+    Yield a ParsedEvent per VEVENT from iCalendar content lines.
+
+    Only the properties of the current VEVENT are held in memory. Nested
+    components (VALARM) are skipped; events without DTSTART are ignored.
+    VTIMEZONE components are kept to resolve non-IANA TZIDs (see _TimeZones).
+    """
+    props: Optional[dict[str, tuple[dict, str]]] = None
+    depth = 0
+    zones = _TimeZones()
+    vtimezone: Optional[list[str]] = None
+    for line in _unfold(lines):
+        if vtimezone is not None:
+            vtimezone.append(line)
+            if line.upper().startswith('END:VTIMEZONE'):
+                zones.add(vtimezone)
+                vtimezone = None
+            continue
+        name, params, value = _split_property(line)
+        if name == 'BEGIN':
+            if value.upper() == 'VTIMEZONE' and props is None:
+                vtimezone = [line]
+            elif value.upper() == 'VEVENT':
+                props, depth = {}, 0
+            elif props is not None:
+                depth += 1
+        elif name == 'END':
+            if props is not None and depth:
+                depth -= 1
+            elif value.upper() == 'VEVENT' and props is not None:
+                try:
+                    event = _build_event(props, tz, zones)
+                except (ValueError, KeyError) as e:
+                    print(f"[ICS] Skipped invalid VEVENT: {e}")
+                    event = None
+                if event:
+                    yield event
+                props = None
+        elif props is not None and not depth:
+            props.setdefault(name, (params, value))
+
+
+def read_ics(path: Union[str, Path], tz: str = TIMEZONE) -> Iterator[ParsedEvent]:
+    """Stream the events of an .ics file (see iter_ics_events)."""
+    with open(path, encoding='utf-8', errors='replace', newline='') as f:
+        yield from iter_ics_events(f, tz)
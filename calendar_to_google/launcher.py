@@ -6,7 +6,7 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
-from calendar_to_google.tray_app import main
+from calendar_to_google.__main__ import main
 
 if __name__ == "__main__":
     main()
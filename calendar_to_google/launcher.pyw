@@ -17,21 +17,23 @@ def log_message(msg):
     except:
         pass
 
-try:
-    # Add app directory to path
-    sys.path.insert(0, APP_DIR)
+# ProcessPoolExecutor の子プロセスはこのファイルを再実行するため、起動処理はガードの中に置く
+if __name__ == '__main__':
+    try:
+        # Add app directory to path
+        sys.path.insert(0, APP_DIR)
 
-    # Change working directory
-    os.chdir(APP_DIR)
+        # Change working directory
+        os.chdir(APP_DIR)
 
-    log_message(f"Starting from: {APP_DIR}")
-    log_message(f"Python: {sys.executable}")
+        log_message(f"Starting from: {APP_DIR}")
+        log_message(f"Python: {sys.executable}")
 
-    from calendar_to_google.tray_app import main
-    log_message("Imported successfully, starting main()")
-    main()
+        from calendar_to_google.__main__ import main
+        log_message("Imported successfully, starting main()")
+        main()
 
-except Exception as e:
-    import traceback
-    log_message(f"ERROR: {e}")
-    log_message(traceback.format_exc())
+    except Exception as e:
+        import traceback
+        log_message(f"ERROR: {e}")
+        log_message(traceback.format_exc())
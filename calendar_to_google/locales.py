@@ -0,0 +1,627 @@
+"""Locale date grammars and the registry that compiles them into one matcher."""
+
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+
+@dataclass(frozen=True)
+class DatePattern:
+    """
+    A date regex contributed by a locale.
+
+    The regex uses plain positional groups whose meaning depends on `kind`:
+        ymd          year, month, day
+        mdy          month, day, year
+        md           month, day (year inferred)
+        numeric_md   a, b: MM/DD, falling back to DD/MM when invalid
+        month_day    month name, day, optional year
+        day_month    day, month name, optional year
+    `{months}` in the regex is replaced by the merged month-name alternation.
+    Lower `priority` wins when several patterns match with equal confidence;
+    `confidence` is the base score before context (nearby times, weekdays).
+    """
+    regex: str
+    kind: str
+    priority: int
+    confidence: float = 0.9
+
+
+@dataclass(frozen=True)
+class TimePattern:
+    """
+    A time regex contributed by a locale.
+
+    kinds:
+        hm           hour, minute
+        h            hour
+        h_meridiem   hour, optional minute, am/pm suffix
+        meridiem_h   meridiem word, hour, optional minute
+    """
+    regex: str
+    kind: str
+    priority: int
+
+
+@dataclass
+class LocaleGrammar:
+    """Tokens and patterns one locale contributes to the parser."""
+    name: str
+    # token -> day offset from today
+    relative_dates: dict[str, int] = field(default_factory=dict)
+    # token -> (weekday 0=Mon, week offset or None for "next upcoming")
+    weekdays: dict[str, tuple[int, Optional[int]]] = field(default_factory=dict)
+    # month name -> month number
+    months: dict[str, int] = field(default_factory=dict)
+    # meridiem word -> True for afternoon
+    meridiems: dict[str, bool] = field(default_factory=dict)
+    date_patterns: list[DatePattern] = field(default_factory=list)
+    time_patterns: list[TimePattern] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class KeywordHit:
+    """A relative-date or weekday keyword found in text."""
+    token: str
+    start: int
+    end: int
+    kind: str    # 'relative' or 'weekday'
+    value: tuple
+
+
+_DIGIT_RE = re.compile(r'\d')
+
+_REGISTRY: dict[str, LocaleGrammar] = {}
+_COMPILED: dict[tuple[str, ...], 'CompiledGrammar'] = {}
+
+
+def register_locale(grammar: LocaleGrammar):
+    """Register (or replace) a locale grammar."""
+    _REGISTRY[grammar.name] = grammar
+    _COMPILED.clear()
+
+
+def registered_locales() -> list[str]:
+    """Return the names of all registered locales."""
+    return list(_REGISTRY)
+
+
+def compile_grammar(locales: Optional[Iterable[str]] = None) -> 'CompiledGrammar':
+    """Return the merged matcher for `locales` (default: all), compiled once and cached."""
+    names = tuple(locales) if locales is not None else tuple(_REGISTRY)
+    compiled = _COMPILED.get(names)
+    if compiled is None:
+        compiled = _COMPILED[names] = CompiledGrammar([_REGISTRY[n] for n in names])
+    return compiled
+
+
+def trie_regex(tokens: Iterable[str]) -> str:
+    """
+    Compile literal tokens into a prefix-trie regex (e.g. 明(?:日|後日)).
+
+    Matching cost then depends on the text length, not the number of
+    tokens; optional suffixes are greedy, so the longest token wins.
+    """
+    trie: dict = {}
+    for token in tokens:
+        node = trie
+        for ch in token:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node: dict) -> str:
+        branches = [
+            (r'\s+' if ch == ' ' else re.escape(ch)) + build(child)
+            for ch, child in sorted(node.items()) if ch
+        ]
+        if not branches:
+            return ''
+        ends_here = '' in node
+        if len(branches) == 1 and not ends_here:
+            return branches[0]
+        group = '(?:' + '|'.join(branches) + ')'
+        return group + '?' if ends_here else group
+
+    return build(trie)
+
+
+def fold_text(text: str) -> str:
+    """
+    Lowercase `text` without changing its length.
+
+    Keyword and anchor regexes are compiled case-sensitively and run on the
+    folded text: without IGNORECASE or a leading word boundary, every branch starts
+    with a literal and the regex engine can skip non-candidate positions.
+    """
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    return ''.join(ch.lower() if len(ch.lower()) == 1 else ch for ch in text)
+
+
+def _is_word_char(text: str, index: int) -> bool:
+    return 0 <= index < len(text) and (text[index].isalnum() or text[index] == '_')
+
+
+class KeywordIndex:
+    """
+    Keyword automaton: all tokens compiled once into a prefix trie.
+
+    find() reports every keyword in one left-to-right pass with
+    leftmost-longest semantics, so '一昨日' is never reported as '昨日' and
+    '明後日' never as '明日', whatever order the tokens were registered in.
+    The trie runs as a single regex in the regex engine rather than as a
+    Python loop over characters.
+    """
+
+    def __init__(self, keywords: dict[str, tuple[str, tuple]]):
+        self.keywords = keywords
+        # Matched against folded text; ASCII tokens get word boundaries in find()
+        self.regex = re.compile(trie_regex(keywords) or r'(?!)')
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def find(self, text: str) -> list[KeywordHit]:
+        """Return all keyword hits in text order."""
+        folded = fold_text(text)
+        hits = []
+        pos = 0
+        while True:
+            match = self.regex.search(folded, pos)
+            if match is None:
+                return hits
+            start, end = match.span()
+            token = ' '.join(match.group(0).split())
+            if token.isascii() and (_is_word_char(folded, start - 1) or _is_word_char(folded, end)):
+                # e.g. 'monday' inside 'mondays'; retry from the next character
+                pos = start + 1
+                continue
+            kind, value = self.keywords[token]
+            hits.append(KeywordHit(token, start, end, kind, value))
+            pos = end
+
+
+def _alternation(patterns: list[str]) -> tuple[re.Pattern, list[tuple[int, int]]]:
+    """
+    Join patterns as (?P<rN>...) alternatives.
+
+    Returns the compiled regex and, per rule, the (index into match.groups(),
+    group count) slice holding that rule's own positional groups.
+    """
+    parts = []
+    slices = []
+    group = 1
+    for i, pattern in enumerate(patterns):
+        count = re.compile(pattern).groups
+        parts.append(f'(?P<r{i}>{pattern})')
+        # Rule groups are numbered group+1 .. group+count, i.e. groups()[group:group+count]
+        slices.append((group, count))
+        group += 1 + count
+    return re.compile('|'.join(parts) or r'(?!)', re.IGNORECASE), slices
+
+
+def _scan(anchor_re: re.Pattern, regex: re.Pattern, text: str, folded: str) -> Iterable[re.Match]:
+    """
+    finditer() for `regex`, trying it only where `anchor_re` matches.
+
+    Every date/time rule begins with a digit, a month name or a meridiem
+    word, so the full alternation (which grows with each locale) runs at a
+    handful of positions instead of at every character.
+    """
+    pos = 0
+    while True:
+        anchor = anchor_re.search(folded, pos)
+        if anchor is None:
+            return
+        match = regex.match(text, anchor.start())
+        if match is None:
+            pos = anchor.start() + 1
+        else:
+            yield match
+            pos = max(match.end(), anchor.start() + 1)
+
+
+class CompiledGrammar:
+    """All registered locales merged into one keyword regex, one date regex and one time regex."""
+
+    def __init__(self, grammars: list[LocaleGrammar]):
+        self.locales = [g.name for g in grammars]
+        self.keywords: dict[str, tuple[str, tuple]] = {}
+        self.months: dict[str, int] = {}
+        self.meridiems: dict[str, bool] = {}
+        date_patterns: list[DatePattern] = []
+        time_patterns: list[TimePattern] = []
+
+        for grammar in grammars:
+            for token, offset in grammar.relative_dates.items():
+                self.keywords[token.lower()] = ('relative', (offset,))
+            for token, value in grammar.weekdays.items():
+                self.keywords[token.lower()] = ('weekday', value)
+            self.months.update({k.lower(): v for k, v in grammar.months.items()})
+            self.meridiems.update({k.lower(): v for k, v in grammar.meridiems.items()})
+            date_patterns.extend(grammar.date_patterns)
+            time_patterns.extend(grammar.time_patterns)
+
+        # One automaton over every locale's keywords ('一昨日' beats '昨日')
+        self.keyword_index = KeywordIndex(self.keywords)
+
+        month_alt = '(?:' + trie_regex(self.months) + ')' if self.months else r'(?!)'
+        meridiem_alt = '(?:' + trie_regex(self.meridiems) + ')' if self.meridiems else r'(?!)'
+        self._month_alt, self._meridiem_alt = month_alt, meridiem_alt
+        # Per-rule regexes for scan_rule(), compiled on first use
+        self._rule_res: dict = {}
+
+        self.date_rules = sorted(date_patterns, key=lambda p: p.priority)
+        self.date_re, self._date_slices = _alternation(
+            [p.regex.replace('{months}', month_alt) for p in self.date_rules]
+        )
+        self.time_rules = sorted(time_patterns, key=lambda p: p.priority)
+        self.time_re, self._time_slices = _alternation(
+            [p.regex.replace('{meridiems}', meridiem_alt) for p in self.time_rules]
+        )
+
+        # Pre-check regexes for candidate_lines() (matched against folded text)
+        self._cjk_keyword_re = re.compile(trie_regex(k for k in self.keywords if not k.isascii()) or r'(?!)')
+        self._ascii_keyword_re = re.compile(trie_regex(k for k in self.keywords if k.isascii()) or r'(?!)')
+
+        # Positions where a date or time rule can start (matched against folded text)
+        self.anchor_re = re.compile('|'.join(filter(None, (r'\d', trie_regex([*self.months, *self.meridiems])))))
+
+    def candidate_lines(self, text: str) -> list[str]:
+        """
+        Return the lines of text that may contain a date, in order.
+
+        Every date and time rule needs a digit, so only lines with a digit
+        or a keyword can yield an event. Each of the three pre-check
+        regexes (digits, non-ASCII keywords, ASCII keywords) starts with a
+        literal or a character class, so the regex engine scans prose
+        quickly; after a hit the scan jumps to the next line.
+        """
+        folded = fold_text(text)
+        starts: set[int] = set()
+        for regex, ascii_words in ((_DIGIT_RE, False), (self._cjk_keyword_re, False),
+                                   (self._ascii_keyword_re, True)):
+            pos = 0
+            while True:
+                match = regex.search(folded, pos)
+                if match is None:
+                    break
+                start, end = match.span()
+                if ascii_words and (_is_word_char(folded, start - 1) or _is_word_char(folded, end)):
+                    pos = start + 1
+                    continue
+                line_start = text.rfind('\n', 0, start) + 1
+                starts.add(line_start)
+                pos = text.find('\n', end)
+                if pos < 0:
+                    break
+
+        lines = []
+        for line_start in sorted(starts):
+            line_end = text.find('\n', line_start)
+            lines.append(text[line_start:line_end if line_end >= 0 else len(text)])
+        return lines
+
+    # --- keywords ---
+
+    def find_keywords(self, text: str) -> list[KeywordHit]:
+        """Return all keyword hits, leftmost-longest, in one pass."""
+        return self.keyword_index.find(text)
+
+    @staticmethod
+    def resolve_keyword(hit: KeywordHit, now: datetime) -> datetime:
+        """Turn a keyword hit into a date (midnight)."""
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        if hit.kind == 'relative':
+            return today + timedelta(days=hit.value[0])
+
+        weekday, week_offset = hit.value
+        if week_offset is None:
+            days_ahead = weekday - now.weekday()
+            if days_ahead <= 0:
+                days_ahead += 7
+        else:
+            # Week-relative: 今週 (0) / 来週 (1), weeks start on Monday
+            days_ahead = weekday - now.weekday() + 7 * week_offset
+        return today + timedelta(days=days_ahead)
+
+    # --- dates ---
+
+    def find_dates(self, text: str, now: datetime) -> list[tuple[DatePattern, re.Match, datetime]]:
+        """Return (rule, match, date) for every valid date match in one pass, in text order."""
+        results = []
+        for match in _scan(self.anchor_re, self.date_re, text, fold_text(text)):
+            index = int(match.lastgroup[1:])
+            rule = self.date_rules[index]
+            groups = self._rule_groups(match, self._date_slices[index])
+            date = self._resolve_date(rule.kind, groups, now)
+            if date is not None:
+                results.append((rule, match, date))
+        return results
+
+    @staticmethod
+    def _rule_groups(match: re.Match, group_slice: tuple[int, int]) -> tuple:
+        """Return the positional groups belonging to the matched rule."""
+        start, count = group_slice
+        return match.groups()[start:start + count]
+
+    def _resolve_date(self, kind: str, groups: tuple, now: datetime) -> Optional[datetime]:
+        """Build a datetime from a rule's groups, or None if invalid."""
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        year: Optional[int] = None
+        try:
+            if kind == 'ymd':
+                year, month, day = int(groups[0]), int(groups[1]), int(groups[2])
+            elif kind == 'mdy':
+                month, day, year = int(groups[0]), int(groups[1]), int(groups[2])
+            elif kind == 'md':
+                month, day = int(groups[0]), int(groups[1])
+            elif kind == 'numeric_md':
+                a, b = int(groups[0]), int(groups[1])
+                # US style (MM/DD) first; DD/MM if that is invalid (e.g. 25/12)
+                month, day = (a, b) if 1 <= a <= 12 else (b, a)
+            elif kind == 'month_day':
+                month = self.months[groups[0].lower()]
+                day = int(groups[1])
+                year = int(groups[2]) if groups[2] else None
+            elif kind == 'day_month':
+                day = int(groups[0])
+                month = self.months[groups[1].lower()]
+                year = int(groups[2]) if groups[2] else None
+            else:
+                return None
+
+            if year is not None:
+                return datetime(year, month, day)
+            date = datetime(now.year, month, day)
+            if date < today:
+                date = datetime(now.year + 1, month, day)
+            return date
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    # --- single rules (explain mode) ---
+
+    def rule_regex(self, rule) -> re.Pattern:
+        """Compiled regex of one date or time rule (compiled on first use)."""
+        regex = self._rule_res.get(rule)
+        if regex is None:
+            source = rule.regex.replace('{months}', self._month_alt).replace('{meridiems}', self._meridiem_alt)
+            regex = self._rule_res[rule] = re.compile(source, re.IGNORECASE)
+        return regex
+
+    def scan_rule(self, rule, text: str, now: datetime,
+                  folded: Optional[str] = None) -> list[tuple[re.Match, object]]:
+        """
+        Return (match, value) for every match of one date or time rule on its own.
+
+        Parsing uses the merged regexes; this is for explain mode, which
+        times each rule separately and also sees matches the merged scan
+        gave to another rule. `value` is the resolved date or (hour,
+        minute), or None if the match is not a valid date/time.
+        """
+        results = []
+        for match in _scan(self.anchor_re, self.rule_regex(rule), text, fold_text(text) if folded is None else folded):
+            if isinstance(rule, DatePattern):
+                value = self._resolve_date(rule.kind, match.groups(), now)
+            else:
+                value = self._resolve_time(rule.kind, match.groups())
+            results.append((match, value))
+        return results
+
+    # --- times ---
+
+    def find_times(self, text: str) -> list[tuple[TimePattern, re.Match, tuple[int, int]]]:
+        """Return (rule, match, (hour, minute)) for every valid time match in one pass."""
+        results = []
+        for match in _scan(self.anchor_re, self.time_re, text, fold_text(text)):
+            index = int(match.lastgroup[1:])
+            rule = self.time_rules[index]
+            groups = self._rule_groups(match, self._time_slices[index])
+            value = self._resolve_time(rule.kind, groups)
+            if value is not None:
+                results.append((rule, match, value))
+        return results
+
+    def _resolve_time(self, kind: str, groups: tuple) -> Optional[tuple[int, int]]:
+        """Build (hour, minute) from a rule's groups, or None if invalid."""
+        try:
+            pm: Optional[bool] = None
+            if kind == 'hm':
+                hour, minute = int(groups[0]), int(groups[1])
+            elif kind == 'h':
+                hour, minute = int(groups[0]), 0
+            elif kind == 'h_meridiem':
+                hour = int(groups[0])
+                minute = int(groups[1]) if groups[1] else 0
+                pm = self.meridiems[groups[2].lower()]
+            elif kind == 'meridiem_h':
+                pm = self.meridiems[groups[0].lower()]
+                hour = int(groups[1])
+                minute = int(groups[2]) if groups[2] else 0
+            else:
+                return None
+        except (ValueError, KeyError, TypeError):
+            return None
+
+        if pm is not None:
+            if pm and hour < 12:
+                hour += 12
+            elif not pm and hour == 12:
+                hour = 0
+        if 0 <= hour < 24 and 0 <= minute < 60:
+            return hour, minute
+        return None
+
+
+# --- Built-in locales ---
+
+_JP_WEEKDAY_NAMES = '月火水木金土日'
+
+JAPANESE = LocaleGrammar(
+    name='ja',
+    relative_dates={
+        '今日': 0,
+        '本日': 0,
+        '明日': 1,
+        '明後日': 2,
+        'あさって': 2,
+        '昨日': -1,
+        '一昨日': -2,
+        'おととい': -2,
+    },
+    weekdays={
+        **{f'{d}曜{s}': (i, None) for i, d in enumerate(_JP_WEEKDAY_NAMES) for s in ('', '日')},
+        **{f'{w}{sep}{d}曜{s}': (i, off)
+           for w, off in (('今週', 0), ('来週', 1), ('再来週', 2))
+           for sep in ('', 'の')
+           for i, d in enumerate(_JP_WEEKDAY_NAMES) for s in ('', '日')},
+        # 12/25(水) のように日付に添える曜日
+        **{f'{o}{d}{c}': (i, None)
+           for o, c in (('(', ')'), ('（', '）'))
+           for i, d in enumerate(_JP_WEEKDAY_NAMES)},
+    },
+    meridiems={'午前': False, '午後': True},
+    date_patterns=[
+        # 2024年12月25日
+        DatePattern(r'(\d{4})年(\d{1,2})月(\d{1,2})日', 'ymd', 30),
+        # 12月25日
+        DatePattern(r'(\d{1,2})月(\d{1,2})日', 'md', 40),
+        # 2024/12/25 or 2024-12-25
+        DatePattern(r'(\d{4})[/\-](\d{1,2})[/\-](\d{1,2})', 'ymd', 50),
+        # 12/25 or 12-25（バージョン・分数・スコアと紛らわしいので低め）
+        DatePattern(r'(\d{1,2})[/\-](\d{1,2})', 'numeric_md', 60, 0.4),
+    ],
+    time_patterns=[
+        # 午後3時 / 午前10時30分
+        TimePattern(r'({meridiems})\s*(\d{1,2})時(?:(\d{1,2})分)?', 'meridiem_h', 5),
+        # 14:30 or 14時30分
+        TimePattern(r'(\d{1,2})[:時](\d{2})(?:分)?', 'hm', 10),
+        # 14時
+        TimePattern(r'(\d{1,2})時(?!\d)', 'h', 20),
+    ],
+)
+
+_EN_WEEKDAYS = {
+    'monday': 0, 'tuesday': 1, 'tues': 1, 'wednesday': 2, 'thursday': 3, 'thurs': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6,
+}
+
+ENGLISH = LocaleGrammar(
+    name='en',
+    relative_dates={
+        'today': 0,
+        'tonight': 0,
+        'tomorrow': 1,
+        'day after tomorrow': 2,
+        'yesterday': -1,
+    },
+    weekdays={
+        **{name: (i, None) for name, i in _EN_WEEKDAYS.items()},
+        **{f'next {name}': (i, None) for name, i in _EN_WEEKDAYS.items()},
+        **{f'this {name}': (i, 0) for name, i in _EN_WEEKDAYS.items()},
+        **{f'{name} next week': (i, 1) for name, i in _EN_WEEKDAYS.items()},
+    },
+    months={
+        'jan': 1, 'january': 1,
+        'feb': 2, 'february': 2,
+        'mar': 3, 'march': 3,
+        'apr': 4, 'april': 4,
+        'may': 5,
+        'jun': 6, 'june': 6,
+        'jul': 7, 'july': 7,
+        'aug': 8, 'august': 8,
+        'sep': 9, 'sept': 9, 'september': 9,
+        'oct': 10, 'october': 10,
+        'nov': 11, 'november': 11,
+        'dec': 12, 'december': 12,
+    },
+    meridiems={'am': False, 'a.m.': False, 'pm': True, 'p.m.': True},
+    date_patterns=[
+        # Month DD, YYYY (e.g., December 25, 2024) / Month DD (e.g., Dec 25)
+        DatePattern(r'\b({months})\.?\s+(\d{1,2})(?:st|nd|rd|th)?\b(?:,?\s+(\d{4}))?', 'month_day', 10),
+        # DD Month YYYY (e.g., 25 December 2024) / DD Month (e.g., 25 Dec)
+        DatePattern(r'\b(\d{1,2})(?:st|nd|rd|th)?\s+({months})\b\.?(?:,?\s+(\d{4}))?', 'day_month', 20),
+        # 12/25/2024 (US style)
+        DatePattern(r'\b(\d{1,2})/(\d{1,2})/(\d{4})\b', 'mdy', 45),
+    ],
+    time_patterns=[
+        # 2pm, 2:30pm
+        TimePattern(r'(\d{1,2})(?::(\d{2}))?\s*({meridiems})(?![a-z])', 'h_meridiem', 8),
+    ],
+)
+
+_ZH_WEEKDAY_NAMES = '一二三四五六日'
+
+CHINESE = LocaleGrammar(
+    name='zh',
+    relative_dates={
+        '今天': 0,
+        '明天': 1,
+        '后天': 2,
+        '後天': 2,
+        '大后天': 3,
+        '昨天': -1,
+        '前天': -2,
+    },
+    weekdays={
+        **{f'{p}{d}': (i, None) for p in ('星期', '周', '週', '礼拜', '禮拜') for i, d in enumerate(_ZH_WEEKDAY_NAMES)},
+        **{'星期天': (6, None), '礼拜天': (6, None)},
+        **{f'{w}{p}{d}': (i, off)
+           for w, off in (('这', 0), ('本', 0), ('下', 1))
+           for p in ('星期', '周', '个星期', '礼拜')
+           for i, d in enumerate(_ZH_WEEKDAY_NAMES)},
+    },
+    meridiems={'上午': False, '早上': False, '下午': True, '晚上': True},
+    date_patterns=[
+        DatePattern(r'(\d{4})年(\d{1,2})月(\d{1,2})[号號]', 'ymd', 31),
+        DatePattern(r'(\d{1,2})月(\d{1,2})[号號]', 'md', 41),
+    ],
+    time_patterns=[
+        # 下午3点 / 上午10点30分
+        TimePattern(r'({meridiems})\s*(\d{1,2})[点點](?:(\d{1,2})分)?', 'meridiem_h', 6),
+        # 15点30分
+        TimePattern(r'(\d{1,2})[点點](\d{1,2})分', 'hm', 11),
+        # 15点
+        TimePattern(r'(\d{1,2})[点點](?!\d)', 'h', 21),
+    ],
+)
+
+_KO_WEEKDAY_NAMES = '월화수목금토일'
+
+KOREAN = LocaleGrammar(
+    name='ko',
+    relative_dates={
+        '오늘': 0,
+        '내일': 1,
+        '모레': 2,
+        '어제': -1,
+        '그제': -2,
+        '그저께': -2,
+    },
+    weekdays={
+        **{f'{d}요일': (i, None) for i, d in enumerate(_KO_WEEKDAY_NAMES)},
+        **{f'{w}{sep}{d}요일': (i, off)
+           for w, off in (('이번주', 0), ('다음주', 1))
+           for sep in ('', ' ')
+           for i, d in enumerate(_KO_WEEKDAY_NAMES)},
+    },
+    meridiems={'오전': False, '오후': True},
+    date_patterns=[
+        DatePattern(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일', 'ymd', 32),
+        DatePattern(r'(\d{1,2})월\s*(\d{1,2})일', 'md', 42),
+    ],
+    time_patterns=[
+        # 오후 3시 / 오전 10시 30분
+        TimePattern(r'({meridiems})\s*(\d{1,2})시(?:\s*(\d{1,2})분)?', 'meridiem_h', 7),
+        # 15시 30분
+        TimePattern(r'(\d{1,2})시\s*(\d{1,2})분', 'hm', 12),
+        # 15시
+        TimePattern(r'(\d{1,2})시(?!\d)', 'h', 22),
+    ],
+)
+
+for _grammar in (JAPANESE, ENGLISH, CHINESE, KOREAN):
+    register_locale(_grammar)
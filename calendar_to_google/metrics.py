@@ -0,0 +1,220 @@
+"""Lightweight timers and counters for the clipboard-to-calendar pipeline."""
+
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Optional
+
+from .config import CONFIG_DIR, write_atomic
+
+# Set to 1 to enable metrics collection at startup
+METRICS_ENV = 'CALENDAR_TO_GOOGLE_METRICS'
+METRICS_JSON_FILE = CONFIG_DIR / 'metrics.json'
+METRICS_PROM_FILE = CONFIG_DIR / 'metrics.prom'
+
+# Shared no-op context returned by timer() while disabled
+_NULL_TIMER = nullcontext()
+
+
+class _TimerStat:
+    """Aggregated durations for one named timer."""
+
+    __slots__ = ('count', 'total', 'min', 'max', 'last')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+        self.last = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def as_dict(self) -> dict:
+        return {
+            'count': self.count,
+            'total_ms': round(self.total * 1000, 3),
+            'avg_ms': round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            'min_ms': round(self.min * 1000, 3) if self.count else 0.0,
+            'max_ms': round(self.max * 1000, 3),
+            'last_ms': round(self.last * 1000, 3),
+        }
+
+
+class _Timer:
+    """Context manager recording elapsed time into a Metrics instance."""
+
+    __slots__ = ('_metrics', '_name', '_start')
+
+    def __init__(self, metrics: 'Metrics', name: str):
+        self._metrics = metrics
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._metrics.observe(self._name, time.perf_counter() - self._start)
+        return False
+
+
+class Metrics:
+    """Named timers and counters with JSON / Prometheus export."""
+
+    def __init__(self, enabled: bool = False):
+        """
+        Initialize metrics registry.
+
+        Args:
+            enabled: Whether to record anything (disabled calls are no-ops)
+        """
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._timers: dict[str, _TimerStat] = {}
+        self._counters: dict[str, float] = {}
+        self._started = time.time()
+        self._exporter: Optional[threading.Thread] = None
+        self._exporter_stop = threading.Event()
+        self._export = None
+
+    def timer(self, name: str):
+        """Return a context manager timing the enclosed block as `name`."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def observe(self, name: str, seconds: float):
+        """Record a duration (in seconds) for timer `name`."""
+        if not self.enabled:
+            return
+        with self._lock:
+            stat = self._timers.get(name)
+            if stat is None:
+                stat = self._timers[name] = _TimerStat()
+            stat.add(seconds)
+
+    def incr(self, name: str, value: float = 1):
+        """Increment counter `name`."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def reset(self):
+        """Clear all recorded values."""
+        with self._lock:
+            self._timers.clear()
+            self._counters.clear()
+            self._started = time.time()
+
+    def snapshot(self) -> dict:
+        """Return a JSON-serializable copy of all metrics."""
+        with self._lock:
+            return {
+                'timestamp': time.time(),
+                'uptime_seconds': round(time.time() - self._started, 3),
+                'timers': {name: stat.as_dict() for name, stat in sorted(self._timers.items())},
+                'counters': dict(sorted(self._counters.items())),
+            }
+
+    def to_prometheus(self) -> str:
+        """Render metrics in the Prometheus text exposition format."""
+        lines = []
+        snap = self.snapshot()
+        for name, stat in snap['timers'].items():
+            metric = 'calendar_to_google_' + _sanitize(name) + '_seconds'
+            lines.append(f"# TYPE {metric} summary")
+            lines.append(f"{metric}_count {stat['count']}")
+            lines.append(f"{metric}_sum {stat['total_ms'] / 1000:.6f}")
+            lines.append(f"# TYPE {metric}_max gauge")
+            lines.append(f"{metric}_max {stat['max_ms'] / 1000:.6f}")
+        for name, value in snap['counters'].items():
+            metric = 'calendar_to_google_' + _sanitize(name) + '_total'
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        return '\n'.join(lines) + '\n'
+
+    def summary(self) -> str:
+        """Return a short human-readable summary (for the Status menu)."""
+        snap = self.snapshot()
+        if not snap['timers'] and not snap['counters']:
+            return "Metrics: no data" if self.enabled else "Metrics: disabled"
+        lines = []
+        for name, stat in snap['timers'].items():
+            lines.append(f"{name}: {stat['avg_ms']:.1f}ms avg ({stat['count']})")
+        for name, value in snap['counters'].items():
+            lines.append(f"{name}: {value:g}")
+        return '\n'.join(lines)
+
+    def write_json(self, path: Path = METRICS_JSON_FILE):
+        """Write a JSON snapshot to `path`."""
+        write_atomic(path, json.dumps(self.snapshot(), indent=2))
+
+    def write_prometheus(self, path: Path = METRICS_PROM_FILE):
+        """Write a Prometheus text file to `path` (node_exporter textfile format)."""
+        write_atomic(path, self.to_prometheus())
+
+    def start_exporter(self, interval: float = 60.0, fmt: str = 'json', path: Optional[Path] = None):
+        """
+        Periodically export metrics in a background thread.
+
+        Args:
+            interval: Seconds between exports
+            fmt: 'json' or 'prometheus'
+            path: Output file (defaults to the config dir)
+        """
+        if not self.enabled or self._exporter is not None:
+            return
+
+        if fmt == 'prometheus':
+            write, target = self.write_prometheus, path or METRICS_PROM_FILE
+        else:
+            write, target = self.write_json, path or METRICS_JSON_FILE
+
+        def export_loop():
+            while not self._exporter_stop.wait(interval):
+                self._flush()
+
+        self._export = (write, target)
+        self._exporter_stop.clear()
+        self._exporter = threading.Thread(target=export_loop, daemon=True)
+        self._exporter.start()
+
+    def stop_exporter(self):
+        """Stop the periodic exporter and write a final snapshot."""
+        if self._exporter is None:
+            return
+        self._exporter_stop.set()
+        self._exporter = None
+        self._flush()
+
+    def _flush(self):
+        """Write one export using the exporter's format and path."""
+        if self._export is None:
+            return
+        write, target = self._export
+        try:
+            write(target)
+        except Exception as e:
+            print(f"Metrics export failed: {e}")
+
+
+def _sanitize(name: str) -> str:
+    """Convert a metric name like 'parse.date' to a Prometheus-safe name."""
+    return ''.join(c if c.isalnum() else '_' for c in name)
+
+
+# Process-wide registry
+metrics = Metrics(enabled=os.environ.get(METRICS_ENV, '') not in ('', '0'))
@@ -0,0 +1,177 @@
+"""On-demand sampling profiler covering all application threads."""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Optional
+
+from .config import CONFIG_DIR
+
+# Set to a number of seconds to profile right after startup
+PROFILE_ENV = 'CALENDAR_TO_GOOGLE_PROFILE'
+PROFILE_DIR = CONFIG_DIR / 'profiles'
+
+# Sampling never uses more than this fraction of wall time
+MAX_OVERHEAD = 0.05
+
+
+class SamplingProfiler:
+    """Periodically sample the stacks of every thread in the process."""
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 64):
+        """
+        Initialize the profiler.
+
+        Args:
+            interval: Target seconds between samples
+            max_depth: Maximum frames recorded per stack
+        """
+        self.interval = max(interval, 0.001)
+        self.max_depth = max_depth
+        self.stacks: Counter = Counter()
+        self.sample_count = 0
+        self.sampling_time = 0.0
+        self.duration = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        # stacks はサンプラースレッドが更新するので、読み書きはこのロックの下で行う
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether a capture is in progress."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, duration: float, on_done: Optional[Callable[['SamplingProfiler'], None]] = None):
+        """
+        Start sampling in a background thread for `duration` seconds.
+
+        Args:
+            duration: Seconds to sample
+            on_done: Called from the sampler thread when the capture ends
+        """
+        if self.running:
+            return
+        with self._lock:
+            self.stacks.clear()
+        self.sample_count = 0
+        self.sampling_time = 0.0
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(duration, on_done), name="profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self, duration: float, on_done):
+        """Sampler loop."""
+        own_ident = threading.get_ident()
+        started = time.perf_counter()
+        deadline = started + duration
+        while not self._stop.is_set():
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            self._sample(own_ident)
+            cost = time.perf_counter() - now
+            self.sampling_time += cost
+            # Back off so sampling stays within MAX_OVERHEAD of wall time
+            self._stop.wait(max(self.interval, cost / MAX_OVERHEAD))
+        self.duration = time.perf_counter() - started
+        if on_done:
+            on_done(self)
+
+    def _sample(self, own_ident: int):
+        """Record one stack per thread."""
+        names = {t.ident: t.name for t in threading.enumerate()}
+        sampled = Counter()
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            labels = []
+            while frame is not None and len(labels) < self.max_depth:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            labels.append(names.get(ident, f"thread-{ident}"))
+            labels.reverse()
+            sampled[';'.join(labels)] += 1
+        with self._lock:
+            self.stacks.update(sampled)
+        self.sample_count += 1
+
+    def snapshot(self) -> Counter:
+        """Return a copy of the sampled stacks that is safe to iterate while sampling."""
+        with self._lock:
+            return Counter(self.stacks)
+
+    def collapsed(self) -> str:
+        """Return stacks in the collapsed format used by flamegraph.pl / speedscope."""
+        return ''.join(f"{stack} {count}\n" for stack, count in self.snapshot().most_common())
+
+    def report(self, limit: int = 30) -> str:
+        """Return a text report of the hottest functions."""
+        own = Counter()
+        total = Counter()
+        for stack, count in self.snapshot().items():
+            frames = stack.split(';')[1:]
+            if not frames:
+                continue
+            own[frames[-1]] += count
+            for label in set(frames):
+                total[label] += count
+
+        overhead = self.sampling_time / self.duration * 100 if self.duration else 0.0
+        lines = [
+            f"Samples: {self.sample_count}  Duration: {self.duration:.2f}s  "
+            f"Sampler overhead: {overhead:.1f}%",
+            "",
+            f"{'self':>8} {'total':>8}  function",
+        ]
+        for label, count in total.most_common(limit):
+            lines.append(f"{own[label]:>8} {count:>8}  {label}")
+        return '\n'.join(lines) + '\n'
+
+    def write(self, output_dir: Path = PROFILE_DIR) -> tuple[Path, Path]:
+        """
+        Write the profile report and collapsed stacks.
+
+        Returns:
+            (report path, collapsed stack path)
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        stem = 'profile-' + datetime.now().strftime('%Y%m%d-%H%M%S')
+        report_path = output_dir / f"{stem}.txt"
+        collapsed_path = output_dir / f"{stem}.collapsed"
+        report_path.write_text(self.report(), encoding='utf-8')
+        collapsed_path.write_text(self.collapsed(), encoding='utf-8')
+        return report_path, collapsed_path
+
+
+def _frame_label(frame) -> str:
+    """Return 'Class.function (file:line)' for a frame."""
+    return _code_label(frame.f_code)
+
+
+@lru_cache(maxsize=4096)
+def _code_label(code) -> str:
+    # f_locals は他スレッドのフレームでは読まない（スナップショットの作成と参照の保持を避ける）
+    name = getattr(code, 'co_qualname', code.co_name)  # co_qualname: Python 3.11+
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def startup_profile_seconds() -> float:
+    """Return the startup profiling duration requested via PROFILE_ENV (0 if none)."""
+    try:
+        return max(float(os.environ.get(PROFILE_ENV, '0')), 0.0)
+    except ValueError:
+        return 0.0
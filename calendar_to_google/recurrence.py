@@ -0,0 +1,124 @@
+"""Recurrence phrase detection (毎週/every Monday) and RRULE helpers."""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from typing import Iterator, Optional
+
+from dateutil.rrule import rrulestr
+
+RRULE_DAYS = ('MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU')
+JP_DAY_NAMES = '月火水木金土日'
+
+_JP_DAY_INDEX = {name: i for i, name in enumerate(JP_DAY_NAMES)}
+_EN_DAY_INDEX = {
+    'mon': 0, 'monday': 0,
+    'tue': 1, 'tues': 1, 'tuesday': 1,
+    'wed': 2, 'wednesday': 2,
+    'thu': 3, 'thur': 3, 'thurs': 3, 'thursday': 3,
+    'fri': 4, 'friday': 4,
+    'sat': 5, 'saturday': 5,
+    'sun': 6, 'sunday': 6,
+}
+_WEEKDAYS_RULE = 'FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR'
+
+_EN_DAYS = '|'.join(sorted(_EN_DAY_INDEX, key=len, reverse=True))
+
+# (pattern, handler name) - checked in order, first match wins
+_PATTERNS = [
+    (re.compile(r'毎週\s*(?:の)?\s*([月火水木金土日])曜(?:日)?'), 'jp_weekly_day'),
+    (re.compile(r'毎月\s*(\d{1,2})日'), 'monthly_day'),
+    (re.compile(r'(?:毎平日|平日毎日)'), 'weekdays'),
+    (re.compile(r'毎日'), 'daily'),
+    (re.compile(r'毎週'), 'weekly'),
+    (re.compile(r'毎月'), 'monthly'),
+    (re.compile(r'(?i)\bevery\s+(' + _EN_DAYS + r')s?\b'), 'en_weekly_day'),
+    (re.compile(r'(?i)\b(?:every\s+weekday|weekdays)\b'), 'weekdays'),
+    (re.compile(r'(?i)\b(?:every\s+day|daily)\b'), 'daily'),
+    (re.compile(r'(?i)\bevery\s+(\d{1,2})(?:st|nd|rd|th)\s+of\s+(?:the\s+|each\s+)?month\b'), 'monthly_day'),
+    (re.compile(r'(?i)\b(?:every\s+week|weekly)\b'), 'weekly'),
+    (re.compile(r'(?i)\b(?:every\s+month|monthly)\b'), 'monthly'),
+]
+
+
+@dataclass
+class Recurrence:
+    """Detected recurrence phrase."""
+    rule: str                      # e.g. 'FREQ=WEEKLY;BYDAY=MO'
+    phrase: str                    # matched text, removed from the title
+    weekday: Optional[int] = None  # anchor weekday (0=Monday)
+    monthday: Optional[int] = None # anchor day of month
+    needs_date: bool = False       # bare adjective (weekly report): only a recurrence next to a date
+
+    @property
+    def rrule(self) -> str:
+        """Return the RFC 5545 line used by the Calendar API."""
+        return 'RRULE:' + self.rule
+
+
+def detect_recurrence(text: str) -> Optional[Recurrence]:
+    """Return the recurrence described in text, if any."""
+    for pattern, kind in _PATTERNS:
+        match = pattern.search(text)
+        if not match:
+            continue
+        phrase = match.group(0)
+        if kind == 'jp_weekly_day':
+            day = _JP_DAY_INDEX[match.group(1)]
+            return Recurrence(f'FREQ=WEEKLY;BYDAY={RRULE_DAYS[day]}', phrase, weekday=day)
+        if kind == 'en_weekly_day':
+            day = _EN_DAY_INDEX[match.group(1).lower()]
+            return Recurrence(f'FREQ=WEEKLY;BYDAY={RRULE_DAYS[day]}', phrase, weekday=day)
+        if kind == 'monthly_day':
+            day = int(match.group(1))
+            if not 1 <= day <= 31:
+                continue
+            return Recurrence(f'FREQ=MONTHLY;BYMONTHDAY={day}', phrase, monthday=day)
+        # 'daily' / 'weekly' などの形容詞は「日報」「週次レポート」の意味でも使われる
+        bare = phrase[0].isascii() and not phrase.lower().startswith('every')
+        if kind == 'weekdays':
+            return Recurrence(_WEEKDAYS_RULE, phrase, needs_date=bare)
+        return Recurrence(f'FREQ={kind.upper()}', phrase, needs_date=bare)
+    return None
+
+
+def iter_occurrences(start: datetime, rrule: str, after: Optional[datetime] = None) -> Iterator[datetime]:
+    """
+    Lazily iterate occurrences of `rrule` starting at `start`.
+
+    Args:
+        start: DTSTART of the series
+        rrule: 'RRULE:...' line or bare rule
+        after: Only yield occurrences at or after this time
+    """
+    rule = rrulestr(rrule if rrule.startswith('RRULE:') else 'RRULE:' + rrule, dtstart=start)
+    if after is None:
+        return iter(rule)
+    return (dt for dt in rule if dt >= after)
+
+
+def first_occurrence(start: datetime, rrule: str) -> datetime:
+    """Return the first occurrence on or after `start` (start itself if none)."""
+    return next(iter_occurrences(start, rrule), start)
+
+
+def preview_occurrences(start: datetime, rrule: str, count: int = 3) -> list[datetime]:
+    """Return the first `count` occurrences (for display only)."""
+    return list(islice(iter_occurrences(start, rrule), count))
+
+
+def describe_rrule(rrule: str) -> str:
+    """Return a short Japanese description such as '毎週 月曜'."""
+    parts = dict(
+        item.split('=', 1) for item in rrule.replace('RRULE:', '').split(';') if '=' in item
+    )
+    freq = parts.get('FREQ', '')
+    if freq == 'DAILY':
+        return '毎日'
+    if freq == 'WEEKLY':
+        days = [JP_DAY_NAMES[RRULE_DAYS.index(d)] for d in parts.get('BYDAY', '').split(',') if d in RRULE_DAYS]
+        return '毎週 ' + '・'.join(days) + '曜' if days else '毎週'
+    if freq == 'MONTHLY':
+        return f"毎月 {parts['BYMONTHDAY']}日" if 'BYMONTHDAY' in parts else '毎月'
+    return rrule
@@ -0,0 +1,205 @@
+"""Record clipboard change events to JSONL and replay them without a display."""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+# Set to a file path to record clipboard events while the tray app runs
+RECORD_ENV = 'CALENDAR_TO_GOOGLE_RECORD'
+# plain (default) | redact | hash
+RECORD_MODE_ENV = 'CALENDAR_TO_GOOGLE_RECORD_MODE'
+
+RECORD_MODES = ('plain', 'redact', 'hash')
+
+# Characters kept by redact mode so dates and times still parse
+_KEEP_CHARS = set('0123456789/-:.,年月日時分曜今明後昨一来週毎 \t\r\n')
+
+
+def redact_text(text: str) -> str:
+    """Mask everything except digits, whitespace and date/time markers."""
+    out = []
+    for ch in text:
+        if ch in _KEEP_CHARS:
+            out.append(ch)
+        elif ch.isascii() and ch.isalpha():
+            out.append('x')
+        else:
+            out.append('〇')
+    return ''.join(out)
+
+
+class ClipboardRecorder:
+    """Append clipboard change events to a JSONL file."""
+
+    def __init__(self, path: Path, mode: str = 'plain'):
+        """
+        Initialize recorder.
+
+        Args:
+            path: JSONL output file (appended to)
+            mode: 'plain' stores text, 'redact' masks letters, 'hash' stores only a digest
+        """
+        if mode not in RECORD_MODES:
+            raise ValueError(f"Unknown record mode: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+
+    def record(self, text: str):
+        """Write one change event."""
+        entry = {
+            't': round(time.monotonic() - self._start, 6),
+            'ts': time.time(),
+            'len': len(text),
+        }
+        if self.mode == 'plain':
+            entry['text'] = text
+        elif self.mode == 'redact':
+            entry['text'] = redact_text(text)
+        else:
+            entry['sha256'] = hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self._file.flush()
+
+    def close(self):
+        """Close the output file."""
+        with self._lock:
+            self._file.close()
+
+
+def recorder_from_env() -> Optional[ClipboardRecorder]:
+    """Create a recorder if RECORD_ENV is set."""
+    path = os.environ.get(RECORD_ENV)
+    if not path:
+        return None
+    return ClipboardRecorder(Path(path), os.environ.get(RECORD_MODE_ENV, 'plain'))
+
+
+def load_recording(path: Path) -> Iterator[tuple[float, str]]:
+    """
+    Read a recording lazily.
+
+    Yields:
+        (offset seconds, text) pairs; hashed entries yield a placeholder of
+        the same length so de-duplication and payload size are preserved
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            text = entry.get('text')
+            if text is None:
+                placeholder = f"<{entry['sha256'][:16]}>"
+                text = placeholder.ljust(entry.get('len', len(placeholder)), '.')
+            yield float(entry.get('t', 0.0)), text
+
+
+@dataclass
+class ReplayStats:
+    """Result of one replay run."""
+    events: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    latencies: list = field(default_factory=list)
+
+    def summary(self) -> str:
+        """Return a one-line human-readable summary."""
+        lat = sorted(self.latencies)
+        if lat:
+            p50 = lat[len(lat) // 2] * 1000
+            p99 = lat[min(len(lat) - 1, int(len(lat) * 0.99))] * 1000
+        else:
+            p50 = p99 = 0.0
+        return (
+            f"events={self.events} wall={self.wall_seconds:.3f}s cpu={self.cpu_seconds:.3f}s "
+            f"latency p50={p50:.2f}ms p99={p99:.2f}ms"
+        )
+
+
+class ClipboardReplayer:
+    """Feed a recording through ClipboardMonitor's change path."""
+
+    def __init__(self, monitor, speed: float = 1.0):
+        """
+        Initialize replayer.
+
+        Args:
+            monitor: ClipboardMonitor whose callback receives the events
+                     (e.g. one wrapping TrayApp._on_clipboard_change)
+            speed: Time scale; 1.0 is real time, 0 replays as fast as possible
+        """
+        self.monitor = monitor
+        self.speed = speed
+
+    def replay(self, path: Path) -> ReplayStats:
+        """
+        Replay a recording.
+
+        Latency is measured from each event's scheduled time until the
+        monitor callback returns.
+        """
+        stats = ReplayStats()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+
+        for offset, text in load_recording(path):
+            if self.speed > 0:
+                due = wall_start + offset / self.speed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            else:
+                due = time.perf_counter()
+
+            self.monitor._handle_content(text)
+            stats.latencies.append(time.perf_counter() - due)
+            stats.events += 1
+
+        stats.wall_seconds = time.perf_counter() - wall_start
+        stats.cpu_seconds = time.process_time() - cpu_start
+        return stats
+
+
+def headless_target(parser=None) -> Callable[[str], None]:
+    """Return a callback running the detection step of TrayApp without any UI."""
+    from .date_parser import DateParser
+    parser = parser or DateParser()
+
+    def on_change(text: str, source=None):
+        parser.parse(text)
+
+    return on_change
+
+
+def main(argv=None):
+    """Replay a recording headlessly and print latency / CPU figures."""
+    from .clipboard_monitor import ClipboardMonitor
+
+    arg_parser = argparse.ArgumentParser(description="Replay recorded clipboard events")
+    arg_parser.add_argument('recording', type=Path, help="JSONL file written by ClipboardRecorder")
+    arg_parser.add_argument('--speed', type=float, default=0.0,
+                            help="time scale (1 = real time, 0 = as fast as possible)")
+    args = arg_parser.parse_args(argv)
+
+    monitor = ClipboardMonitor(headless_target())
+    stats = ClipboardReplayer(monitor, speed=args.speed).replay(args.recording)
+    print(stats.summary())
+
+
+if __name__ == '__main__':
+    main()
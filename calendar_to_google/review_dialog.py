@@ -0,0 +1,257 @@
+"""Batch review dialog for many detected events."""
+
+import customtkinter as ctk
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+from .date_parser import ParsedEvent
+
+DIALOG_WIDTH = 720
+DIALOG_HEIGHT = 560
+ROW_HEIGHT = 36
+
+DATE_FORMAT = '%Y/%m/%d'
+DATETIME_FORMAT = '%Y/%m/%d %H:%M'
+
+
+@dataclass
+class ReviewRow:
+    """Editable state of one detected event."""
+    event: ParsedEvent
+    selected: bool
+    title: str
+    when: str
+
+
+def _format_when(event: ParsedEvent) -> str:
+    return event.start_date.strftime(DATE_FORMAT if event.all_day else DATETIME_FORMAT)
+
+
+def _parse_when(value: str) -> Optional[tuple[datetime, bool]]:
+    """Parse the 'when' column back into (start, all_day)."""
+    value = value.strip()
+    for fmt, all_day in ((DATETIME_FORMAT, False), (DATE_FORMAT, True)):
+        try:
+            return datetime.strptime(value, fmt), all_day
+        except ValueError:
+            continue
+    return None
+
+
+class _RowWidgets:
+    """One reusable row of widgets bound to whichever model row is visible."""
+
+    def __init__(self, parent):
+        self.index: Optional[int] = None
+        self.selected_var = ctk.BooleanVar(master=parent)
+        self.title_var = ctk.StringVar(master=parent)
+        self.when_var = ctk.StringVar(master=parent)
+
+        self.frame = ctk.CTkFrame(parent, height=ROW_HEIGHT, fg_color="transparent")
+        self.check = ctk.CTkCheckBox(self.frame, text="", width=24, variable=self.selected_var)
+        self.check.pack(side="left", padx=(5, 5))
+        self.when_entry = ctk.CTkEntry(self.frame, textvariable=self.when_var, width=140)
+        self.when_entry.pack(side="left", padx=(0, 5))
+        self.title_entry = ctk.CTkEntry(self.frame, textvariable=self.title_var)
+        self.title_entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
+
+
+class EventReviewDialog:
+    """
+    Review many detected events at once.
+
+    Only enough row widgets to fill the viewport are created; scrolling
+    rebinds them to different model rows, so the dialog stays responsive
+    with thousands of events.
+    """
+
+    def __init__(self, master: Any):
+        self.master = master
+        self.rows: list[ReviewRow] = []
+        self.result: Optional[list[ParsedEvent]] = None
+        self._offset = 0
+        self._pool: list[_RowWidgets] = []
+        self._selected_count = 0
+
+    def show(self, events: list[ParsedEvent]) -> Optional[list[ParsedEvent]]:
+        """Show the dialog modally and return the selected (edited) events, or None if cancelled."""
+        self.rows = [
+            ReviewRow(event=e, selected=True, title=e.title, when=_format_when(e))
+            for e in events
+        ]
+        self.result = None
+        self._offset = 0
+        self._selected_count = len(self.rows)
+
+        self.window = ctk.CTkToplevel(self.master) if self.master else ctk.CTk()
+        self.window.title(f"Review {len(events)} events")
+        x = (self.window.winfo_screenwidth() - DIALOG_WIDTH) // 2
+        y = (self.window.winfo_screenheight() - DIALOG_HEIGHT) // 2
+        self.window.geometry(f"{DIALOG_WIDTH}x{DIALOG_HEIGHT}+{x}+{y}")
+        self.window.attributes('-topmost', True)
+        self.window.protocol("WM_DELETE_WINDOW", self._cancel)
+
+        self._create_widgets()
+        self._render()
+
+        self.window.lift()
+        self.window.focus_force()
+        self.window.grab_set()
+        self.window.wait_window()
+        return self.result
+
+    def _create_widgets(self):
+        """Create header, virtual list viewport and buttons."""
+        main_frame = ctk.CTkFrame(self.window, corner_radius=10)
+        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+        header = ctk.CTkFrame(main_frame, fg_color="transparent")
+        header.pack(fill="x", padx=10, pady=(10, 5))
+        self.select_all_var = ctk.BooleanVar(master=self.window, value=True)
+        ctk.CTkCheckBox(
+            header, text="Select all", variable=self.select_all_var,
+            command=self._toggle_all, font=("Roboto", 12)
+        ).pack(side="left")
+        self.count_label = ctk.CTkLabel(header, text="", font=("Roboto", 12))
+        self.count_label.pack(side="right")
+
+        body = ctk.CTkFrame(main_frame, fg_color="transparent")
+        body.pack(fill="both", expand=True, padx=10)
+        self.viewport = ctk.CTkFrame(body, fg_color="transparent")
+        self.viewport.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(body, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        # Fixed pool sized to the viewport
+        list_height = DIALOG_HEIGHT - 200
+        for _ in range(max(1, min(len(self.rows), list_height // ROW_HEIGHT))):
+            widgets = _RowWidgets(self.viewport)
+            widgets.frame.pack(fill="x", pady=1)
+            widgets.check.configure(command=lambda w=widgets: self._commit(w))
+            for entry in (widgets.when_entry, widgets.title_entry):
+                entry.bind('<FocusOut>', lambda e, w=widgets: self._commit(w))
+            self._pool.append(widgets)
+
+        for widget in (self.viewport, *[w.frame for w in self._pool]):
+            widget.bind('<MouseWheel>', self._on_wheel)
+            widget.bind('<Button-4>', lambda e: self._scroll_to(self._offset - 1))
+            widget.bind('<Button-5>', lambda e: self._scroll_to(self._offset + 1))
+
+        btn_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        btn_frame.pack(fill="x", padx=10, pady=(10, 10))
+        self.add_button = ctk.CTkButton(
+            btn_frame, text="Add Selected", command=self._submit,
+            width=150, height=40, font=("Roboto", 13, "bold")
+        )
+        self.add_button.pack(side="right")
+        ctk.CTkButton(
+            btn_frame, text="Cancel", command=self._cancel,
+            width=100, height=40, fg_color="transparent", border_width=2,
+            text_color=("gray10", "#DCE4EE"), font=("Roboto", 13)
+        ).pack(side="right", padx=(0, 10))
+
+        self.window.bind('<Escape>', lambda e: self._cancel())
+
+    def _commit(self, widgets: _RowWidgets):
+        """Copy a pooled row's widget values back into the model."""
+        if widgets.index is None:
+            return
+        row = self.rows[widgets.index]
+        selected = widgets.selected_var.get()
+        if selected != row.selected:
+            self._selected_count += 1 if selected else -1
+            row.selected = selected
+        row.title = widgets.title_var.get()
+        row.when = widgets.when_var.get()
+        self._update_count()
+
+    def _render(self):
+        """Bind pooled widgets to the rows starting at the current offset."""
+        for i, widgets in enumerate(self._pool):
+            self._commit(widgets)
+            index = self._offset + i
+            if index < len(self.rows):
+                row = self.rows[index]
+                widgets.index = index
+                widgets.selected_var.set(row.selected)
+                widgets.title_var.set(row.title)
+                widgets.when_var.set(row.when)
+                widgets.frame.pack(fill="x", pady=1)
+            else:
+                widgets.index = None
+                widgets.frame.pack_forget()
+
+        total = max(len(self.rows), 1)
+        self.scrollbar.set(self._offset / total, min(1.0, (self._offset + len(self._pool)) / total))
+        self._update_count()
+
+    def _scroll_to(self, offset: int):
+        max_offset = max(0, len(self.rows) - len(self._pool))
+        offset = max(0, min(offset, max_offset))
+        if offset != self._offset:
+            self._offset = offset
+            self._render()
+
+    def _on_scrollbar(self, action, *args):
+        """Handle CTkScrollbar 'moveto' / 'scroll' commands."""
+        if action == 'moveto':
+            self._scroll_to(int(float(args[0]) * len(self.rows)))
+        elif action == 'scroll':
+            amount = float(args[0])
+            step = len(self._pool) if len(args) > 1 and args[1] == 'pages' else 1
+            direction = (amount > 0) - (amount < 0)
+            self._scroll_to(self._offset + direction * max(1, abs(int(amount))) * step)
+
+    def _on_wheel(self, event):
+        self._scroll_to(self._offset - (1 if event.delta > 0 else -1) * 3)
+
+    def _toggle_all(self):
+        value = self.select_all_var.get()
+        for row in self.rows:
+            row.selected = value
+        self._selected_count = len(self.rows) if value else 0
+        for widgets in self._pool:
+            if widgets.index is not None:
+                widgets.selected_var.set(value)
+        self._update_count()
+
+    def _update_count(self):
+        selected = self._selected_count
+        self.count_label.configure(text=f"{selected} / {len(self.rows)} selected")
+        self.add_button.configure(text=f"Add Selected ({selected})")
+
+    def _submit(self):
+        """Build ParsedEvents for selected rows; rows with invalid dates are skipped."""
+        for widgets in self._pool:
+            self._commit(widgets)
+
+        events = []
+        for row in self.rows:
+            if not row.selected:
+                continue
+            parsed_when = _parse_when(row.when)
+            if not parsed_when:
+                print(f"[Review] Skipped invalid date: {row.when}")
+                continue
+            start, all_day = parsed_when
+            events.append(ParsedEvent(
+                title=row.title or "新しい予定",
+                start_date=start,
+                all_day=all_day,
+                description=row.event.description,
+                source_text=row.event.source_text,
+                recurrence=row.event.recurrence,
+                source_app=row.event.source_app,
+            ))
+        self.result = events
+        self.window.destroy()
+
+    def _cancel(self):
+        self.result = None
+        self.window.destroy()
+
+
+def show_review_dialog(master: Any, events: list[ParsedEvent]) -> Optional[list[ParsedEvent]]:
+    """Show the batch review dialog and return the events to add."""
+    return EventReviewDialog(master).show(events)
@@ -0,0 +1,215 @@
+"""Route events to calendars by keyword and source-app rules."""
+
+import json
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from .config import CONFIG_DIR, DEFAULT_ACCOUNT
+from .date_parser import ParsedEvent
+from .locales import fold_text, trie_regex
+from .metrics import metrics
+
+ROUTING_FILE = CONFIG_DIR / 'routing.json'
+DEFAULT_CALENDAR = 'primary'
+# Background refresh interval of the calendar list (seconds)
+CALENDAR_REFRESH_INTERVAL = 15 * 60
+
+
+@dataclass
+class RoutingRule:
+    """
+    Send matching events to `calendar` (a calendar name or ID) of `account`.
+
+    A rule matches when the event text contains any of `keywords` or the
+    clipboard came from one of `source_apps`. Earlier rules win. Calendar
+    names are resolved for the default account only; rules for other
+    accounts give a calendar ID or 'primary'.
+    """
+    calendar: str
+    keywords: list[str] = field(default_factory=list)
+    source_apps: list[str] = field(default_factory=list)
+    account: str = DEFAULT_ACCOUNT
+
+
+class CalendarListCache:
+    """
+    Calendar name -> ID map, refreshed off the insert path.
+
+    refresh() is only ever called from a background timer (or explicitly),
+    so resolve() is a dict lookup and never waits for the API.
+    """
+
+    def __init__(self, client, interval: float = CALENDAR_REFRESH_INTERVAL):
+        """
+        Initialize cache.
+
+        Args:
+            client: GoogleCalendarClient (anything with list_calendars())
+            interval: Seconds between background refreshes
+        """
+        self.client = client
+        self.interval = interval
+        self._ids: dict[str, str] = {}
+        self._items: list[dict] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Refresh now and then every `interval` seconds on a daemon thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="calendar-list", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background refresh."""
+        self._stop.set()
+
+    def refresh(self) -> int:
+        """Fetch the calendar list and swap in the new map; returns the number of calendars."""
+        calendars = self.client.list_calendars()
+        if not calendars:
+            return 0
+        self.seed(calendars)
+        metrics.incr('routing.calendar_refresh')
+        return len(calendars)
+
+    def seed(self, calendars: list[dict], only_if_empty: bool = False):
+        """
+        Replace the map with calendarList items.
+
+        Args:
+            calendars: calendarList items (from the API or a warm-state snapshot)
+            only_if_empty: Keep the current map if one was already fetched
+        """
+        ids: dict[str, str] = {}
+        items = []
+        for item in calendars:
+            ids[item['id']] = item['id']
+            ids.setdefault(item.get('summary', '').lower(), item['id'])
+            if item.get('primary'):
+                ids[DEFAULT_CALENDAR] = item['id']
+            items.append({'id': item['id'], 'summary': item.get('summary', ''), 'primary': bool(item.get('primary'))})
+        with self._lock:
+            if only_if_empty and self._ids:
+                return
+            self._ids = ids
+            self._items = items
+
+    def snapshot(self) -> list[dict]:
+        """Return the current calendars as minimal calendarList items (id, summary, primary)."""
+        with self._lock:
+            return list(self._items)
+
+    def resolve(self, calendar: str) -> Optional[str]:
+        """Return the calendar ID for a name or ID, or None if unknown."""
+        with self._lock:
+            ids = self._ids
+        return ids.get(calendar) or ids.get(calendar.lower())
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Calendar list refresh failed: {e}")
+            self._stop.wait(self.interval)
+
+
+class Router:
+    """
+    All routing rules compiled into one matcher.
+
+    Keywords of every rule share a single trie regex (one pass over the
+    text) and source apps a dict lookup, so the cost per event does not
+    depend on the number of rules.
+    """
+
+    def __init__(self, rules: list[RoutingRule], calendars: Optional[CalendarListCache] = None):
+        """
+        Initialize router.
+
+        Args:
+            rules: Routing rules in priority order
+            calendars: Cache used to turn calendar names into IDs
+        """
+        self.rules = rules
+        self.calendars = calendars
+        self._keyword_rule: dict[str, int] = {}
+        self._app_rule: dict[str, int] = {}
+        for index, rule in enumerate(rules):
+            for keyword in rule.keywords:
+                self._keyword_rule.setdefault(' '.join(keyword.lower().split()), index)
+            for app in rule.source_apps:
+                self._app_rule.setdefault(app.lower(), index)
+        self._keyword_re = re.compile(trie_regex(self._keyword_rule)) if self._keyword_rule else None
+
+    @classmethod
+    def from_file(cls, path: Path = ROUTING_FILE, calendars: Optional[CalendarListCache] = None) -> 'Router':
+        """
+        Load rules from JSON, e.g.
+        {"rules": [{"keywords": ["会議"], "calendar": "Work"},
+                   {"source_apps": ["slack"], "calendar": "Team"}]}
+        A missing or invalid file yields a router that always returns primary.
+        """
+        rules = []
+        if path.exists():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                for item in data.get('rules', []):
+                    rules.append(RoutingRule(
+                        calendar=item['calendar'],
+                        keywords=list(item.get('keywords', [])),
+                        source_apps=list(item.get('source_apps', [])),
+                        account=item.get('account', DEFAULT_ACCOUNT),
+                    ))
+            except Exception as e:
+                print(f"Routing rules ignored ({path}): {e}")
+                rules = []
+        return cls(rules, calendars)
+
+    def match(self, text: str, source_app: Optional[str] = None) -> Optional[RoutingRule]:
+        """Return the highest-priority rule matching text or source app."""
+        best = self._app_rule.get(source_app.lower()) if source_app else None
+        if self._keyword_re is not None:
+            for hit in self._keyword_re.finditer(fold_text(text)):
+                index = self._keyword_rule[' '.join(hit.group(0).split())]
+                if best is None or index < best:
+                    best = index
+                    # 先頭のルールより優先されるものはないので打ち切る
+                    if best == 0:
+                        break
+        return self.rules[best] if best is not None else None
+
+    def route_event(self, event: ParsedEvent, source_app: Optional[str] = None) -> tuple[str, str]:
+        """Return (account, calendar ID) for the event's text and source app (default: event.source_app)."""
+        text = ' '.join((event.title, event.description, event.source_text))
+        rule = self.match(text, source_app or event.source_app)
+        if rule is None:
+            return DEFAULT_ACCOUNT, DEFAULT_CALENDAR
+        return rule.account, self._calendar_id(rule)
+
+    def route(self, text: str, source_app: Optional[str] = None) -> str:
+        """Return the calendar ID for an event (primary if no rule or unknown calendar)."""
+        rule = self.match(text, source_app)
+        if rule is None:
+            return DEFAULT_CALENDAR
+        return self._calendar_id(rule)
+
+    def _calendar_id(self, rule: RoutingRule) -> str:
+        """Resolve a rule's calendar name to an ID without calling the API."""
+        if rule.account == DEFAULT_ACCOUNT and self.calendars is not None:
+            calendar_id = self.calendars.resolve(rule.calendar)
+            if calendar_id:
+                return calendar_id
+        # 一覧未取得でもIDそのもの（xxx@group.calendar.google.com）ならそのまま使う
+        if '@' in rule.calendar or rule.calendar == DEFAULT_CALENDAR:
+            return rule.calendar
+        metrics.incr('routing.unresolved')
+        return DEFAULT_CALENDAR
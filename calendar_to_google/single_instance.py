@@ -0,0 +1,211 @@
+"""Single-instance lock and local IPC so a second launch hands its command to the running app."""
+
+import hashlib
+import json
+import os
+import secrets
+import sys
+import tempfile
+import threading
+import time
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+from typing import Callable, Optional
+
+from .config import CONFIG_DIR
+
+LOCK_FILE = CONFIG_DIR / 'instance.lock'
+# Address, pid and auth key of the running instance (readable by this user only)
+INFO_FILE = CONFIG_DIR / 'instance.json'
+# How long a second launch keeps trying to reach an instance that is still starting up
+CONNECT_TIMEOUT = 5.0
+# Longest AF_UNIX socket path most platforms accept
+_MAX_SOCKET_PATH = 100
+
+
+def _address(directory: Path) -> tuple[str, str]:
+    """Return (family, address) of the IPC channel for a config dir."""
+    tag = hashlib.blake2b(str(directory).encode('utf-8'), digest_size=8).hexdigest()
+    if sys.platform == 'win32':
+        return 'AF_PIPE', rf'\\.\pipe\calendar-to-google-{tag}'
+    path = str(directory / 'instance.sock')
+    if len(path) > _MAX_SOCKET_PATH:
+        path = os.path.join(tempfile.gettempdir(), f'calendar-to-google-{tag}.sock')
+    return 'AF_UNIX', path
+
+
+def _write_private(path: Path, data: str):
+    """Write a file readable by this user only (created 0600, then renamed into place)."""
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _try_lock(f) -> bool:
+    """Take a non-blocking exclusive OS lock on an open file."""
+    try:
+        if sys.platform == 'win32':
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(f):
+    try:
+        if sys.platform == 'win32':
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    except OSError:
+        pass
+
+
+class InstanceLock:
+    """
+    OS file lock held by the running instance, plus its IPC listener.
+
+    The lock is an flock()/msvcrt byte lock, so the OS drops it when the
+    process exits or crashes. A lock file left behind by a dead instance
+    is therefore simply acquired again (a stale lock), and its leftover
+    socket is removed before binding. Messages are JSON over
+    multiprocessing.connection (Unix socket / named pipe), authenticated
+    with a per-run key from INFO_FILE.
+    """
+
+    def __init__(self, lock_path: Path = LOCK_FILE, info_path: Path = INFO_FILE):
+        """
+        Initialize lock.
+
+        Args:
+            lock_path: File the OS lock is taken on
+            info_path: File the listener address and auth key are published in
+        """
+        self.lock_path = lock_path
+        self.info_path = info_path
+        self._file = None
+        self._listener: Optional[Listener] = None
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def acquire(self) -> bool:
+        """Become the running instance; False if another live instance holds the lock."""
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        f = open(self.lock_path, 'a+')
+        if not _try_lock(f):
+            f.close()
+            return False
+        self._file = f
+
+        family, address = _address(self.lock_path.parent)
+        if family == 'AF_UNIX' and os.path.exists(address):
+            # 前回の異常終了で残ったソケット（ロックを持っているので安全に消せる）
+            os.unlink(address)
+        authkey = secrets.token_bytes(32)
+        self._listener = Listener(address, family=family, authkey=authkey)
+        _write_private(self.info_path, json.dumps({
+            'pid': os.getpid(), 'family': family, 'address': address, 'authkey': authkey.hex(),
+        }))
+        return True
+
+    def serve(self, handler: Callable[[dict], Optional[dict]]):
+        """
+        Answer commands from later launches on a daemon thread.
+
+        Args:
+            handler: Called with each message dict; its return value is the reply
+        """
+        if self._listener is None or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._serve, args=(handler,), name="instance-ipc", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """Stop listening and release the lock."""
+        self._closed = True
+        if self._listener is not None:
+            try:
+                self._listener.close()
+            except OSError:
+                pass
+            self._listener = None
+        if self._file is not None:
+            try:
+                self.info_path.unlink()
+            except OSError:
+                pass
+            _unlock(self._file)
+            self._file.close()
+            self._file = None
+
+    def _serve(self, handler: Callable[[dict], Optional[dict]]):
+        while not self._closed:
+            try:
+                conn = self._listener.accept()
+            except Exception:
+                # close() または認証失敗
+                if self._closed or self._listener is None:
+                    return
+                continue
+            with conn:
+                try:
+                    if not conn.poll(CONNECT_TIMEOUT):
+                        continue
+                    message = json.loads(conn.recv_bytes(1 << 16))
+                    reply = handler(message) if isinstance(message, dict) else None
+                    conn.send_bytes(json.dumps(reply or {'ok': True}).encode('utf-8'))
+                except Exception as e:
+                    print(f"Instance command failed: {e}")
+
+
+def send_command(message: dict, info_path: Path = INFO_FILE,
+                 timeout: float = CONNECT_TIMEOUT) -> Optional[dict]:
+    """
+    Send a command to the running instance and return its reply.
+
+    Retries until `timeout` while the instance is still starting (no info
+    file or listener yet). Returns None if it cannot be reached.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while True:
+        reply = _send_once(message, info_path, max(deadline - time.monotonic(), 0.1))
+        if reply is not None or time.monotonic() >= deadline:
+            return reply
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+
+
+def _send_once(message: dict, info_path: Path, timeout: float) -> Optional[dict]:
+    try:
+        with open(info_path, 'r', encoding='utf-8') as f:
+            info = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    result: list[dict] = []
+
+    def talk():
+        # Client() には接続タイムアウトがないので別スレッドで待つ
+        try:
+            with Client(info['address'], family=info['family'], authkey=bytes.fromhex(info['authkey'])) as conn:
+                conn.send_bytes(json.dumps(message).encode('utf-8'))
+                if conn.poll(timeout):
+                    result.append(json.loads(conn.recv_bytes(1 << 16)))
+        except Exception:
+            pass
+
+    thread = threading.Thread(target=talk, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return result[0] if result else None
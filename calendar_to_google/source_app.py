@@ -0,0 +1,232 @@
+"""Clipboard source-application metadata and the allow/deny policy applied before reading."""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .config import CONFIG_DIR
+from .locales import trie_regex
+
+SOURCES_FILE = CONFIG_DIR / 'sources.json'
+
+# Apps whose copies are code, commands or secrets, not schedules
+# (matched as substrings of the process name / window class)
+DEFAULT_DENY = (
+    'code', 'pycharm', 'idea', 'webstorm', 'sublime_text', 'vim', 'emacs',
+    'terminal', 'iterm', 'konsole', 'alacritty', 'kitty', 'wezterm', 'xterm',
+    'powershell', 'cmd.exe', 'windowsterminal',
+    '1password', 'keepass', 'bitwarden', 'lastpass', 'dashlane',
+)
+# Clipboard formats password managers set to ask monitors to look away
+CONCEALED_TARGETS = (
+    'x-kde-passwordmanagerhint',
+    'org.nspasteboard.concealedtype',
+    'excludeclipboardcontentfrommonitorprocessing',
+)
+# Seconds allowed for each helper process on X11/Wayland
+PROBE_TIMEOUT = 0.5
+
+
+@dataclass(frozen=True)
+class ClipboardSource:
+    """Where a clipboard change came from, as far as the platform tells."""
+    app: str = ""            # process / application name (e.g. 'slack.exe', 'Slack')
+    window_class: str = ""   # window class or bundle identifier
+    window_title: str = ""
+    targets: tuple[str, ...] = ()  # clipboard formats / MIME types on offer
+
+    @property
+    def name(self) -> str:
+        """Lower-case app name without extension, as used by routing rules."""
+        app = self.app.lower()
+        return app[:-4] if app.endswith('.exe') else app
+
+    @property
+    def known(self) -> bool:
+        """True if the platform reported anything about the source."""
+        return bool(self.app or self.window_class or self.targets)
+
+
+class SourcePolicy:
+    """
+    Allow/deny rules for clipboard sources, compiled once.
+
+    Deny patterns and allow patterns are each merged into one trie regex
+    and searched in the app name and window class, so checking a source
+    costs the same however many apps are listed. Deny wins; a non-empty
+    allow list admits only matching apps. Sources the platform cannot
+    identify are let through so detection keeps working there.
+    """
+
+    def __init__(self, allow: Iterable[str] = (), deny: Iterable[str] = DEFAULT_DENY,
+                 deny_targets: Iterable[str] = CONCEALED_TARGETS):
+        """
+        Initialize policy.
+
+        Args:
+            allow: App/window-class substrings to accept (empty: everything not denied)
+            deny: App/window-class substrings to ignore
+            deny_targets: Clipboard formats that mark content as not to be read
+        """
+        self.allow = [a.lower() for a in allow if a]
+        self.deny = [d.lower() for d in deny if d]
+        self.deny_targets = frozenset(t.lower() for t in deny_targets)
+        self._allow_re = re.compile(trie_regex(self.allow)) if self.allow else None
+        self._deny_re = re.compile(trie_regex(self.deny)) if self.deny else None
+
+    @classmethod
+    def from_file(cls, path: Path = SOURCES_FILE) -> 'SourcePolicy':
+        """
+        Load the policy from JSON, e.g.
+        {"allow": ["outlook", "slack"], "deny": ["code", "keepass"]}
+        Missing keys keep the defaults; a missing or invalid file yields the defaults.
+        """
+        if not path.exists():
+            return cls()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return cls(
+                allow=data.get('allow', ()),
+                deny=data.get('deny', DEFAULT_DENY),
+                deny_targets=data.get('deny_targets', CONCEALED_TARGETS),
+            )
+        except Exception as e:
+            print(f"Source policy ignored ({path}): {e}")
+            return cls()
+
+    def allows(self, source: Optional[ClipboardSource]) -> bool:
+        """Return True if clipboard content from `source` should be read and parsed."""
+        if source is None or not source.known:
+            return True
+        if any(t.lower() in self.deny_targets for t in source.targets):
+            return False
+        ident = f"{source.app}\n{source.window_class}".lower()
+        if self._deny_re is not None and self._deny_re.search(ident):
+            return False
+        if self._allow_re is not None:
+            return self._allow_re.search(ident) is not None
+        return True
+
+
+# --- platform probes ---
+
+def change_count() -> Optional[int]:
+    """
+    Return the platform's clipboard change counter, or None if there is none.
+
+    Windows and macOS expose one, so an unchanged clipboard is detected
+    without reading it; on X11/Wayland the text has to be read to compare.
+    """
+    try:
+        if sys.platform == 'win32':
+            import ctypes
+            return ctypes.windll.user32.GetClipboardSequenceNumber()
+        if sys.platform == 'darwin':
+            from AppKit import NSPasteboard
+            return NSPasteboard.generalPasteboard().changeCount()
+    except Exception:
+        pass
+    return None
+
+
+def probe_source() -> ClipboardSource:
+    """Describe the app that owns the clipboard (best effort, never reads the content)."""
+    try:
+        if sys.platform == 'win32':
+            return _probe_windows()
+        if sys.platform == 'darwin':
+            return _probe_macos()
+        return _probe_unix()
+    except Exception:
+        return ClipboardSource()
+
+
+_WINDOWS_FORMATS: dict[str, int] = {}
+
+
+def _probe_windows() -> ClipboardSource:
+    import ctypes
+    from ctypes import wintypes
+
+    user32, kernel32 = ctypes.windll.user32, ctypes.windll.kernel32
+    # クリップボードの所有ウィンドウ（なければ前面のウィンドウ）
+    hwnd = user32.GetClipboardOwner() or user32.GetForegroundWindow()
+    buffer = ctypes.create_unicode_buffer(256)
+    user32.GetClassNameW(hwnd, buffer, 256)
+    window_class = buffer.value
+    user32.GetWindowTextW(hwnd, buffer, 256)
+    window_title = buffer.value
+
+    app = ""
+    pid = wintypes.DWORD()
+    user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+    handle = kernel32.OpenProcess(0x1000, False, pid.value)  # PROCESS_QUERY_LIMITED_INFORMATION
+    if handle:
+        try:
+            size = wintypes.DWORD(260)
+            path = ctypes.create_unicode_buffer(260)
+            if kernel32.QueryFullProcessImageNameW(handle, 0, path, ctypes.byref(size)):
+                app = os.path.basename(path.value)
+        finally:
+            kernel32.CloseHandle(handle)
+
+    # 形式の有無だけを調べる（OpenClipboard も内容の取得もしない）
+    if not _WINDOWS_FORMATS:
+        _WINDOWS_FORMATS['text/plain'] = 13  # CF_UNICODETEXT
+        for name in ('HTML Format', 'text/calendar', 'ExcludeClipboardContentFromMonitorProcessing'):
+            _WINDOWS_FORMATS[name] = user32.RegisterClipboardFormatW(name)
+    targets = tuple(name for name, fmt in _WINDOWS_FORMATS.items() if user32.IsClipboardFormatAvailable(fmt))
+    return ClipboardSource(app, window_class, window_title, targets)
+
+
+def _probe_macos() -> ClipboardSource:
+    try:
+        from AppKit import NSPasteboard, NSWorkspace
+    except ImportError:
+        # pyobjc が無い環境では送信元は分からない
+        return ClipboardSource()
+    front = NSWorkspace.sharedWorkspace().frontmostApplication()
+    targets = tuple(str(t) for t in (NSPasteboard.generalPasteboard().types() or ()))
+    if front is None:
+        return ClipboardSource(targets=targets)
+    return ClipboardSource(str(front.localizedName() or ''), str(front.bundleIdentifier() or ''), '', targets)
+
+
+def run_helper(*args: str, timeout: float = PROBE_TIMEOUT) -> str:
+    """Run a clipboard helper (xclip, wl-paste, ...) and return its stdout ('' if missing, failing or slow)."""
+    if shutil.which(args[0]) is None:
+        return ''
+    try:
+        result = subprocess.run(args, capture_output=True, text=True, encoding='utf-8',
+                                errors='replace', timeout=timeout)
+    except (OSError, subprocess.TimeoutExpired):
+        return ''
+    return result.stdout if result.returncode == 0 else ''
+
+
+def _probe_unix() -> ClipboardSource:
+    if os.environ.get('WAYLAND_DISPLAY'):
+        # Wayland はウィンドウ情報を公開しないので形式だけ
+        return ClipboardSource(targets=tuple(run_helper('wl-paste', '--list-types').split()))
+
+    targets = tuple(run_helper('xclip', '-selection', 'clipboard', '-t', 'TARGETS', '-o').split())
+    # _NET_ACTIVE_WINDOW(WINDOW): window id # 0x3a00007
+    active = run_helper('xprop', '-root', '_NET_ACTIVE_WINDOW').rsplit('#', 1)[-1].strip()
+    if not active.startswith('0x'):
+        return ClipboardSource(targets=targets)
+    app = window_class = window_title = ''
+    for line in run_helper('xprop', '-id', active, 'WM_CLASS', '_NET_WM_NAME').splitlines():
+        values = re.findall(r'"((?:[^"\\]|\\.)*)"', line)
+        if line.startswith('WM_CLASS') and values:
+            # WM_CLASS(STRING) = "code", "Code"
+            app, window_class = values[0], values[-1]
+        elif line.startswith('_NET_WM_NAME') and values:
+            window_title = values[0]
+    return ClipboardSource(app, window_class, window_title, targets)
@@ -0,0 +1,93 @@
+"""Streaming readers over memory-mapped files for bulk imports."""
+
+import codecs
+import mmap
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from .date_parser import DateParser, ParsedEvent
+
+# Bytes decoded per step; memory use is bounded by this, not by the file size
+CHUNK_SIZE = 1 << 20
+# A "line" longer than this (e.g. a dump without newlines) is cut at whitespace
+MAX_LINE = 64 * 1024
+
+
+def iter_blocks(path: Union[str, Path], encoding: str = 'utf-8', chunk_size: int = CHUNK_SIZE,
+                max_line: int = MAX_LINE) -> Iterator[str]:
+    """
+    Yield a file as text blocks that end on line boundaries.
+
+    The file is memory-mapped and decoded incrementally in `chunk_size`
+    slices. Multi-byte characters split across a slice are held back by the
+    incremental decoder, and the unfinished last line of each slice is
+    carried into the next block, so nothing that spans a chunk edge is lost.
+
+    Args:
+        path: File to read
+        encoding: Text encoding (undecodable bytes are replaced)
+        chunk_size: Bytes decoded per step
+        max_line: Longest line kept whole; longer runs are split at whitespace
+
+    Yields:
+        Blocks of whole lines (each block but the last ends with a newline)
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    with open(path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 空ファイルはmmapできない
+            return
+        with mapped, memoryview(mapped) as view:
+            pending = ''
+            for offset in range(0, len(view), chunk_size):
+                chunk = view[offset:offset + chunk_size]
+                try:
+                    text = pending + decoder.decode(chunk)
+                finally:
+                    chunk.release()
+
+                # 最後の改行より後ろはチャンク境界で切れている可能性があるので持ち越す
+                cut = text.rfind('\n') + 1
+                if cut:
+                    yield text[:cut]
+                pending = text[cut:]
+                while len(pending) > max_line:
+                    split = pending.rfind(' ', 0, max_line)
+                    split = split if split > 0 else max_line
+                    yield pending[:split] + '\n'
+                    pending = pending[split:]
+
+            pending += decoder.decode(b'', final=True)
+            if pending:
+                yield pending
+
+
+def iter_lines(path: Union[str, Path], encoding: str = 'utf-8',
+               chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Yield the lines of a file (without terminators) without reading it into one string."""
+    for block in iter_blocks(path, encoding, chunk_size):
+        yield from block.splitlines()
+
+
+def parse_file(path: Union[str, Path], parser: Optional[DateParser] = None,
+               encoding: str = 'utf-8', chunk_size: int = CHUNK_SIZE) -> Iterator[ParsedEvent]:
+    """
+    Stream events out of a (possibly multi-GB) text file, one per dated line.
+
+    Each block is pre-scanned as a whole, so only lines that can contain a
+    date are split out and handed to the parser.
+
+    Args:
+        path: File to read
+        parser: DateParser to use (default: a new one with all locales)
+        encoding: Text encoding
+        chunk_size: Bytes decoded per step
+
+    Yields:
+        ParsedEvents in file order
+    """
+    parser = parser or DateParser()
+    for block in iter_blocks(path, encoding, chunk_size):
+        yield from parser.parse_lines(parser.grammar.candidate_lines(block))
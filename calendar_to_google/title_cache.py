@@ -0,0 +1,108 @@
+"""Persistent cache of user-corrected titles keyed by text shape."""
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from .config import CONFIG_DIR, write_atomic
+
+TITLE_CACHE_FILE = CONFIG_DIR / 'title_templates.json'
+
+_DIGITS_RE = re.compile(r'\d+')
+_SPACE_RE = re.compile(r'\s+')
+
+
+class TitleTemplateCache:
+    """
+    Bounded LRU mapping a normalized text shape to the title the user chose.
+
+    The shape replaces digit runs and collapses whitespace, so the same mail
+    template with different dates maps to the same entry. Keys are stored as
+    digests, never as raw clipboard text.
+    """
+
+    def __init__(self, path: Path = TITLE_CACHE_FILE, max_entries: int = 500):
+        """
+        Initialize cache.
+
+        Args:
+            path: JSON file the cache is persisted to
+            max_entries: Maximum number of templates kept (least recently used evicted)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def shape_key(text: str) -> str:
+        """Return the digest of the normalized shape of `text`."""
+        shape = _DIGITS_RE.sub('#', text)
+        shape = _SPACE_RE.sub(' ', shape).strip().lower()
+        return hashlib.blake2b(shape.encode('utf-8'), digest_size=16).hexdigest()
+
+    def lookup(self, text: str) -> Optional[str]:
+        """Return the learned title for text with the same shape, if any."""
+        key = self.shape_key(text)
+        with self._lock:
+            self._ensure_loaded()
+            title = self._entries.get(key)
+            if title is not None:
+                self._entries.move_to_end(key)
+            return title
+
+    def learn(self, text: str, title: str):
+        """Remember `title` for text shaped like `text` and persist the cache."""
+        if not text or not title:
+            return
+        key = self.shape_key(text)
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[key] = title
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._save()
+
+    def forget(self, text: str):
+        """Drop the learned title for text shaped like `text`."""
+        key = self.shape_key(text)
+        with self._lock:
+            self._ensure_loaded()
+            if self._entries.pop(key, None) is not None:
+                self._save()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._entries)
+
+    def _ensure_loaded(self):
+        """Load entries from disk on first use."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for key, title in data.get('entries', [])[-self.max_entries:]:
+                self._entries[key] = title
+        except Exception as e:
+            print(f"Title cache ignored ({self.path}): {e}")
+
+    def _save(self):
+        """Write entries to disk (oldest first)."""
+        try:
+            write_atomic(self.path, json.dumps(
+                {'version': 1, 'entries': list(self._entries.items())},
+                ensure_ascii=False
+            ))
+        except Exception as e:
+            print(f"Failed to save title cache: {e}")
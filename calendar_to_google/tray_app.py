@@ -1,5 +1,7 @@
 """System tray application with right-click menu."""
 
+import base64
+import os
 import threading
 import webbrowser
 import customtkinter as ctk
@@ -8,31 +10,91 @@ from io import BytesIO
 import pystray
 from PIL import Image, ImageDraw
 
+from .accounts import AccountPool
+from .bulk_import import import_file
+from .clipboard_formats import parse_structured
 from .clipboard_monitor import ClipboardMonitor
-from .date_parser import DateParser, ParsedEvent
+from .config import DEFAULT_ACCOUNT
+from .date_parser import DateParser, ParsedEvent, min_confidence
 from .google_calendar import (
-    GoogleCalendarClient, setup_credentials, select_credentials_file,
-    prompt_credentials_setup, CREDENTIALS_FILE
+    setup_credentials, select_credentials_file,
+    prompt_credentials_setup, CREDENTIALS_FILE,
+    discovery_snapshot, restore_discovery
 )
-from .edit_dialog import show_edit_dialog
+from .edit_dialog import EventEditDialog, show_edit_dialog
+from .event_bus import EventBus
+from .review_dialog import show_review_dialog
+from .metrics import metrics, METRICS_ENV
+from .recurrence import describe_rrule
+from .profiler import SamplingProfiler, startup_profile_seconds
+from .replay import recorder_from_env
+from .routing import CalendarListCache, Router
+from .source_app import ClipboardSource, SourcePolicy
+from .title_cache import TitleTemplateCache
+from .warm_state import WarmState
+
+# Duration of a capture started from the tray menu
+PROFILE_SECONDS = 30
+ICON_COLORS = ("green", "yellow", "gray")
 
 
 class TrayApp:
     """System tray application."""
 
-    def __init__(self):
-        """Initialize the tray app."""
+    def __init__(self, instance=None):
+        """
+        Initialize the tray app.
+
+        Args:
+            instance: InstanceLock held by this process; commands from later launches arrive through it
+        """
         # Initialize Tkinter root on main thread
         self.root = ctk.CTk()
         self.root.withdraw()  # Hide the root window
-
-        self.clipboard_monitor = ClipboardMonitor(self._on_clipboard_change)
-        self.date_parser = DateParser()
-        self.calendar_client = GoogleCalendarClient()
+        self.instance = instance
+        # Snapshot of caches from the last run (read on first use)
+        self.warm_state = WarmState()
+        self._icons: dict[str, Image.Image] = {}
+
+        # Copies from IDEs, terminals and password managers are not even read;
+        # text/calendar and HTML payloads are parsed structurally
+        self.clipboard_monitor = ClipboardMonitor(
+            self._on_clipboard_change, recorder=recorder_from_env(), policy=SourcePolicy.from_file(),
+            structured_callback=self._on_structured_clipboard
+        )
+        self.title_cache = TitleTemplateCache()
+        self.date_parser = DateParser(title_cache=self.title_cache)
+        # Clipboard detections scored below this are logged but do not open a dialog
+        self.min_confidence = min_confidence()
+        # One client per account profile; the default account drives auth and the tray icon
+        self.accounts = AccountPool()
+        self.calendar_client = self.accounts.get()
+        # Calendar routing rules; names are resolved against a background-refreshed list
+        self.calendar_list = CalendarListCache(self.calendar_client)
+        self.router = Router.from_file(calendars=self.calendar_list)
+        # UI thread bridge: every field below is only touched on the Tk thread
+        self.bus = EventBus()
         self.last_parsed_event: ParsedEvent | None = None
         self.icon: pystray.Icon | None = None
         self._notification_text = ""
         self._is_dialog_open = False  # Dialog open state
+        self.profiler = SamplingProfiler()
+        # Pre-built, reusable edit dialog (widgets are created once after startup)
+        self.edit_dialog = EventEditDialog(self.root)
+
+    def _icon_image(self, color="green"):
+        """Return the icon for `color`: cached, from the warm-state snapshot, or drawn."""
+        image = self._icons.get(color)
+        if image is None:
+            saved = self.warm_state.get('icons', {}).get(color)
+            if saved:
+                try:
+                    image = Image.open(BytesIO(base64.b64decode(saved)))
+                    image.load()
+                except Exception:
+                    image = None
+            image = self._icons[color] = image or self._create_icon_image(color)
+        return image
 
     def _create_icon_image(self, color="green"):
         """Create a simple calendar icon."""
@@ -68,19 +130,90 @@ class TrayApp:
 
         return image
 
-    def _on_clipboard_change(self, text: str):
-        """Handle clipboard content change."""
+    def _detect_many(self, text: str) -> list[ParsedEvent]:
+        """Return per-line events when multi-line text contains several dates."""
+        if '\n' not in text.strip():
+            return []
+        events = [e for e in self.date_parser.parse_all(text) if e.confidence >= self.min_confidence]
+        return events if len(events) > 1 else []
+
+    def _set_icon_color(self, color: str):
+        """Update the tray icon (coalesced to one update per frame via the bus)."""
+        if self.icon:
+            self.icon.icon = self._icon_image(color)
+
+    def _on_clipboard_change(self, text: str, source: ClipboardSource | None = None):
+        """Handle clipboard content change (clipboard thread): parse, then hand off to the UI thread."""
+        source_app = source.name if source and source.app else None
+        events = self._detect_many(text)
+        if events:
+            for event in events:
+                event.source_app = source_app
+            self.bus.post(self._on_events_detected, events)
+            return
+
         parsed = self.date_parser.parse(text)
+        if parsed:
+            parsed.source_app = source_app
+        if parsed and parsed.confidence < self.min_confidence:
+            # バージョン番号・分数などの紛らわしい一致ではダイアログを開かない
+            metrics.incr('parse.low_confidence')
+            print(f"[Ignored] {parsed.title} ({parsed.confidence:.2f} < {self.min_confidence:.2f})")
+            return
+        if parsed:
+            self.bus.post(self._on_event_detected, parsed)
+
+    def _on_structured_clipboard(self, kind: str, payload: str, source: ClipboardSource | None) -> bool:
+        """Handle a text/calendar or text/html payload (clipboard thread); False falls back to plain text."""
+        try:
+            events = parse_structured(kind, payload, self.date_parser)
+        except Exception as e:
+            print(f"Structured clipboard parse failed ({kind}): {e}")
+            return False
+        if not events:
+            return False
+
+        # <time> や ICS の予定は信頼度1.0。行テキストから推測した予定だけがここで落ちる
+        confident = [e for e in events if e.confidence >= self.min_confidence]
+        if len(confident) < len(events):
+            metrics.incr('parse.low_confidence', len(events) - len(confident))
+            for event in events:
+                if event.confidence < self.min_confidence:
+                    print(f"[Ignored] {event.title} ({event.confidence:.2f} < {self.min_confidence:.2f})")
+        events = confident
+        if not events:
+            return False
+
+        source_app = source.name if source and source.app else None
+        for event in events:
+            event.source_app = source_app
+        if len(events) == 1:
+            self.bus.post(self._on_event_detected, events[0])
+        else:
+            self.bus.post(self._on_events_detected, events)
+        return True
+
+    def _on_events_detected(self, events: list[ParsedEvent]):
+        """Handle several detected events (UI thread)."""
+        self.bus.post_latest('icon', self._set_icon_color, "yellow")
+        self._show_notification("Dates Detected", f"{len(events)} events detected\nReview to add...")
+        if not self._is_dialog_open:
+            self.bus.post_modal(self._show_review_safe, events)
+        print(f"[Detected] {len(events)} events")
+
+    def _on_event_detected(self, parsed: ParsedEvent):
+        """Handle a detected event (UI thread)."""
         if parsed:
             self.last_parsed_event = parsed
             # Update icon to yellow to indicate detected event
-            if self.icon:
-                self.icon.icon = self._create_icon_image("yellow")
+            self.bus.post_latest('icon', self._set_icon_color, "yellow")
 
             # Show notification
             date_str = parsed.start_date.strftime('%Y/%m/%d')
             if not parsed.all_day:
                 date_str += " " + parsed.start_date.strftime('%H:%M')
+            if parsed.recurrence:
+                date_str += f" ({describe_rrule(parsed.recurrence)})"
             
             # Show notification first
             self._show_notification(
@@ -90,7 +223,7 @@ class TrayApp:
             
             # Auto-open dialog if not already open
             if not self._is_dialog_open:
-                self._add_detected_event(None, None)
+                self.bus.post_modal(self._open_detected_event)
             
             print(f"[Detected] {parsed.title} - {date_str}")
 
@@ -101,23 +234,31 @@ class TrayApp:
             self._show_notification("Error", "Clipboard is empty.")
             return
 
+        events = self._detect_many(text)
+        if events:
+            self.bus.post_modal(self._show_review_safe, events)
+            return
+
         parsed = self.date_parser.parse(text)
         if not parsed:
             self._show_notification("Error", "No date detected.")
             return
 
         # Schedule dialog on main thread
-        self.root.after(0, self._show_dialog_safe, parsed, text)
+        self.bus.post_modal(self._show_dialog_safe, parsed, text)
 
     def _add_detected_event(self, icon, item):
-        """Add the last detected event with edit dialog."""
+        """Add the last detected event with edit dialog (menu thread)."""
+        self.bus.post_modal(self._open_detected_event)
+
+    def _open_detected_event(self):
+        """Open the edit dialog for the last detected event (UI thread)."""
         if not self.last_parsed_event:
             self._show_notification("Error", "No event detected. Copy text with a date first.")
             return
 
         parsed = self.last_parsed_event
-        # Schedule dialog on main thread
-        self.root.after(0, self._show_dialog_safe, parsed, parsed.description)
+        self._show_dialog_safe(parsed, parsed.description)
 
     def _show_dialog_safe(self, parsed: ParsedEvent, description: str):
         """Show dialog safely on main thread."""
@@ -127,24 +268,34 @@ class TrayApp:
         
         try:
             # This blocks the local event loop but keeps main loop alive
-            edited = show_edit_dialog(
-                master=self.root,
-                title=parsed.title,
-                start_date=parsed.start_date,
-                all_day=parsed.all_day,
-                description=description
-            )
+            with metrics.timer('dialog.wait'):
+                edited = show_edit_dialog(
+                    master=self.root,
+                    title=parsed.title,
+                    start_date=parsed.start_date,
+                    all_day=parsed.all_day,
+                    description=description,
+                    recurrence=parsed.recurrence,
+                    dialog=self.edit_dialog
+                )
 
             if edited and not edited.cancelled:
+                # Learn the corrected title for text with the same shape
+                if edited.title != parsed.title and parsed.source_text:
+                    self.bus.run_io(self.title_cache.learn, parsed.source_text, edited.title)
+
                 event = ParsedEvent(
                     title=edited.title,
                     start_date=edited.start_date,
                     end_date=edited.end_date,
                     all_day=edited.all_day,
-                    description=edited.description
+                    description=edited.description,
+                    source_text=parsed.source_text,
+                    recurrence=edited.recurrence,
+                    source_app=parsed.source_app
                 )
                 # Run network op in background to avoid freezing UI
-                threading.Thread(target=self._do_add_to_calendar, args=(event,), daemon=True).start()
+                self.bus.run_io(self._do_add_to_calendar, event)
                 self.last_parsed_event = None
         except Exception as e:
             print(f"Error showing dialog: {e}")
@@ -154,33 +305,84 @@ class TrayApp:
         finally:
             self._is_dialog_open = False
 
-    def _do_add_to_calendar(self, event: ParsedEvent):
-        """Actually add event to calendar."""
-        if not self.calendar_client.is_configured():
-            # Show dialog to select credentials file (needs main thread?)
-            # prompt_credentials_setup uses tkinter, so it should be on main thread.
-            # But we are in a background thread here.
-            # Let's schedule it back on main thread if needed.
-            # For simplicity, let's assume setup is done or handle it carefully.
-            # Ideally, prompt_credentials_setup should be called via root.after too.
-            self.root.after(0, self._handle_credentials_setup)
+    def _show_review_safe(self, events: list[ParsedEvent]):
+        """Show the batch review dialog on main thread."""
+        if self._is_dialog_open:
             return
+        self._is_dialog_open = True
 
-        if not self.calendar_client.is_authenticated():
-            success = self.calendar_client.authenticate()
-            if not success:
-                self._show_notification("Auth Error", "Google authentication failed.")
+        try:
+            with metrics.timer('dialog.wait'):
+                selected = show_review_dialog(self.root, events)
+            if selected:
+                self.bus.run_io(self._do_add_events, selected)
+        except Exception as e:
+            print(f"Error showing review dialog: {e}")
+            self._show_notification("Error", f"Failed to open dialog: {e}")
+        finally:
+            self._is_dialog_open = False
+
+    def _do_add_events(self, events: list[ParsedEvent]):
+        """Add several events with one batched request."""
+        # ルーティング先（アカウント・カレンダー）ごとにまとめ、アカウント間は並行して登録
+        groups: dict[tuple[str, str], list[ParsedEvent]] = {}
+        for event in events:
+            groups.setdefault(self.router.route_event(event), []).append(event)
+        # 振り分け先のアカウントをすべて先に認証しておく（登録スレッドで OAuth を始めない）
+        for account in dict.fromkeys(account for account, _ in groups):
+            if not self._ensure_authenticated(account):
                 return
+        added = self.accounts.add_events(groups)
+        if added:
+            self._show_notification("Added", f"{added} / {len(events)} events added to calendar")
+            self.bus.post_latest('icon', self._set_icon_color, "green")
+        else:
+            self._show_notification("Error", "Failed to add events.")
+
+    def _ensure_authenticated(self, account: str = DEFAULT_ACCOUNT) -> bool:
+        """
+        Check credentials and authenticate (called from worker threads).
+
+        Args:
+            account: Account profile the work is routed to
+        """
+        client = self.accounts.get(account)
+        if not client.is_configured():
+            if account != DEFAULT_ACCOUNT:
+                self._show_notification("Auth Error", f"Credentials not found for account '{account}'.")
+                return False
+            # prompt_credentials_setup uses tkinter, so hand it to the UI thread
+            self.bus.post_modal(self._handle_credentials_setup)
+            return False
+
+        if not client.is_authenticated():
+            success = client.authenticate()
+            if not success:
+                self._show_notification("Auth Error", f"Google authentication failed ({account}).")
+                return False
+            if account == DEFAULT_ACCOUNT:
+                self._start_calendar_list()
+        return True
+
+    def _start_calendar_list(self):
+        """Keep the calendar list fresh in the background when routing rules exist."""
+        if self.router.rules:
+            self.calendar_list.start()
+
+    def _do_add_to_calendar(self, event: ParsedEvent):
+        """Actually add event to calendar."""
+        account, calendar_id = self.router.route_event(event)
+        if not self._ensure_authenticated(account):
+            return
 
-        url = self.calendar_client.add_event(event)
+        url = self.accounts.get(account).add_event(event, calendar_id)
         if url:
             self._show_notification(
                 "Added",
                 f"'{event.title}' added to calendar"
             )
             # Reset icon to green
-            if self.icon:
-                self.icon.icon = self._create_icon_image("green")
+            self.bus.post_latest('icon', self._set_icon_color, "green")
             # Open calendar in browser
             webbrowser.open(url)
         else:
@@ -193,11 +395,14 @@ class TrayApp:
                 "Setup Complete",
                 "認証情報を登録しました。再度イベントを追加してください。"
             )
-            if self.icon:
-                self.icon.icon = self._create_icon_image("yellow")
+            self.bus.post_latest('icon', self._set_icon_color, "yellow")
 
     def _show_status(self, icon, item):
-        """Show current status."""
+        """Show current status (menu thread)."""
+        self.bus.post(self._show_status_safe)
+
+    def _show_status_safe(self):
+        """Show current status (UI thread)."""
         if self.last_parsed_event:
             event = self.last_parsed_event
             msg = f"Detected: {event.title}\nDate: {event.start_date.strftime('%Y/%m/%d')}"
@@ -206,12 +411,38 @@ class TrayApp:
         else:
             msg = "Waiting...\nCopy text containing a date"
 
+        if metrics.enabled:
+            msg += "\n\n" + metrics.summary()
+
         self._show_notification("Status", msg)
 
+    def _start_profiling(self, icon, item):
+        """Start a sampling profile from the tray menu."""
+        self.bus.post(self._begin_profile, PROFILE_SECONDS)
+
+    def _begin_profile(self, seconds: float):
+        """Sample all threads for `seconds` and write the results to the config dir."""
+        if self.profiler.running:
+            self._show_notification("Profiling", "Profiling is already running.")
+            return
+        self.profiler.start(seconds, on_done=self._on_profile_done)
+        self._show_notification("Profiling", f"Profiling all threads for {seconds:g}s...")
+
+    def _on_profile_done(self, profiler: SamplingProfiler):
+        """Write profile files once a capture finishes."""
+        try:
+            report_path, collapsed_path = profiler.write()
+        except Exception as e:
+            self._show_notification("Error", f"Failed to write profile: {e}")
+            return
+        print(f"[Profile] {report_path}")
+        print(f"[Profile] {collapsed_path}")
+        self._show_notification("Profiling Done", f"Saved to {report_path.parent}")
+
     def _setup_google(self, icon, item):
         """Open file dialog to register credentials."""
         # Schedule on main thread
-        self.root.after(0, self._handle_credentials_setup_dialog)
+        self.bus.post_modal(self._handle_credentials_setup_dialog)
 
     def _handle_credentials_setup_dialog(self):
         """Handle manual credentials setup."""
@@ -220,8 +451,7 @@ class TrayApp:
                 "Setup Complete",
                 "認証情報を登録しました。"
             )
-            if self.icon:
-                self.icon.icon = self._create_icon_image("yellow")
+            self.bus.post_latest('icon', self._set_icon_color, "yellow")
 
     def _show_notification(self, title: str, message: str):
         """Show notification."""
@@ -231,12 +461,73 @@ class TrayApp:
             except Exception:
                 print(f"[{title}] {message}")
 
+    def _restore_warm_state(self):
+        """Seed caches from the last run's snapshot (I/O thread)."""
+        calendars = self.warm_state.get('calendars')
+        token_file = self.calendar_client.token_file
+        # 再認証（別アカウントの可能性）後のカレンダー一覧は使わない
+        if calendars and token_file.exists() and calendars.get('token_mtime') == token_file.stat().st_mtime:
+            self.calendar_list.seed(calendars.get('items', []), only_if_empty=True)
+        restore_discovery(self.warm_state.get('discovery'))
+        # 学習済みタイトルは専用ファイルから先に読み込んでおく
+        len(self.title_cache)
+
+    def _collect_warm_state(self) -> dict:
+        """Build the warm-state snapshot sections (any thread)."""
+        icons = {}
+        for color in ICON_COLORS:
+            buffer = BytesIO()
+            self._icon_image(color).save(buffer, format='PNG')
+            icons[color] = base64.b64encode(buffer.getvalue()).decode('ascii')
+        sections = {'icons': icons}
+        token_file = self.calendar_client.token_file
+        items = self.calendar_list.snapshot()
+        if items and token_file.exists():
+            sections['calendars'] = {'token_mtime': token_file.stat().st_mtime, 'items': items}
+        discovery = discovery_snapshot()
+        if discovery:
+            sections['discovery'] = discovery
+        return sections
+
+    def _on_remote_command(self, message: dict) -> dict:
+        """Run a command forwarded by a second launch (IPC thread)."""
+        command = message.get('command')
+        print(f"[Instance] {command}")
+        if command == 'add_clipboard':
+            self._add_to_calendar_with_edit(None, None)
+        elif command == 'import' and message.get('path'):
+            self.bus.run_io(self._do_import, message['path'])
+        elif command == 'show':
+            self._show_notification("Calendar to Google", "Already running in the system tray.")
+        else:
+            return {'ok': False, 'error': f"unknown command: {command}"}
+        return {'ok': True}
+
+    def _do_import(self, path: str):
+        """Import a text or .ics file into the primary calendar (I/O thread)."""
+        if not self._ensure_authenticated():
+            return
+        try:
+            parsed, inserted = import_file(path, self.calendar_client, threshold=self.min_confidence)
+        except Exception as e:
+            self._show_notification("Error", f"Import failed: {e}")
+            return
+        self._show_notification("Imported", f"{inserted} / {parsed} events added from {os.path.basename(path)}")
+
     def _quit(self, icon, item):
         """Quit the application."""
         self.clipboard_monitor.stop()
+        self.warm_state.stop(self._collect_warm_state)
+        self.calendar_list.stop()
+        self.accounts.shutdown()
+        metrics.stop_exporter()
+        self.profiler.stop()
         icon.stop()
-        # Stop Tkinter loop
-        self.root.quit()
+        # Stop Tkinter loop (must run on the Tk thread)
+        self.bus.post(self.root.quit)
+        self.bus.shutdown()
+        if self.instance:
+            self.instance.close()
 
     def _create_menu(self):
         """Create system tray menu."""
@@ -259,6 +550,10 @@ class TrayApp:
                 "Register Credentials...",
                 self._setup_google
             ),
+            pystray.MenuItem(
+                f"Profile ({PROFILE_SECONDS}s)",
+                self._start_profiling
+            ),
             pystray.Menu.SEPARATOR,
             pystray.MenuItem(
                 "Quit",
@@ -266,14 +561,24 @@ class TrayApp:
             )
         )
 
-    def run(self):
-        """Run the tray application."""
+    def run(self, command: dict | None = None):
+        """Run the tray application, then `command` (e.g. from --import) if given."""
         # Start clipboard monitoring
         self.clipboard_monitor.start()
 
+        # Restore last run's caches off the UI thread and keep the snapshot fresh
+        self.bus.run_io(self._restore_warm_state)
+        self.warm_state.start(self._collect_warm_state)
+
+        # Periodic metrics export (CALENDAR_TO_GOOGLE_METRICS=1 / json / prometheus)
+        if metrics.enabled:
+            fmt = 'prometheus' if os.environ.get(METRICS_ENV) == 'prometheus' else 'json'
+            metrics.start_exporter(fmt=fmt)
+
         # Determine initial icon color based on auth status
         if self.calendar_client.is_authenticated():
             icon_color = "green"
+            self._start_calendar_list()
         elif self.calendar_client.is_configured():
             icon_color = "yellow"
         else:
@@ -282,7 +587,7 @@ class TrayApp:
         # Create system tray icon
         self.icon = pystray.Icon(
             "calendar-to-google",
-            self._create_icon_image(icon_color),
+            self._icon_image(icon_color),
             "Calendar to Google",
             menu=self._create_menu()
         )
@@ -294,14 +599,37 @@ class TrayApp:
         # Run icon in background thread
         threading.Thread(target=self.icon.run, daemon=True).start()
 
+        # Opt-in startup profiling (CALENDAR_TO_GOOGLE_PROFILE=<seconds>)
+        profile_seconds = startup_profile_seconds()
+        if profile_seconds:
+            self._begin_profile(profile_seconds)
+
+        # Drain UI work posted by other threads once per frame
+        self.bus.attach(self.root)
+
+        # Commands from later launches (they exit instead of starting a second instance)
+        if self.instance:
+            self.instance.serve(self._on_remote_command)
+        if command:
+            self._on_remote_command(command)
+
+        # Build the edit dialog while idle so the first detection opens it instantly
+        self.root.after_idle(self.edit_dialog.build)
+
         # Run Tkinter main loop (Blocking)
         self.root.mainloop()
 
 
-def main():
-    """Entry point."""
-    app = TrayApp()
-    app.run()
+def main(instance=None, command: dict | None = None):
+    """
+    Run the tray app.
+
+    Args:
+        instance: InstanceLock already acquired by the launcher (see __main__)
+        command: Command to run once started (same format as IPC commands)
+    """
+    app = TrayApp(instance)
+    app.run(command)
 
 
 if __name__ == '__main__':
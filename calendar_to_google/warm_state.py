@@ -0,0 +1,146 @@
+"""Versioned warm-state snapshot so the tray app restarts without rebuilding its caches."""
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from . import __version__
+from .config import CONFIG_DIR, write_atomic
+from .metrics import metrics
+
+SNAPSHOT_FILE = CONFIG_DIR / 'warm_state.json'
+# Bump when the layout of a section changes
+SNAPSHOT_VERSION = 1
+# Snapshots older than this are not trusted (seconds)
+SNAPSHOT_MAX_AGE = 7 * 24 * 3600
+# Interval of the periodic background save (seconds)
+SNAPSHOT_INTERVAL = 10 * 60
+
+
+def _digest(body: str) -> str:
+    return hashlib.blake2b(body.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class WarmState:
+    """
+    Named sections (calendar list, discovery document, icons...) saved in one file.
+
+    The file is a one-line JSON header (format and app version, write time,
+    digest of the body) followed by the JSON body. It is written atomically,
+    read on first access only, and ignored as a whole when the header does
+    not match this build, it is older than `max_age`, or the body does not
+    match its digest (truncated or edited). Sections then start empty and
+    are rebuilt the normal way. Callers check their own section-level
+    staleness (e.g. a newer OAuth token) before using a section.
+    """
+
+    def __init__(self, path: Path = SNAPSHOT_FILE, max_age: float = SNAPSHOT_MAX_AGE):
+        """
+        Initialize warm state.
+
+        Args:
+            path: Snapshot file
+            max_age: Seconds after which a snapshot is ignored
+        """
+        self.path = path
+        self.max_age = max_age
+        self.written_at: Optional[float] = None
+        self._sections: dict[str, Any] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Return a section of the snapshot (loading it on first use)."""
+        with self._lock:
+            self._ensure_loaded()
+            return self._sections.get(name, default)
+
+    def save(self, sections: dict[str, Any]) -> bool:
+        """Write `sections` atomically; returns False (and logs) on failure."""
+        try:
+            with metrics.timer('warm_state.save'):
+                body = json.dumps(sections, ensure_ascii=False, separators=(',', ':'))
+                header = json.dumps({
+                    'version': SNAPSHOT_VERSION,
+                    'app_version': __version__,
+                    'written_at': time.time(),
+                    'digest': _digest(body),
+                })
+                write_atomic(self.path, header + '\n' + body)
+        except Exception as e:
+            print(f"Failed to save warm state: {e}")
+            return False
+        with self._lock:
+            self._sections = dict(sections)
+            self._loaded = True
+        return True
+
+    def start(self, collect: Callable[[], dict], interval: float = SNAPSHOT_INTERVAL):
+        """Save `collect()` every `interval` seconds on a daemon thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(collect, interval),
+                                        name="warm-state", daemon=True)
+        self._thread.start()
+
+    def stop(self, collect: Optional[Callable[[], dict]] = None):
+        """Stop periodic saves, writing one last snapshot from `collect` if given."""
+        self._stop.set()
+        # 実行中の定期保存が終わってから最後の保存を行う（古い内容で上書きされないように）
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        if collect is not None:
+            self.save(collect())
+
+    def _run(self, collect: Callable[[], dict], interval: float):
+        while not self._stop.wait(interval):
+            try:
+                self.save(collect())
+            except Exception as e:
+                print(f"Warm state snapshot failed: {e}")
+
+    def _ensure_loaded(self):
+        """Read and validate the snapshot on first use."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path.exists():
+            return
+        with metrics.timer('warm_state.load'):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    header = json.loads(f.readline())
+                    body = f.read()
+            except Exception as e:
+                metrics.incr('warm_state.corrupt')
+                print(f"Warm state ignored ({self.path}): {e}")
+                return
+
+            reason = None
+            age = time.time() - header.get('written_at', 0)
+            if header.get('version') != SNAPSHOT_VERSION or header.get('app_version') != __version__:
+                reason = "written by another version"
+            elif not 0 <= age <= self.max_age:
+                reason = "too old"
+            elif header.get('digest') != _digest(body):
+                reason = "digest mismatch"
+            if reason:
+                metrics.incr('warm_state.stale')
+                print(f"Warm state ignored ({self.path}): {reason}")
+                return
+
+            try:
+                sections = json.loads(body)
+            except ValueError as e:
+                metrics.incr('warm_state.corrupt')
+                print(f"Warm state ignored ({self.path}): {e}")
+                return
+        if isinstance(sections, dict):
+            self._sections = sections
+            self.written_at = header['written_at']
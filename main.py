@@ -1,6 +1,6 @@
-def main():
-    print("Hello from calendar-to-google!")
+import sys
 
+from calendar_to_google.__main__ import main
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
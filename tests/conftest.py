@@ -0,0 +1,8 @@
+"""Shared pytest setup: keep the app's config directory out of the real home."""
+
+import os
+import tempfile
+
+# config.CONFIG_DIR is derived from the home directory at import time
+os.environ['HOME'] = os.environ['USERPROFILE'] = tempfile.mkdtemp(prefix='calendar-to-google-test-')
+os.environ.setdefault('PYSTRAY_BACKEND', 'dummy')
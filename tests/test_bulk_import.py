@@ -0,0 +1,74 @@
+"""Bulk import: confidence filtering, duplicates and ordered parallel parsing."""
+
+from calendar_to_google.bulk_import import (drop_duplicates, drop_low_confidence, import_file,
+                                           parse_file_parallel, shard_ranges)
+from calendar_to_google.date_parser import CONFIDENCE_ENV, DateParser, ParsedEvent
+
+
+class RecordingClient:
+    """Stands in for GoogleCalendarClient: records add_events() calls."""
+
+    def __init__(self):
+        self.events = []
+
+    def add_events(self, events, calendar_id='primary'):
+        self.events.extend(events)
+        return [f"https://calendar.example/{len(self.events)}-{i}" for i in range(len(events))]
+
+
+def write_lines(path, *lines):
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return path
+
+
+def test_drop_low_confidence_uses_threshold():
+    events = [ParsedEvent(title=str(c), start_date=None, confidence=c) for c in (0.2, 0.5, 0.9)]
+    assert [e.confidence for e in drop_low_confidence(events, 0.5)] == [0.5, 0.9]
+
+
+def test_import_file_filters_with_min_confidence(tmp_path, monkeypatch):
+    path = write_lines(tmp_path / 'events.txt', '2026-12-25 Christmas party', '12/25 忘年会')
+    monkeypatch.setenv(CONFIDENCE_ENV, '0.7')
+    client = RecordingClient()
+
+    parsed, inserted = import_file(path, client, workers=1)
+
+    assert (parsed, inserted) == (1, 1)
+    assert [e.title for e in client.events] == ['Christmas party']
+
+
+def test_import_file_explicit_threshold(tmp_path, capsys):
+    path = write_lines(tmp_path / 'events.txt', '2026-12-25 Christmas party', '12/25 忘年会',
+                       '2026-12-25 Christmas party')
+    client = RecordingClient()
+
+    assert import_file(path, client, workers=1, threshold=0.0) == (2, 2)
+    # 結果の表示は呼び出し側（cli / tray）が行う
+    assert 'Imported' not in capsys.readouterr().out
+
+
+LINES = ['明日 14:00 会議', 'ただのメモ', '12/25 忘年会の会場を予約する', 'nothing to see',
+         'Dec 25 holiday party at the office', '2026-11-12 定例ミーティング']
+
+
+def test_shards_end_after_newlines(tmp_path):
+    path = write_lines(tmp_path / 'log.txt', *LINES * 40)
+    data = path.read_bytes()
+    ranges = shard_ranges(path, shard_size=100)
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    assert all(end == next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:]))
+    assert all(data[end - 1:end] == b'\n' for _, end in ranges)
+
+
+def test_drop_duplicates_keeps_first():
+    parser = DateParser()
+    events = parser.parse_lines(['12/25 忘年会', '12/25 忘年会', '12/26 忘年会'])
+    assert [e.start_date.day for e in drop_duplicates(events)] == [25, 26]
+
+
+def test_parallel_parse_matches_serial(tmp_path):
+    path = write_lines(tmp_path / 'log.txt', *LINES * 200)
+    serial = [(e.title, e.start_date) for e in parse_file_parallel(path, workers=1, shard_size=512)]
+    parallel = [(e.title, e.start_date) for e in parse_file_parallel(path, workers=2, shard_size=512)]
+    assert parallel == serial
+    assert len(serial) == 4 * 200
@@ -0,0 +1,111 @@
+"""Structured clipboard formats: target choice, HTML/ICS parsing and delivery to the tray app."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from calendar_to_google.clipboard_formats import (FakeClipboard, events_from_html, parse_structured,
+                                                  structured_target)
+from calendar_to_google.clipboard_monitor import ClipboardMonitor
+from calendar_to_google.date_parser import DateParser
+
+SUGAR_ROW = '<tr><td>Add 3/4 cup of sugar</td></tr>'
+PARTY_ROW = '<tr><td><time datetime="2026-12-25T18:30">12/25 18:30</time></td><td>忘年会</td></tr>'
+ICS = '\r\n'.join([
+    'BEGIN:VCALENDAR', 'VERSION:2.0', 'BEGIN:VEVENT', 'DTSTART;TZID=Asia/Tokyo:20261225T183000',
+    'SUMMARY:忘年会', 'END:VEVENT', 'END:VCALENDAR', ''])
+
+
+@pytest.fixture(scope='module')
+def parser():
+    return DateParser()
+
+
+def table(*rows):
+    return '<html><body><table>' + ''.join(rows) + '</table></body></html>'
+
+
+def test_structured_target_prefers_calendar():
+    assert structured_target(('UTF8_STRING', 'text/html', 'text/calendar')) == ('text/calendar', 'text/calendar')
+    assert structured_target(('HTML Format', 'CF_UNICODETEXT')) == ('HTML Format', 'text/html')
+    assert structured_target(('text/plain',)) is None
+
+
+def test_html_time_element_is_exact(parser):
+    [event] = events_from_html(table(PARTY_ROW), parser)
+    assert (event.title, event.start_date, event.all_day) == ('忘年会', datetime(2026, 12, 25, 18, 30), False)
+    assert event.confidence == 1.0
+
+
+def test_html_rows_without_time_use_line_parser(parser):
+    events = events_from_html(table('<tr><td>2026-11-12</td><td>定例ミーティング</td></tr>', SUGAR_ROW), parser)
+    assert [(e.title, e.start_date) for e in events][0] == ('定例ミーティング', datetime(2026, 11, 12))
+    assert events[-1].confidence < 0.5
+
+
+def test_parse_structured_calendar(parser):
+    [event] = parse_structured('text/calendar', ICS, parser)
+    assert (event.title, event.start_date) == ('忘年会', datetime(2026, 12, 25, 18, 30))
+
+
+def test_monitor_delivers_structured_payload_without_reading_text():
+    clipboard = FakeClipboard(app='Outlook')
+    delivered, texts = [], []
+    monitor = ClipboardMonitor(lambda text, source: texts.append(text),
+                               structured_callback=lambda kind, payload, source: delivered.append(kind) or True,
+                               backend=clipboard)
+    clipboard.set('12/25 忘年会', calendar=ICS, html=table(PARTY_ROW))
+    monitor._check_clipboard()
+
+    assert delivered == ['text/calendar']
+    assert texts == []
+    assert clipboard.reads == ['text/calendar']
+
+
+def test_monitor_falls_back_to_text_when_structured_is_rejected():
+    clipboard = FakeClipboard()
+    texts = []
+    monitor = ClipboardMonitor(lambda text, source: texts.append(text),
+                               structured_callback=lambda kind, payload, source: False, backend=clipboard)
+    clipboard.set('12/25 忘年会', html=table(PARTY_ROW))
+    monitor._check_clipboard()
+    assert texts == ['12/25 忘年会']
+
+
+class RecordingBus:
+    def __init__(self):
+        self.posted = []
+
+    def post(self, fn, *args):
+        self.posted.append((fn, args))
+
+
+@pytest.fixture
+def tray(parser):
+    from calendar_to_google.tray_app import TrayApp
+
+    app = SimpleNamespace(date_parser=parser, min_confidence=0.5, bus=RecordingBus(),
+                          _on_event_detected='one', _on_events_detected='many')
+    handle = TrayApp._on_structured_clipboard.__get__(app)
+    return app, handle
+
+
+def test_tray_drops_low_confidence_html_rows(tray):
+    app, handle = tray
+    assert handle('text/html', table(SUGAR_ROW), None) is False
+    assert app.bus.posted == []
+
+
+def test_tray_keeps_confident_rows(tray):
+    app, handle = tray
+    assert handle('text/html', table(SUGAR_ROW, PARTY_ROW), None) is True
+    [(kind, (event,))] = app.bus.posted
+    assert kind == 'one'
+    assert event.title == '忘年会'
+
+
+def test_tray_accepts_calendar_payload(tray):
+    app, handle = tray
+    assert handle('text/calendar', ICS, None) is True
+    assert len(app.bus.posted) == 1
@@ -0,0 +1,62 @@
+"""Confidence scoring: real dates pass the default threshold, look-alikes do not."""
+
+import pytest
+
+from calendar_to_google.cli import detect_events
+from calendar_to_google.date_parser import (CONFIDENCE_ENV, DEFAULT_MIN_CONFIDENCE, DateParser,
+                                            min_confidence)
+
+
+@pytest.fixture(scope='module')
+def parser():
+    return DateParser()
+
+
+@pytest.mark.parametrize('text, month, day, title', [
+    ('12/25 team lunch', 12, 25, 'team lunch'),
+    ('Lunch 11/3', 11, 3, 'Lunch'),
+    ('11-5 dentist', 11, 5, 'dentist'),
+    ('31/12 party', 12, 31, 'party'),
+    ('12/25(水) 忘年会 18:30', 12, 25, '忘年会'),
+    ('12/25 忘年会の会場を予約する', 12, 25, '忘年会の会場を予約する'),
+    ('3/4 打ち合わせ', 3, 4, '打ち合わせ'),
+    ('2026-12-25 Christmas party', 12, 25, 'Christmas party'),
+])
+def test_dates_pass_default_threshold(parser, text, month, day, title):
+    event = parser.parse(text)
+    assert event.confidence >= DEFAULT_MIN_CONFIDENCE
+    assert (event.start_date.month, event.start_date.day) == (month, day)
+    assert event.title == title
+
+
+@pytest.mark.parametrize('text', [
+    'Updated to v1.2/3 last night',
+    'Final score 3-1',
+    'Add 3/4 cup of sugar',
+    '50% off, 1/2 price sale',
+    'Page 12/40',
+    'Build 2-3 failed',
+])
+def test_lookalikes_fall_below_default_threshold(parser, text):
+    assert detect_events(parser, text, DEFAULT_MIN_CONFIDENCE) == []
+
+
+def test_time_near_date_raises_confidence(parser):
+    assert parser.parse('3/4 meeting').confidence < DEFAULT_MIN_CONFIDENCE
+    assert parser.parse('3/4 10:00 meeting').confidence >= DEFAULT_MIN_CONFIDENCE
+    assert parser.parse('Lunch 11/3 12:00').confidence > parser.parse('Lunch 11/3').confidence
+
+
+def test_weekday_qualifier_raises_confidence(parser):
+    # 2025-12-25 は木曜日
+    with_weekday = parser.parse('2025/12/25(木) 忘年会')
+    assert with_weekday.confidence == 1.0
+
+
+def test_min_confidence_env(monkeypatch):
+    monkeypatch.setenv(CONFIDENCE_ENV, '0.8')
+    assert min_confidence() == 0.8
+    monkeypatch.setenv(CONFIDENCE_ENV, '7')
+    assert min_confidence() == 1.0
+    monkeypatch.setenv(CONFIDENCE_ENV, 'high')
+    assert min_confidence() == DEFAULT_MIN_CONFIDENCE
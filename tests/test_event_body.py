@@ -0,0 +1,60 @@
+"""EventBodyBuilder: Calendar API request bodies."""
+
+from datetime import datetime, timedelta
+
+from calendar_to_google.bench import _legacy_event_body
+from calendar_to_google.date_parser import ParsedEvent
+from calendar_to_google.event_body import EventBodyBuilder
+
+START = datetime(2026, 12, 25, 18, 30)
+
+
+def test_timed_event_defaults_to_one_hour():
+    body = EventBodyBuilder().build(ParsedEvent(title='忘年会', start_date=START, all_day=False))
+    assert body == {
+        'summary': '忘年会',
+        'start': {'dateTime': '2026-12-25T18:30:00', 'timeZone': 'Asia/Tokyo'},
+        'end': {'dateTime': '2026-12-25T19:30:00', 'timeZone': 'Asia/Tokyo'},
+    }
+
+
+def test_all_day_event_with_description_and_recurrence():
+    event = ParsedEvent(title='定例', start_date=datetime(2026, 11, 2), description='毎週の定例',
+                        recurrence='RRULE:FREQ=WEEKLY;BYDAY=MO')
+    body = EventBodyBuilder().build(event)
+    assert body['start'] == {'date': '2026-11-02', 'timeZone': 'Asia/Tokyo'}
+    assert body['end'] == {'date': '2026-11-03', 'timeZone': 'Asia/Tokyo'}
+    assert body['description'] == '毎週の定例'
+    assert body['recurrence'] == ['RRULE:FREQ=WEEKLY;BYDAY=MO']
+
+
+def test_all_day_end_is_exclusive():
+    event = ParsedEvent(title='Holiday', start_date=datetime(2026, 12, 24), end_date=datetime(2026, 12, 25))
+    body = EventBodyBuilder().build(event)
+    assert (body['start']['date'], body['end']['date']) == ('2026-12-24', '2026-12-26')
+
+
+def test_defaults_are_shared_but_not_aliased():
+    builder = EventBodyBuilder(timezone='UTC', defaults={'colorId': '5'}, default_duration=timedelta(minutes=30))
+    first, second = builder.build_many([
+        ParsedEvent(title='a', start_date=START, all_day=False),
+        ParsedEvent(title='b', start_date=START, all_day=False),
+    ])
+    assert first['colorId'] == second['colorId'] == '5'
+    assert first['end'] == {'dateTime': '2026-12-25T19:00:00', 'timeZone': 'UTC'}
+    first['colorId'] = '1'
+    assert builder.defaults == {'colorId': '5'}
+
+
+def test_matches_the_previous_per_event_body():
+    events = [
+        ParsedEvent(title=f'予定 {i}', start_date=START + timedelta(hours=i // 3),
+                    end_date=START + timedelta(hours=i // 3, minutes=30) if i % 4 == 1 else None,
+                    all_day=i % 3 == 0, description='Imported' if i % 2 else '',
+                    recurrence='RRULE:FREQ=WEEKLY' if i % 5 == 0 else None)
+        for i in range(60)
+    ]
+    builder = EventBodyBuilder()
+    assert list(builder.build_many(events)) == [_legacy_event_body(e) for e in events]
+    # 2回目はメモ化した日付文字列を使う
+    assert list(builder.build_many(events)) == [_legacy_event_body(e) for e in events]
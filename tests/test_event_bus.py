@@ -0,0 +1,137 @@
+"""EventBus: tick scheduling, ordering and modal callbacks against a fake Tk root."""
+
+import threading
+
+from calendar_to_google.event_bus import EventBus
+
+
+class FakeRoot:
+    """Minimal stand-in for tk.Tk: after() queues callbacks, run_once() runs the oldest."""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, fn, *args):
+        self.pending.append((fn, args))
+
+    def run_once(self) -> bool:
+        if not self.pending:
+            return False
+        fn, args = self.pending.pop(0)
+        fn(*args)
+        return True
+
+    def ticks_pending(self, bus) -> int:
+        return sum(1 for fn, _ in self.pending if fn == bus._tick)
+
+
+def make_bus(**kwargs):
+    bus = EventBus(**kwargs)
+    root = FakeRoot()
+    bus.attach(root)
+    return bus, root
+
+
+def test_posts_run_in_order_within_max_per_tick():
+    bus, root = make_bus(max_per_tick=100)
+    ran = []
+    for i in range(1000):
+        bus.post(ran.append, i)
+
+    ticks = 0
+    while len(ran) < 1000 and ticks < 50:
+        assert root.run_once()
+        ticks += 1
+
+    assert ran == list(range(1000))
+    assert ticks == 10
+    bus.shutdown()
+
+
+def test_posts_from_threads_keep_per_thread_order():
+    bus, root = make_bus()
+    ran = []
+
+    def worker(name):
+        for i in range(2000):
+            bus.post(ran.append, (name, i))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    while len(ran) < 8000:
+        assert root.run_once()
+
+    for name in range(4):
+        assert [i for n, i in ran if n == name] == list(range(2000))
+    bus.shutdown()
+
+
+def test_post_latest_coalesces_by_key():
+    bus, root = make_bus()
+    seen = []
+    for color in ('red', 'yellow', 'green'):
+        bus.post_latest('icon', seen.append, color)
+    root.run_once()
+    assert seen == ['green']
+    bus.shutdown()
+
+
+def test_queue_drains_while_modal_callback_waits():
+    bus, root = make_bus()
+    ran = []
+    done = []
+
+    def worker():
+        bus.post(ran.append, 'update')
+        bus.post(done.append, True)
+
+    def modal():
+        # wait_variable と同じく、閉じられるまでネストしたループを回す
+        ran.append('open')
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        for _ in range(10):
+            if done:
+                break
+            root.run_once()
+        ran.append('closed' if done else 'stuck')
+
+    bus.post_modal(modal)
+    while 'open' not in ran:
+        assert root.run_once()
+    assert ran == ['open', 'update', 'closed']
+    assert root.ticks_pending(bus) == 1
+    bus.shutdown()
+
+
+def test_nested_tick_does_not_interleave_callbacks():
+    bus, root = make_bus()
+    ran = []
+
+    def spins():
+        ran.append('spin start')
+        for _ in range(3):
+            root.run_once()
+        ran.append('spin end')
+
+    bus.post(spins)
+    bus.post(ran.append, 'next')
+    root.run_once()
+
+    assert ran == ['spin start', 'spin end', 'next']
+    assert root.ticks_pending(bus) == 1
+    bus.shutdown()
+
+
+def test_tick_stops_after_shutdown_but_drains_last_posts():
+    bus, root = make_bus()
+    ran = []
+    bus.post(ran.append, 'quit')
+    bus.shutdown()
+    root.run_once()
+    assert ran == ['quit']
+    assert root.ticks_pending(bus) == 0
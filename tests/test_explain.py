@@ -0,0 +1,97 @@
+"""Explain mode: per-rule traces, their aggregation and the CLI output."""
+
+import json
+
+import pytest
+
+from calendar_to_google.cli import run
+from calendar_to_google.date_parser import CONFIDENCE_ENV, DateParser
+from calendar_to_google.explain import CANDIDATE, REJECTED, SELECTED, RuleProfile, profile_rules
+
+TEXTS = ['明日 14:00 会議', '12/25 18:30 忘年会', 'next Friday 2:30pm lunch with the team',
+         'Add 3/4 cup of sugar', 'Meeting on 2024.12.25', '毎週月曜 10時 定例', 'hello world']
+
+
+@pytest.fixture(scope='module')
+def parser():
+    return DateParser()
+
+
+def outcomes(trace):
+    return [(a.stage, m.text, m.outcome) for a in trace.attempts for m in a.matches]
+
+
+@pytest.mark.parametrize('text', TEXTS)
+def test_explain_agrees_with_parse(parser, text):
+    event, trace = parser.parse(text), parser.explain(text)
+    if event is None:
+        assert trace.event is None
+    else:
+        assert (trace.event.title, trace.event.start_date, trace.event.confidence) == \
+            (event.title, event.start_date, event.confidence)
+    assert trace.seconds > 0
+    assert set(trace.stages) >= {'keyword', 'date', 'time'}
+
+
+def test_selected_matches_build_the_event(parser):
+    trace = parser.explain('12/25 18:30 忘年会')
+    assert [(a.stage, m.value) for a, m in trace.selected()] == [
+        ('date', trace.event.start_date.strftime('%Y-%m-%d')), ('time', '18:30'), ('title', '忘年会')]
+
+
+def test_overlaps_and_ranking_are_reported(parser):
+    trace = parser.explain('2026-12-25 12/26 party')
+    dates = [(m.text, m.outcome) for a in trace.attempts if a.stage == 'date' for m in a.matches]
+    assert ('2026-12-25', SELECTED) in dates
+    assert ('12/26', CANDIDATE) in dates
+    rejected = [m for a in trace.attempts for m in a.matches if m.outcome == REJECTED and a.stage == 'date']
+    assert rejected and all('overlaps' in m.reason for m in rejected)
+
+
+def test_low_confidence_reason(parser):
+    [(attempt, match)] = [(a, m) for a, m in parser.explain('Add 3/4 cup of sugar').selected() if a.stage == 'date']
+    assert match.confidence < 0.5
+    assert CONFIDENCE_ENV in match.reason
+
+
+def test_fallback_is_traced(parser):
+    trace = parser.explain('Meeting on 2024.12.25')
+    assert ('fallback', '2024.12.25', SELECTED) in outcomes(trace)
+    trace = parser.explain('2026-12-25 party')
+    assert [m.outcome for a in trace.attempts if a.stage == 'fallback' for m in a.matches] in ([], [REJECTED])
+
+
+def test_to_dict_is_json(parser):
+    data = json.loads(json.dumps(parser.explain('12/25 18:30 忘年会').to_dict(), ensure_ascii=False))
+    assert data['event']['title'] == '忘年会'
+    assert data['attempts'][0]['rule']
+    assert parser.explain('hello world').to_dict()['event'] is None
+
+
+def test_rule_profile_aggregates(parser):
+    profile = profile_rules(parser, [*TEXTS, '', '   '])
+    assert profile.texts == len(TEXTS)
+    ranked = profile.top()
+    assert [entry['seconds'] for _, entry in ranked] == sorted((e['seconds'] for _, e in ranked), reverse=True)
+    assert len(profile.top(3)) == 3
+
+    selected = sum(entry['selected'] for entry in profile.rules.values())
+    expected = sum(len(parser.explain(text).selected()) for text in TEXTS)
+    assert selected == expected
+
+    report = profile.report(3).splitlines()
+    assert report[0].startswith(f'{len(TEXTS)} texts')
+    assert len(report) == 2 + 3
+
+
+def test_rule_profile_empty():
+    profile = RuleProfile()
+    assert profile.top() == []
+    assert profile.report().startswith('0 texts')
+
+
+def test_cli_explain(capsys):
+    assert run(['parse', '--explain', '12/25', '18:30', '忘年会']) == 0
+    data = json.loads(capsys.readouterr().out)
+    assert data['event']['start'].endswith('12-25T18:30:00')
+    assert run(['parse', '--explain', 'hello']) == 1
@@ -0,0 +1,63 @@
+"""Last-resort date tokenizer: real dates are guessed, number shapes are not."""
+
+from datetime import datetime
+
+import pytest
+
+from calendar_to_google.fallback import MAX_FALLBACK_CHARS, FallbackDateTokenizer
+from calendar_to_google.locales import compile_grammar
+
+NOW = datetime(2026, 10, 19, 15, 0)
+
+
+@pytest.fixture
+def tokenizer():
+    return FallbackDateTokenizer(compile_grammar())
+
+
+@pytest.mark.parametrize('text', [
+    'Release v2.3 is out',
+    'Call me at 090-1234-5678',
+    'Server 192.168.0.1 is down',
+    'Pi is 3.14',
+    'Order #12345 shipped',
+    'Room 404',
+    'Total: 1,234 yen',
+    'Chapter 3 section 12',
+    'Version 10.15.7',
+    'Launch in Q3',
+    'Price $20.25',
+    'Up 12% from last quarter',
+    'ISBN 978-4-06-521234-5',
+])
+def test_number_shapes_are_not_dates(tokenizer, text):
+    assert tokenizer.find(text, NOW) is None
+
+
+@pytest.mark.parametrize('text, expected, matched', [
+    ('Meeting on 2024.12.25', datetime(2024, 12, 25), '2024.12.25'),
+    ('Deadline 25.12.2024', datetime(2024, 12, 25), '25.12.2024'),
+    ('Build 20241225 ready', datetime(2024, 12, 25), '20241225'),
+    ('Party on the 25th', datetime(2026, 10, 25), '25th'),
+    ('See you on the 2nd', datetime(2026, 11, 2), '2nd'),
+    ('Conference in March 2027', datetime(2027, 3, 1), 'March 2027'),
+    ('The 3rd of April', datetime(2027, 4, 3), '3rd of April'),
+    ('April the 3rd', datetime(2027, 4, 3), 'April the 3rd'),
+])
+def test_dates_are_guessed(tokenizer, text, expected, matched):
+    date, match = tokenizer.find(text, NOW)
+    assert date == expected
+    assert text[match.start:match.end] == matched
+    assert 0.5 <= match.confidence <= 1.0
+
+
+def test_only_the_head_of_long_text_is_scanned(tokenizer):
+    text = 'x ' * MAX_FALLBACK_CHARS + 'Meeting on 2024.12.25'
+    assert tokenizer.find(text, NOW) is None
+
+
+def test_scans_are_cached_independently_of_today(tokenizer):
+    assert tokenizer.find('Party on the 25th', NOW)[0] == datetime(2026, 10, 25)
+    assert tokenizer.find('Party on the 25th', datetime(2026, 10, 26))[0] == datetime(2026, 11, 25)
+    info = tokenizer.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
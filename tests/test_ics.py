@@ -0,0 +1,93 @@
+"""iCalendar writer/reader: round trips and Outlook (Windows TZID) files."""
+
+import io
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from calendar_to_google.date_parser import ParsedEvent
+from calendar_to_google.ics import iter_ics_events, read_ics, write_ics
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+def event(title, start, **kwargs):
+    return ParsedEvent(title=title, start_date=start, **kwargs)
+
+
+EVENTS = [
+    event('定例ミーティング', datetime(2026, 11, 12, 10, 0), end_date=datetime(2026, 11, 12, 11, 30),
+          all_day=False, description='会議室A\n資料; 前日まで, 共有'),
+    event('Holiday', datetime(2026, 12, 24), end_date=datetime(2026, 12, 25)),
+    event('朝会', datetime(2026, 11, 2, 9, 0), end_date=datetime(2026, 11, 2, 9, 15), all_day=False,
+          recurrence='RRULE:FREQ=WEEKLY;BYDAY=MO'),
+    event('長いタイトル' * 20, datetime(2026, 1, 5, 18, 0), end_date=datetime(2026, 1, 5, 19, 0), all_day=False),
+]
+
+
+def round_trip(events, tz):
+    out = io.StringIO()
+    assert write_ics(events, out, tz) == len(events)
+    text = out.getvalue()
+    return text, list(iter_ics_events(text.splitlines(keepends=True), tz))
+
+
+def fields(e):
+    return (e.title, e.start_date, e.end_date, e.all_day, e.description, e.recurrence)
+
+
+@pytest.mark.parametrize('tz', ['Asia/Tokyo', 'America/New_York', 'Europe/London'])
+def test_round_trip(tz):
+    _, events = round_trip(EVENTS, tz)
+    assert [fields(e) for e in events] == [fields(e) for e in EVENTS]
+
+
+def test_fixed_offset_zone_writes_vtimezone():
+    text, _ = round_trip(EVENTS[:1], 'Asia/Tokyo')
+    assert 'BEGIN:VTIMEZONE\r\nTZID:Asia/Tokyo\r\n' in text
+    assert 'TZOFFSETTO:+0900' in text
+    assert 'DTSTART;TZID=Asia/Tokyo:20261112T100000' in text
+    assert text.index('BEGIN:VTIMEZONE') < text.index('BEGIN:VEVENT')
+
+
+def test_dst_zone_writes_utc():
+    text, _ = round_trip(EVENTS[:1], 'America/New_York')
+    assert 'VTIMEZONE' not in text
+    assert 'DTSTART:20261112T150000Z' in text
+
+
+def test_lines_fit_75_octets():
+    text, _ = round_trip(EVENTS, 'Asia/Tokyo')
+    assert all(len(line.encode('utf-8')) <= 75 for line in text.split('\r\n'))
+
+
+@pytest.fixture(scope='module')
+def outlook():
+    return {e.title: e for e in read_ics(FIXTURES / 'outlook.ics')}
+
+
+def test_outlook_windows_tzid(outlook):
+    e = outlook['定例ミーティング']
+    assert (e.start_date, e.end_date, e.all_day) == (datetime(2026, 11, 12, 10, 0),
+                                                     datetime(2026, 11, 12, 11, 0), False)
+    assert e.description == '会議室A\n資料は前日までに共有'
+
+
+def test_outlook_vtimezone_rules(outlook):
+    # Pacific Standard Time の VTIMEZONE: 夏時間 -7h、冬時間 -8h
+    assert outlook['Design review (PDT)'].start_date == datetime(2026, 7, 16, 1, 0)
+    assert outlook['Design review (PST)'].start_date == datetime(2026, 12, 11, 2, 0)
+
+
+def test_outlook_windows_name_without_vtimezone(outlook):
+    assert outlook['Berlin call'].start_date == datetime(2026, 6, 1, 21, 0)
+
+
+def test_unknown_tzid_reads_as_local_time(outlook):
+    assert outlook['Unknown zone'].start_date == datetime(2026, 6, 1, 14, 0)
+
+
+def test_outlook_all_day(outlook):
+    e = outlook['Holiday']
+    assert (e.start_date, e.end_date, e.all_day) == (datetime(2026, 12, 24), datetime(2026, 12, 25), True)
@@ -0,0 +1,115 @@
+"""GoogleCalendarClient inserts against the local fake Calendar API."""
+
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from calendar_to_google.date_parser import ParsedEvent
+from calendar_to_google.fake_calendar import PRIMARY_ID, FakeCalendarServer
+from calendar_to_google.google_calendar import BATCH_SIZE, GoogleCalendarClient
+from calendar_to_google.ics import read_ics
+
+START = datetime(2026, 1, 5, 9, 0)
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+def make_events(count, prefix='予定'):
+    return [ParsedEvent(title=f'{prefix} {i}', start_date=START + timedelta(hours=i), all_day=i % 5 == 0)
+            for i in range(count)]
+
+
+@pytest.fixture
+def server():
+    with FakeCalendarServer(latency=0.005, seed=1) as server:
+        yield server
+
+
+def instrument(client):
+    """Track how many HTTP requests are in flight on the client's connection at once."""
+    http = client._get_service()._http
+    request = http.request
+    state = {'active': 0, 'peak': 0, 'requests': 0}
+    lock = threading.Lock()
+
+    def tracked(*args, **kwargs):
+        with lock:
+            state['active'] += 1
+            state['requests'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+        try:
+            return request(*args, **kwargs)
+        finally:
+            with lock:
+                state['active'] -= 1
+
+    http.request = tracked
+    return state
+
+
+def test_add_event(server):
+    client = GoogleCalendarClient(endpoint=server.url)
+    url = client.add_event(make_events(1)[0])
+    assert url
+    [stored] = server.events[PRIMARY_ID]
+    assert stored['summary'] == '予定 0'
+
+
+def test_add_events_batches_in_order(server):
+    client = GoogleCalendarClient(endpoint=server.url)
+    events = make_events(BATCH_SIZE + 7)
+    state = instrument(client)
+
+    urls = client.add_events(events)
+
+    assert all(urls)
+    assert len(set(urls)) == len(events)
+    assert state['requests'] == 2
+    assert sorted(e['summary'] for e in server.events[PRIMARY_ID]) == sorted(e.title for e in events)
+
+
+def test_concurrent_add_event_and_add_events_do_not_overlap(server):
+    client = GoogleCalendarClient(endpoint=server.url)
+    state = instrument(client)
+    results = []
+
+    def singles(name):
+        results.extend(client.add_event(event) for event in make_events(8, name))
+
+    def batch(name):
+        results.extend(client.add_events(make_events(30, name)))
+
+    threads = [threading.Thread(target=singles, args=(f's{i}',)) for i in range(3)]
+    threads += [threading.Thread(target=batch, args=(f'b{i}',)) for i in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert state['peak'] == 1
+    assert len(results) == 3 * 8 + 2 * 30
+    assert all(results)
+    assert len(server.events[PRIMARY_ID]) == len(results)
+
+
+def test_failed_batch_parts_return_none():
+    with FakeCalendarServer(error_rate=0.5, seed=3) as server:
+        client = GoogleCalendarClient(endpoint=server.url)
+        urls = client.add_events(make_events(40))
+    assert 0 < sum(1 for url in urls if url) < 40
+    assert sum(1 for url in urls if url) == len(server.events[PRIMARY_ID])
+
+
+def test_ics_import_keeps_all_day_span(server):
+    client = GoogleCalendarClient(endpoint=server.url)
+    events = list(read_ics(FIXTURES / 'outlook.ics'))
+
+    assert all(client.add_events(events))
+
+    stored = {e['summary']: e for e in server.events[PRIMARY_ID]}
+    # DTEND;VALUE=DATE:20261226 は排他的: 24日と25日の2日間
+    assert stored['Holiday']['start']['date'] == '2026-12-24'
+    assert stored['Holiday']['end']['date'] == '2026-12-26'
+    assert stored['定例ミーティング']['start']['dateTime'] == '2026-11-12T10:00:00'
+    assert stored['定例ミーティング']['end']['dateTime'] == '2026-11-12T11:00:00'
@@ -0,0 +1,19 @@
+"""Launch scripts must not start the app when imported (spawned pool workers re-run them)."""
+
+import ast
+from pathlib import Path
+
+import pytest
+
+PACKAGE = Path(__file__).resolve().parent.parent / 'calendar_to_google'
+
+
+@pytest.mark.parametrize('name', ['launcher.py', 'launcher.pyw', '__main__.py', 'tray_app.py'])
+def test_main_only_runs_under_main_guard(name):
+    tree = ast.parse((PACKAGE / name).read_text(encoding='utf-8'))
+    for node in tree.body:
+        if isinstance(node, ast.If) and "__name__" in ast.unparse(node.test):
+            continue
+        for child in ast.walk(node):
+            if isinstance(child, ast.Call) and ast.unparse(child.func) == 'main':
+                pytest.fail(f"{name} calls main() outside the __main__ guard (line {child.lineno})")
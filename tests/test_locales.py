@@ -0,0 +1,82 @@
+"""Locale grammars and the merged keyword automaton."""
+
+from datetime import datetime
+
+import pytest
+
+from calendar_to_google.date_parser import DateParser
+from calendar_to_google.locales import (KeywordHit, KeywordIndex, compile_grammar, fold_text,
+                                        registered_locales, trie_regex)
+
+NOW = datetime(2026, 10, 19, 12, 0)  # Monday
+
+
+def test_builtin_locales_registered():
+    assert registered_locales()[:4] == ['ja', 'en', 'zh', 'ko']
+
+
+def test_compiled_grammar_is_cached_per_locale_set():
+    assert compile_grammar(['ja']) is compile_grammar(['ja'])
+    assert compile_grammar(['ja']) is not compile_grammar(['ja', 'en'])
+
+
+def test_trie_regex_prefers_longest_token():
+    assert trie_regex(['明日', '明後日', '昨日']) == '(?:明(?:後日|日)|昨日)'
+
+
+def test_keyword_index_is_leftmost_longest():
+    hits = compile_grammar().find_keywords('一昨日と明後日、明日')
+    assert [(h.token, h.value) for h in hits] == [('一昨日', (-2,)), ('明後日', (2,)), ('明日', (1,))]
+
+
+def test_keyword_index_respects_ascii_word_boundaries():
+    hits = compile_grammar().find_keywords('Mondays are busy, see you next  Monday')
+    assert [(h.token, h.kind) for h in hits] == [('next monday', 'weekday')]
+
+
+def test_keyword_index_matches_many_keywords_in_one_pass():
+    index = KeywordIndex({f'kw{i:03d}x': ('relative', (i,)) for i in range(300)})
+    text = ' '.join(f'kw{i:03d}x' for i in range(0, 300, 7))
+    assert [h.value[0] for h in index.find(text)] == list(range(0, 300, 7))
+
+
+def test_fold_text_keeps_length():
+    text = 'İstanbul ÄPRIL Tomorrow'
+    assert len(fold_text(text)) == len(text)
+    assert fold_text('Next MONDAY') == 'next monday'
+
+
+def test_resolve_keywords():
+    grammar = compile_grammar()
+    assert grammar.resolve_keyword(KeywordHit('明日', 0, 2, 'relative', (1,)), NOW) == datetime(2026, 10, 20)
+    # 曜日だけなら次のその曜日（今日は含めない）、来週なら翌週の同じ曜日
+    assert grammar.resolve_keyword(KeywordHit('月曜', 0, 2, 'weekday', (0, None)), NOW) == datetime(2026, 10, 26)
+    assert grammar.resolve_keyword(KeywordHit('来週水曜', 0, 4, 'weekday', (2, 1)), NOW) == datetime(2026, 10, 28)
+
+
+def test_candidate_lines_keep_only_lines_with_digits_or_keywords():
+    text = 'hello\n12/25 会議\nnothing here\n明日 ランチ\nsee you tomorrow\ntomorrows'
+    assert compile_grammar().candidate_lines(text) == ['12/25 会議', '明日 ランチ', 'see you tomorrow']
+
+
+def test_find_dates_in_text_order():
+    found = compile_grammar().find_dates('2026年12月25日 と Dec 31 と 1/2', NOW)
+    assert [d for _, _, d in found] == [datetime(2026, 12, 25), datetime(2026, 12, 31), datetime(2027, 1, 2)]
+
+
+@pytest.mark.parametrize('locale, text, weekday, hour, minute, title', [
+    ('ja', '来週の金曜日 午後3時 打ち合わせ', 4, 15, 0, '打ち合わせ'),
+    ('en', 'next Friday 2:30pm lunch with the team', 4, 14, 30, 'lunch with the team'),
+    ('zh', '下周三 下午3点 开会', 2, 15, 0, '开会'),
+    ('ko', '다음주 금요일 오후 3시 회의', 4, 15, 0, '회의'),
+])
+def test_each_locale_parses_on_its_own(locale, text, weekday, hour, minute, title):
+    event = DateParser(locales=[locale], clock=lambda: NOW).parse(text)
+    assert event.title == title
+    assert (event.start_date.weekday(), event.start_date.hour, event.start_date.minute) == (weekday, hour, minute)
+    assert 0 < (event.start_date - NOW).days <= 14
+
+
+@pytest.mark.parametrize('text', ['下周三 下午3点 开会', '다음주 금요일 오후 3시 회의'])
+def test_locales_can_be_left_out(text):
+    assert DateParser(locales=['ja']).parse(text) is None
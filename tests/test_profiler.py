@@ -0,0 +1,56 @@
+import threading
+import time
+
+from calendar_to_google.date_parser import DateParser
+from calendar_to_google.profiler import SamplingProfiler, _frame_label
+
+
+def test_sampler_captures_parse_frames():
+    parser = DateParser()
+    profiler = SamplingProfiler(interval=0.001)
+    stop = threading.Event()
+
+    def parse_loop():
+        while not stop.is_set():
+            parser.parse("来週の金曜日 午後3時 打ち合わせ")
+
+    worker = threading.Thread(target=parse_loop, name="parse-loop")
+    worker.start()
+    try:
+        profiler.start(duration=1.0)
+        time.sleep(0.3)
+        # stop() がサンプラースレッドを join してから読む
+        profiler.stop()
+    finally:
+        stop.set()
+        worker.join()
+
+    parse_stacks = [s for s in profiler.snapshot() if 'parse (date_parser.py:' in s]
+    assert parse_stacks
+    assert all(s.startswith('parse-loop;') for s in parse_stacks)
+    assert profiler.sample_count > 0
+
+
+def test_frame_label_uses_code_only():
+    class Owner:
+        def method(self):
+            import sys
+            return _frame_label(sys._getframe())
+
+    label = Owner().method()
+    assert label.startswith(('method (', 'test_frame_label_uses_code_only.<locals>.Owner.method ('))
+    assert 'test_profiler.py:' in label
+
+
+def test_snapshot_is_safe_while_sampling():
+    profiler = SamplingProfiler(interval=0.001)
+    profiler.start(duration=1.0)
+    try:
+        for _ in range(50):
+            # 反復中にサンプラーが更新しても RuntimeError にならない
+            assert sum(profiler.snapshot().values()) >= 0
+            time.sleep(0.002)
+    finally:
+        profiler.stop()
+    assert not profiler.running
+    assert sum(profiler.snapshot().values()) > 0
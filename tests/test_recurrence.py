@@ -0,0 +1,77 @@
+"""Recurrence phrases and how DateParser anchors them."""
+
+from datetime import datetime
+
+import pytest
+
+from calendar_to_google.date_parser import DateParser
+from calendar_to_google.recurrence import detect_recurrence
+
+MONDAY = datetime(2026, 10, 19, 12, 0)
+WEDNESDAY = datetime(2026, 10, 21, 12, 0)
+
+
+def frozen(now: datetime) -> DateParser:
+    return DateParser(clock=lambda: now)
+
+
+@pytest.fixture(scope='module')
+def parser():
+    return frozen(MONDAY)
+
+
+@pytest.mark.parametrize('text, rule, needs_date', [
+    ('毎週月曜 10時 定例', 'FREQ=WEEKLY;BYDAY=MO', False),
+    ('every Friday 5pm drinks', 'FREQ=WEEKLY;BYDAY=FR', False),
+    ('every day 9:30 standup', 'FREQ=DAILY', False),
+    ('毎日 9時 朝会', 'FREQ=DAILY', False),
+    ('weekly report at 3pm', 'FREQ=WEEKLY', True),
+    ('Daily standup 9:30', 'FREQ=DAILY', True),
+    ('monthly budget review', 'FREQ=MONTHLY', True),
+])
+def test_detect_recurrence(text, rule, needs_date):
+    recurrence = detect_recurrence(text)
+    assert recurrence.rule == rule
+    assert recurrence.needs_date is needs_date
+
+
+@pytest.mark.parametrize('text', ['weekly report at 3pm', 'Daily standup 9:30', 'weekdays 9am gym'])
+def test_bare_frequency_word_without_date_is_not_an_event(parser, text):
+    assert parser.parse(text) is None
+
+
+def test_bare_frequency_word_with_date_recurs(parser):
+    event = parser.parse('daily standup 12/25 9:30')
+    assert event.start_date == datetime(2026, 12, 25, 9, 30)
+    assert event.recurrence == 'RRULE:FREQ=DAILY'
+
+
+@pytest.mark.parametrize('text, start, rule', [
+    ('every day 9:30 standup', datetime(2026, 10, 19, 9, 30), 'RRULE:FREQ=DAILY'),
+    ('毎日 9時 朝会', datetime(2026, 10, 19, 9, 0), 'RRULE:FREQ=DAILY'),
+    ('毎週水曜 15時 定例', datetime(2026, 10, 21, 15, 0), 'RRULE:FREQ=WEEKLY;BYDAY=WE'),
+    ('every Friday 5pm drinks', datetime(2026, 10, 23, 17, 0), 'RRULE:FREQ=WEEKLY;BYDAY=FR'),
+    ('毎月25日 給料日', datetime(2026, 10, 25), 'RRULE:FREQ=MONTHLY;BYMONTHDAY=25'),
+])
+def test_explicit_recurrence_anchors_to_today(parser, text, start, rule):
+    event = parser.parse(text)
+    assert event.start_date == start
+    assert event.recurrence == rule
+
+
+@pytest.mark.parametrize('text, start', [
+    ('毎週水曜 15時 定例', datetime(2026, 10, 21, 15, 0)),
+    ('every Wednesday 3pm sync', datetime(2026, 10, 21, 15, 0)),
+    ('毎週水曜日の定例', datetime(2026, 10, 21)),
+    ('every Thursday 9am', datetime(2026, 10, 22, 9, 0)),
+])
+def test_weekly_rule_on_its_own_weekday_starts_today(text, start):
+    event = frozen(WEDNESDAY).parse(text)
+    assert event.start_date == start
+    assert event.recurrence.startswith('RRULE:FREQ=WEEKLY')
+
+
+def test_plain_weekday_on_same_day_is_next_week():
+    event = frozen(WEDNESDAY).parse('水曜 15時 定例')
+    assert event.start_date == datetime(2026, 10, 28, 15, 0)
+    assert event.recurrence is None
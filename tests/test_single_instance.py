@@ -0,0 +1,103 @@
+"""Single-instance lock and IPC: exclusion, stale-lock recovery and command delivery."""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from calendar_to_google.single_instance import InstanceLock, send_command
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 別プロセスでロックを取得して待つ（強制終了してロックを放置させる）
+HOLDER = '''
+import sys, time
+from pathlib import Path
+from calendar_to_google.single_instance import InstanceLock
+lock = InstanceLock(Path(sys.argv[1]), Path(sys.argv[2]))
+print('locked' if lock.acquire() else 'busy', flush=True)
+lock.serve(lambda message: {'pid': 'holder'})
+time.sleep(60)
+'''
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return tmp_path / 'instance.lock', tmp_path / 'instance.json'
+
+
+@pytest.fixture
+def lock(paths):
+    lock = InstanceLock(*paths)
+    yield lock
+    lock.close()
+
+
+def start_holder(paths):
+    proc = subprocess.Popen([sys.executable, '-c', HOLDER, *map(str, paths)], cwd=ROOT,
+                            stdout=subprocess.PIPE, text=True)
+    assert proc.stdout.readline().strip() == 'locked'
+    return proc
+
+
+def test_second_acquire_fails_while_held(paths, lock):
+    assert lock.acquire()
+    second = InstanceLock(*paths)
+    assert not second.acquire()
+    lock.close()
+    assert second.acquire()
+    second.close()
+
+
+def test_info_file_is_private(paths, lock):
+    assert lock.acquire()
+    if sys.platform != 'win32':
+        assert paths[1].stat().st_mode & 0o777 == 0o600
+
+
+def test_lock_held_by_other_process(paths, lock):
+    holder = start_holder(paths)
+    try:
+        assert not lock.acquire()
+        assert send_command({'command': 'show'}, paths[1], timeout=2.0) == {'pid': 'holder'}
+    finally:
+        holder.kill()
+        holder.wait()
+
+
+def test_stale_lock_is_reclaimed_after_holder_dies(paths, lock):
+    holder = start_holder(paths)
+    holder.kill()
+    holder.wait()
+
+    # 死んだプロセスの instance.json とソケットが残っていても取得できる
+    assert paths[1].exists()
+    assert lock.acquire()
+    lock.serve(lambda message: {'echo': message['command']})
+    assert send_command({'command': 'show'}, paths[1], timeout=2.0) == {'echo': 'show'}
+
+
+def test_send_command_reaches_live_listener(paths, lock):
+    received = []
+    assert lock.acquire()
+    lock.serve(lambda message: received.append(message) or {'ok': True, 'n': len(received)})
+
+    assert send_command({'command': 'import', 'path': '/tmp/a.ics'}, paths[1]) == {'ok': True, 'n': 1}
+    assert send_command({'command': 'show'}, paths[1]) == {'ok': True, 'n': 2}
+    assert [m['command'] for m in received] == ['import', 'show']
+
+
+def test_send_command_times_out_against_dead_instance(paths):
+    holder = start_holder(paths)
+    holder.kill()
+    holder.wait()
+
+    started = time.monotonic()
+    assert send_command({'command': 'show'}, paths[1], timeout=0.5) is None
+    assert time.monotonic() - started < 3.0
+
+
+def test_send_command_without_instance(paths):
+    assert send_command({'command': 'show'}, paths[1], timeout=0.2) is None
@@ -0,0 +1,57 @@
+"""mmap line streaming and per-line parsing of large files."""
+
+import pytest
+
+from calendar_to_google.date_parser import DateParser
+from calendar_to_google.streaming import iter_blocks, iter_lines, parse_file
+
+LINES = ['明日 14:00 会議', 'ただのメモ', '12/25 忘年会の会場を予約する', 'nothing to see', 'Dec 25 holiday party at the office']
+
+
+@pytest.fixture(scope='module')
+def parser():
+    return DateParser()
+
+
+def write(path, text, encoding='utf-8'):
+    path.write_bytes(text.encode(encoding))
+    return path
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 64, 1 << 20])
+def test_iter_lines_across_chunk_edges(tmp_path, chunk_size):
+    # 3バイト文字がチャンク境界で分断されても失われない
+    path = write(tmp_path / 'log.txt', '\n'.join(LINES * 3) + '\n')
+    assert list(iter_lines(path, chunk_size=chunk_size)) == LINES * 3
+
+
+def test_blocks_end_on_line_boundaries(tmp_path):
+    path = write(tmp_path / 'log.txt', '\n'.join(LINES * 50))
+    blocks = list(iter_blocks(path, chunk_size=100))
+    assert len(blocks) > 1
+    assert all(block.endswith('\n') for block in blocks[:-1])
+    assert ''.join(blocks) == '\n'.join(LINES * 50)
+
+
+def test_long_lines_are_split_at_whitespace(tmp_path):
+    path = write(tmp_path / 'dump.txt', ' '.join(['word'] * 100))
+    blocks = list(iter_blocks(path, chunk_size=64, max_line=50))
+    assert all(len(block) <= 51 for block in blocks)
+    assert ''.join(block.rstrip('\n') for block in blocks).split() == ['word'] * 100
+
+
+def test_empty_file(tmp_path):
+    assert list(iter_lines(write(tmp_path / 'empty.txt', ''))) == []
+
+
+def test_other_encodings(tmp_path):
+    path = write(tmp_path / 'sjis.txt', '\n'.join(LINES), encoding='shift_jis')
+    assert list(iter_lines(path, encoding='shift_jis', chunk_size=5)) == LINES
+
+
+def test_parse_file_matches_parse_lines(tmp_path, parser):
+    path = write(tmp_path / 'log.txt', '\n'.join(LINES * 20))
+    expected = [(e.title, e.start_date) for e in parser.parse_lines(LINES * 20)]
+    streamed = [(e.title, e.start_date) for e in parse_file(path, parser, chunk_size=50)]
+    assert streamed == expected
+    assert len(streamed) == 3 * 20
@@ -0,0 +1,48 @@
+"""Atomic config writes and the warm-state snapshot lifecycle."""
+
+import threading
+import time
+
+from calendar_to_google.config import write_atomic
+from calendar_to_google.warm_state import WarmState
+
+
+def test_concurrent_write_atomic_leaves_one_complete_file(tmp_path):
+    path = tmp_path / 'state.json'
+    payloads = [str(i) * 100_000 for i in range(8)]
+    errors = []
+
+    def writer(data):
+        try:
+            for _ in range(10):
+                write_atomic(path, data)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(data,)) for data in payloads]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert path.read_text(encoding='utf-8') in payloads
+    assert [p.name for p in tmp_path.iterdir()] == ['state.json']
+
+
+def test_stop_waits_for_periodic_save_before_final_save(tmp_path):
+    state = WarmState(tmp_path / 'warm_state.json')
+    saving = threading.Event()
+
+    def slow_collect():
+        # 定期保存の最中に stop() が呼ばれる状況を作る
+        saving.set()
+        time.sleep(0.2)
+        return {'icons': 'old'}
+
+    state.start(slow_collect, interval=0.01)
+    assert saving.wait(5)
+    state.stop(lambda: {'icons': 'new'})
+
+    assert not state._thread.is_alive()
+    assert WarmState(state.path).get('icons') == 'new'